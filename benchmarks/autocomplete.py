@@ -0,0 +1,88 @@
+"""
+Times autocomplete lookups: the old linear `current in key` scan against
+the trie + trigram SearchIndex, over quest ids and player names, with the
+kind of partial / mistyped input people actually send while typing.
+
+    python -m benchmarks.autocomplete --entries 10000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from systems.autocomplete import SearchIndex
+
+WORDS = [
+    "goblin", "forest", "ruins", "tavern", "lost", "crate", "moon", "herb", "river",
+    "guard", "shadow", "fox", "lantern", "bridge", "tower", "ember", "marsh", "relic",
+]
+
+
+def make_entries(n: int, rng: random.Random) -> list[tuple[str, str]]:
+    entries = []
+    for i in range(n):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(2, 4))]
+        qid = "_".join(words) + f"_{i}"
+        entries.append((qid, f"{qid} — {' '.join(w.title() for w in words)}"))
+    return entries
+
+
+def make_queries(entries, n: int, rng: random.Random) -> list[str]:
+    queries = []
+    for _ in range(n):
+        label = rng.choice(entries)[1].split(" — ")[1].lower()
+        roll = rng.random()
+        if roll < 0.5:
+            queries.append(label[:rng.randint(1, len(label))])       # typing a prefix
+        elif roll < 0.8:
+            word = rng.choice(label.split())
+            queries.append(word[:rng.randint(2, len(word))])         # a later word
+        else:
+            i = rng.randrange(len(label))
+            queries.append(label[:i] + label[i + 1:])                # a dropped letter
+    return queries
+
+
+def linear(entries, current: str):
+    out = []
+    for key, label in entries:
+        if current.lower() in key.lower():
+            out.append((key, label))
+    return out[:25]
+
+
+def timed(fn, queries) -> list[float]:
+    samples = []
+    for q in queries:
+        t0 = time.perf_counter()
+        fn(q)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Autocomplete lookup latency")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    entries = make_entries(args.entries, rng)
+    queries = make_queries(entries, args.queries, rng)
+
+    t0 = time.perf_counter()
+    index = SearchIndex(entries)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"{args.entries} entries, {args.queries} queries — index build {build_ms:.0f}ms\n")
+    print(f"{'lookup':<8} {'p50':>8} {'p99':>8} {'max':>8}   empty results")
+    for name, fn in (("linear", lambda q: linear(entries, q)), ("index", index.search)):
+        samples = timed(fn, queries)
+        empty = sum(1 for q in queries if not fn(q))
+        q99 = statistics.quantiles(samples, n=100)[98]
+        print(f"{name:<8} {statistics.median(samples):>6.2f}ms {q99:>6.2f}ms {max(samples):>6.2f}ms   {empty}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Minimal in-process stand-ins for the discord.py objects the bot touches.
+
+They implement just enough of the Interaction / Member / Message / Channel
+surface for command handlers and views to run offline — no gateway,
+no REST, no token. Every outbound call is counted on the owning FakeClient.
+"""
+import asyncio
+import itertools
+import random
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+_snowflakes = itertools.count(10_000_000_000)
+
+
+def next_snowflake() -> int:
+    return next(_snowflakes)
+
+
+class FakeRole:
+    def __init__(self, role_id: int, name: str = "role"):
+        self.id = role_id
+        self.name = name
+        self.members: list = []
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+
+class FakeMember:
+    def __init__(self, user_id: int, guild=None, roles=None, display_name: str | None = None,
+                 joined_at: datetime | None = None, admin: bool = False):
+        self.id = user_id
+        self.guild = guild
+        self.roles = list(roles or [])
+        self.display_name = display_name or f"Member{user_id}"
+        self.name = self.display_name
+        self.bot = False
+        self.joined_at = joined_at or datetime(2025, 6, 1, tzinfo=timezone.utc)
+        self.guild_permissions = SimpleNamespace(manage_guild=admin)
+        self.display_avatar = SimpleNamespace(url=f"https://cdn.example/avatars/{user_id}.png")
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    async def add_roles(self, *roles, reason=None):
+        client = self.guild.client if self.guild else None
+        if client:
+            await client.call("add_roles")
+        for role in roles:
+            if role not in self.roles:
+                self.roles.append(role)
+
+    async def remove_roles(self, *roles, reason=None):
+        client = self.guild.client if self.guild else None
+        if client:
+            await client.call("remove_roles")
+        self.roles = [r for r in self.roles if r not in roles]
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, embed=None, embeds=None, view=None, message_id: int | None = None):
+        self.id = message_id or next_snowflake()
+        self.channel = channel
+        self.guild = getattr(channel, "guild", None)
+        self.content = content
+        self.embeds = list(embeds or ([embed] if embed else []))
+        self.view = view
+        self.role_mentions: list = []
+        self.author = SimpleNamespace(bot=False)
+        self.deleted = False
+
+    async def edit(self, content=None, embed=None, embeds=None, view=None, **kwargs):
+        await self.channel.client.call("message.edit")
+        if self.deleted:
+            raise self.channel.client.not_found()
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embeds = [embed]
+        if embeds is not None:
+            self.embeds = list(embeds)
+        if view is not None:
+            self.view = view
+        return self
+
+    async def delete(self, delay=None):
+        await self.channel.client.call("message.delete")
+        self.deleted = True
+        self.channel.messages.pop(self.id, None)
+
+
+class _Typing:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeWebhook:
+    def __init__(self, channel, name: str):
+        self.id = next_snowflake()
+        self.channel = channel
+        self.name = name
+
+    async def send(self, content=None, **kwargs):
+        await self.channel.client.call("webhook.send")
+        return FakeMessage(self.channel, content=content)
+
+
+class FakeChannel:
+    def __init__(self, client, channel_id: int, guild=None):
+        self.client = client
+        self.id = channel_id
+        self.guild = guild
+        self.messages: dict[int, FakeMessage] = {}
+        self._webhooks: list[FakeWebhook] = []
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    async def send(self, content=None, *, embed=None, embeds=None, view=None, file=None, files=None, **kwargs):
+        await self.client.call("channel.send")
+        msg = FakeMessage(self, content=content, embed=embed, embeds=embeds, view=view)
+        self.messages[msg.id] = msg
+        return msg
+
+    async def fetch_message(self, message_id: int):
+        await self.client.call("fetch_message")
+        msg = self.messages.get(message_id)
+        if msg is None:
+            raise self.client.not_found()
+        return msg
+
+    def get_partial_message(self, message_id: int):
+        msg = self.messages.get(message_id)
+        if msg is None:
+            # Like a PartialMessage for a deleted message: edits 404
+            msg = FakeMessage(self, message_id=message_id)
+            msg.deleted = True
+        return msg
+
+    async def webhooks(self):
+        await self.client.call("webhooks")
+        return list(self._webhooks)
+
+    async def create_webhook(self, name: str, **kwargs):
+        await self.client.call("create_webhook")
+        hook = FakeWebhook(self, name)
+        self._webhooks.append(hook)
+        return hook
+
+    def typing(self):
+        return _Typing()
+
+
+class FakeGuild:
+    def __init__(self, client, guild_id: int):
+        self.client = client
+        self.id = guild_id
+        self.roles: dict[int, FakeRole] = {}
+        self.members: list[FakeMember] = []
+
+    def get_role(self, role_id: int):
+        return self.roles.get(role_id)
+
+    def get_channel(self, channel_id: int):
+        return self.client.get_channel(channel_id)
+
+    def get_member(self, user_id: int):
+        for m in self.members:
+            if m.id == user_id:
+                return m
+        return None
+
+    async def fetch_members(self, limit=None):
+        await self.client.call("fetch_members")
+        for member in self.members[:limit] if limit else self.members:
+            yield member
+
+
+class _Response:
+    def __init__(self, interaction):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, ephemeral: bool = False, thinking: bool = False):
+        await self._interaction.client.call("interaction.defer")
+        self._done = True
+
+    async def send_message(self, content=None, *, embed=None, embeds=None, view=None,
+                           ephemeral: bool = False, file=None, files=None, **kwargs):
+        await self._interaction.client.call("interaction.respond")
+        self._done = True
+        msg = FakeMessage(self._interaction.channel, content=content, embed=embed, embeds=embeds, view=view)
+        self._interaction.channel.messages[msg.id] = msg
+        self._interaction.sent.append(msg)
+        self._interaction._original = msg
+
+
+class _Followup:
+    def __init__(self, interaction):
+        self._interaction = interaction
+
+    async def send(self, content=None, *, embed=None, embeds=None, view=None,
+                   ephemeral: bool = False, file=None, files=None, **kwargs):
+        await self._interaction.client.call("followup.send")
+        msg = FakeMessage(self._interaction.channel, content=content, embed=embed, embeds=embeds, view=view)
+        self._interaction.sent.append(msg)
+        return msg
+
+
+class FakeInteraction:
+    def __init__(self, client, user: FakeMember, channel: FakeChannel, message: FakeMessage | None = None):
+        self.id = next_snowflake()
+        self.client = client
+        self.user = user
+        self.guild = user.guild
+        self.channel = channel
+        self.channel_id = channel.id
+        self.message = message
+        self.created_at = datetime.now(timezone.utc)
+        self.sent: list[FakeMessage] = []
+        self._original = None
+        self.response = _Response(self)
+        self.followup = _Followup(self)
+
+    async def original_response(self):
+        return self._original
+
+
+class FakeNotFound(Exception):
+    """Raised when a fake lookup misses; FakeClient.not_found prefers discord.NotFound."""
+
+
+class FakeRateLimited(Exception):
+    """Raised for injected 429s when discord.py isn't importable."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"429 Too Many Requests (retry after {retry_after}s)")
+        self.status = 429
+        self.retry_after = retry_after
+
+
+class FakeClient:
+    """
+    Routes lookups to in-memory guild/channels and counts every
+    would-be REST call by route name in `self.calls`.
+
+    latency / jitter:   seconds added to every call (real time).
+    rate_limit_every:   every Nth call on a route hits a 429. Like
+                        discord.py's HTTP client, the call waits
+                        `retry_after` and retries, unless
+                        `raise_rate_limits` is set, in which case the
+                        429 surfaces as an exception.
+    """
+
+    def __init__(self, guild_id: int = 1, latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit_every: int = 0, retry_after: float = 0.05,
+                 raise_rate_limits: bool = False, seed: int = 0):
+        self.calls: Counter = Counter()
+        self.rate_limited: Counter = Counter()
+        self.user = SimpleNamespace(id=next_snowflake(), name="Benchmark Bot")
+        self.channels: dict[int, FakeChannel] = {}
+        self.guild = FakeGuild(self, guild_id)
+        self._closed = False
+
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.raise_rate_limits = raise_rate_limits
+        self._rng = random.Random(seed)
+
+    async def call(self, route: str):
+        self.calls[route] += 1
+
+        if self.rate_limit_every and self.calls[route] % self.rate_limit_every == 0:
+            self.rate_limited[route] += 1
+            if self.raise_rate_limits:
+                raise self.too_many_requests()
+            await asyncio.sleep(self.retry_after)
+
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        # Yield like a real HTTP round-trip would
+        await asyncio.sleep(delay)
+
+    def not_found(self) -> Exception:
+        try:
+            import discord
+            return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+        except Exception:
+            return FakeNotFound("Unknown Message")
+
+    def too_many_requests(self) -> Exception:
+        try:
+            import discord
+            return discord.HTTPException(SimpleNamespace(status=429, reason="Too Many Requests"),
+                                         {"message": "You are being rate limited.",
+                                          "retry_after": self.retry_after})
+        except Exception:
+            return FakeRateLimited(self.retry_after)
+
+    def close(self):
+        self._closed = True
+
+    def get_guild(self, guild_id: int):
+        return self.guild if guild_id == self.guild.id else None
+
+    def get_channel(self, channel_id: int):
+        if not channel_id:
+            return None
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            channel = FakeChannel(self, channel_id, self.guild)
+            self.channels[channel_id] = channel
+        return channel
+
+    async def fetch_channel(self, channel_id: int):
+        await self.call("fetch_channel")
+        return self.get_channel(channel_id)
+
+    def get_partial_messageable(self, channel_id: int, **kwargs):
+        return self.get_channel(channel_id)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    async def wait_until_ready(self):
+        return None
+
+    def bind(self, bot):
+        """Route a real bot object's lookups to this fake (module-level code uses the global bot)."""
+        for attr in ("get_channel", "fetch_channel", "get_guild", "get_partial_messageable",
+                     "is_closed", "wait_until_ready"):
+            setattr(bot, attr, getattr(self, attr))
@@ -0,0 +1,185 @@
+"""
+Shared plumbing for the offline benchmarks: environment bootstrap,
+a bytes-written meter and a bounded-concurrency driver that reports
+throughput and latency percentiles.
+"""
+import asyncio
+import builtins
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+
+from . import synthetic
+
+
+def bootstrap_environment(data_dir: str | None = None) -> str:
+    """
+    Point the bot at a scratch data dir and synthetic ids.
+    Must run BEFORE any `systems.*` or `main` import.
+    """
+    data_dir = data_dir or tempfile.mkdtemp(prefix="jollyfox-bench-")
+    os.environ["DATA_DIR"] = data_dir
+    for key, value in synthetic.bot_env().items():
+        os.environ.setdefault(key, value)
+    return data_dir
+
+
+def load_bot():
+    """Import main.py (without running it) and load its data files."""
+    import main
+
+    main.quest_manager.load_all()
+    return main
+
+
+def bind_anchors(main):
+    """
+    What setup_hook does for anchored messages: register them and bind
+    the registry to the (fake-routed) bot. Call from inside the loop —
+    the persistent views need one.
+    """
+    main.register_anchors()
+
+
+# =================================================
+# ============  BYTES WRITTEN METER  ==============
+# =================================================
+
+class _CountingFile:
+    def __init__(self, f, meter):
+        self._f = f
+        self._meter = meter
+
+    def write(self, data):
+        n = self._f.write(data)
+        self._meter.bytes_written += len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+        return n
+
+    def __enter__(self):
+        self._f.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._f.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+class WriteMeter:
+    """Counts bytes written through open() to files under `root`."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.bytes_written = 0
+        self.files_opened = 0
+        self._orig_open = None
+
+    def __enter__(self):
+        self._orig_open = builtins.open
+        meter = self
+
+        def _open(file, mode="r", *args, **kwargs):
+            f = meter._orig_open(file, mode, *args, **kwargs)
+            if any(c in mode for c in "wax+") and isinstance(file, (str, os.PathLike)):
+                if os.path.abspath(os.fspath(file)).startswith(meter.root):
+                    meter.files_opened += 1
+                    return _CountingFile(f, meter)
+            return f
+
+        builtins.open = _open
+        return self
+
+    def __exit__(self, *exc):
+        builtins.open = self._orig_open
+        return False
+
+
+# =================================================
+# ===============  DRIVER / STATS  ================
+# =================================================
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+@dataclass
+class BenchResult:
+    name: str
+    ops: int
+    concurrency: int
+    wall_seconds: float
+    latencies_ms: list[float] = field(default_factory=list)
+    bytes_written: int = 0
+    errors: int = 0
+    rest_calls: int = 0
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        lat = sorted(self.latencies_ms)
+        return {
+            "scenario": self.name,
+            "ops": self.ops,
+            "concurrency": self.concurrency,
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            "p50_ms": round(percentile(lat, 50), 3),
+            "p95_ms": round(percentile(lat, 95), 3),
+            "p99_ms": round(percentile(lat, 99), 3),
+            "max_ms": round(lat[-1], 3) if lat else 0.0,
+            "bytes_per_op": round(self.bytes_written / self.ops) if self.ops else 0,
+            "rest_calls_per_op": round(self.rest_calls / self.ops, 2) if self.ops else 0,
+            "errors": self.errors,
+        }
+
+
+async def drive(name: str, op, ops: int, concurrency: int, meter: WriteMeter,
+                client=None, prepare=None) -> BenchResult:
+    """
+    Run `await op(i)` for i in range(ops) with at most `concurrency` in flight.
+    `prepare(i)` (optional, sync) runs untimed right before each op.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    result = BenchResult(name=name, ops=ops, concurrency=concurrency, wall_seconds=0.0)
+    calls_before = sum(client.calls.values()) if client else 0
+
+    async def _one(i: int):
+        async with sem:
+            if prepare:
+                prepare(i)
+            t0 = time.perf_counter()
+            try:
+                await op(i)
+            except Exception as e:
+                result.errors += 1
+                if result.errors <= 3:
+                    print(f"[BENCH] {name} op {i} failed: {e!r}")
+            result.latencies_ms.append((time.perf_counter() - t0) * 1000)
+
+    bytes_before = meter.bytes_written
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(ops)))
+    result.wall_seconds = time.perf_counter() - started
+    result.bytes_written = meter.bytes_written - bytes_before
+    if client:
+        result.rest_calls = sum(client.calls.values()) - calls_before
+    return result
+
+
+def format_table(rows: list[dict]) -> str:
+    cols = ["scenario", "ops", "concurrency", "ops_per_sec", "p50_ms", "p95_ms", "p99_ms",
+            "max_ms", "bytes_per_op", "rest_calls_per_op", "errors"]
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in cols}
+    lines = ["  ".join(c.ljust(widths[c]) for c in cols)]
+    lines.append("  ".join("-" * widths[c] for c in cols))
+    for r in rows:
+        lines.append("  ".join(str(r[c]).ljust(widths[c]) for c in cols))
+    return "\n".join(lines)
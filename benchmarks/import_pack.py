@@ -0,0 +1,130 @@
+"""
+Times a large quest pack through the import path: the old one (json.loads
+the whole attachment, stop at the first error, rewrite quests.json, reload
+it from disk) against the streaming importer with JSON and JSON Lines
+packs. Also checks that a pack with scattered mistakes reports all of them.
+
+    python -m benchmarks.import_pack --templates 10000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+# Storage paths are resolved at import time — point them at scratch first
+os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="import_bench_")
+
+from systems.quests import importer, storage  # noqa: E402
+from systems.quests.quest_manager import QuestManager  # noqa: E402
+
+NPC_IDS = [f"npc_{i}" for i in range(40)]
+TYPES = ["SOCIAL", "SKILL", "FETCH", "TRAVEL"]
+
+
+def make_pack(n: int, rng: random.Random) -> dict:
+    pack = {}
+    for i in range(n):
+        qtype = TYPES[i % len(TYPES)]
+        qid = f"bench_{qtype.lower()}_{i}"
+        q = {
+            "quest_id": qid, "name": f"Quest {i}", "type": qtype, "points": rng.randint(1, 20),
+            "summary": "Lorem ipsum " * 4, "details": "Dolor sit amet " * 12,
+            "tags": ["rare"] if i % 17 == 0 else [],
+            "allowed_roles": [rng.randint(10**17, 10**18)] if i % 3 == 0 else [],
+        }
+        if qtype == "SOCIAL":
+            q["npc_id"] = rng.choice(NPC_IDS)
+        elif qtype == "SKILL":
+            q.update(dc=rng.randint(8, 18), points_on_success=10, points_on_fail=2)
+        elif qtype == "FETCH":
+            q.update(item_name="Crate", source_channel_id=10**18 + i, turnin_channel_id=10**18 + i + 1)
+        else:
+            q["required_channel_id"] = 10**18 + i
+        pack[qid] = q
+    return pack
+
+
+def break_pack(pack: dict, rng: random.Random, count: int) -> int:
+    """Introduce `count` distinct mistakes; returns how many were made."""
+    victims = rng.sample(sorted(pack), count)
+    for i, qid in enumerate(victims):
+        q = pack[qid]
+        kind = i % 4
+        if kind == 0:
+            q["npc_id"] = "npc_missing"
+        elif kind == 1:
+            q["required_channel_id"] = str(10**18)
+        elif kind == 2:
+            del q["name"]
+        else:
+            q["type"] = "DANCE"
+    return count
+
+
+def to_jsonl(pack: dict) -> bytes:
+    return "".join(json.dumps(q) + "\n" for q in pack.values()).encode()
+
+
+def legacy_import(data: bytes) -> float:
+    """The old quest_import path, minus Discord."""
+    t0 = time.perf_counter()
+    new_data = json.loads(data.decode("utf-8"))
+    for qid, q in new_data.items():
+        if not all(f in q for f in ("quest_id", "name", "type")):
+            break
+    with open(storage.QUESTS_FILE, "w", encoding="utf-8") as f:
+        json.dump(new_data, f, indent=4)
+    storage.load_templates()
+    return time.perf_counter() - t0
+
+
+def streaming_import(data: bytes, filename: str) -> tuple[float, float, float, importer.ImportReport]:
+    manager = QuestManager(autoload=False)
+
+    t0 = time.perf_counter()
+    report = importer.read_pack_bytes(data, importer.KIND_TEMPLATES, filename, npc_ids=NPC_IDS)
+    t1 = time.perf_counter()
+    models, raw = importer.merged(report, "overwrite", {})
+    importer.commit_pack(report, raw)
+    t2 = time.perf_counter()
+    manager.apply_templates(models)
+    t3 = time.perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time large quest pack imports")
+    parser.add_argument("--templates", type=int, default=10000)
+    parser.add_argument("--errors", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    pack = make_pack(args.templates, rng)
+    as_json = json.dumps(pack, indent=4).encode()
+    as_jsonl = to_jsonl(pack)
+    print(f"{args.templates} templates — JSON {len(as_json) / 1e6:.1f} MB, JSONL {len(as_jsonl) / 1e6:.1f} MB\n")
+
+    print(f"{'path':<16} {'validate':>9} {'commit':>9} {'apply':>9} {'total':>9}")
+    print("-" * 56)
+    legacy = legacy_import(as_json)
+    print(f"{'legacy (json)':<16} {'':>9} {'':>9} {'':>9} {legacy * 1000:>7.0f}ms")
+    for label, data, name in (("stream (json)", as_json, "pack.json"), ("stream (jsonl)", as_jsonl, "pack.jsonl")):
+        validate, commit, apply, report = streaming_import(data, name)
+        assert report.ok, report.errors[:3]
+        total = validate + commit + apply
+        print(f"{label:<16} {validate * 1000:>7.0f}ms {commit * 1000:>7.0f}ms {apply * 1000:>7.0f}ms {total * 1000:>7.0f}ms")
+
+    made = break_pack(pack, rng, args.errors)
+    for fmt, data, name in (("json", json.dumps(pack, indent=4).encode(), "pack.json"), ("jsonl", to_jsonl(pack), "pack.jsonl")):
+        report = importer.read_pack_bytes(data, importer.KIND_TEMPLATES, name, npc_ids=NPC_IDS)
+        flagged = len({issue.entry for issue in report.errors})
+        print(f"\n{fmt}: {made} broken entries → {report.error_count} errors on {flagged} entries, e.g.")
+        for issue in report.errors[:3]:
+            print(f"    {issue}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+Replays a recorded interaction stream (INTERACTION_RECORD_PATH, see
+systems/perf/recorder.py) through the real handlers against a scratch
+copy of a data dir, and reports latency / throughput per command.
+
+    python -m benchmarks.replay rush.jsonl --data-dir ./prod-data-copy --speed 1
+    python -m benchmarks.replay rush.jsonl --data-dir ./prod-data-copy --speed 60 --json after.json
+    python -m benchmarks.replay rush.jsonl --synthetic-players 2000 --speed 0 --compare before.json
+
+--speed 1 keeps the recorded gaps, N > 1 compresses them N times, and 0
+fires every record as fast as --concurrency allows. Game time follows
+the recording either way, so a midnight rush still crosses midnight.
+
+Recorded users are hashes. Pass the recorder's --secret to re-attach
+them to their real profiles in the copied data dir; otherwise they are
+mapped, in order of first appearance, onto existing players.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+
+from . import harness, synthetic
+
+# Commands the replayer can drive; everything else is counted as skipped
+QUEST_COMMANDS = ["quest", "profile", "talk", "skill", "checkin", "fetch", "turnin"]
+# Persistent buttons are recorded by custom_id
+VOTE_ACTIONS = {f"seasonal:{action}": action for action in ("attack", "defend", "heal", "power")}
+BOARD_DAILY = "quest_board:view_daily"
+BOARD_PROFILE = "quest_board:view_profile"
+WANDERING_JOIN = "wandering:join"
+# Recordings made before those buttons had fixed custom_ids keyed them by label
+LEGACY_KEYS = {"attack": "seasonal:attack", "defend": "seasonal:defend", "heal": "seasonal:heal",
+               "power": "seasonal:power", "join the hunt": WANDERING_JOIN}
+
+
+def _make_replay_clock(origin: float, speed: float):
+    from systems import clock
+
+    class ReplayClock(clock.Clock):
+        """Game time = recording time, advanced at `speed` × real time (or by the cursor at speed 0)."""
+
+        def __init__(self):
+            self.real0 = time.perf_counter()
+            self.cursor = origin
+
+        def now(self) -> datetime:
+            if speed:
+                ts = origin + (time.perf_counter() - self.real0) * speed
+            else:
+                ts = self.cursor
+            return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+        def today(self) -> date:
+            return self.now().date()
+
+        async def sleep(self, seconds: float):
+            await asyncio.sleep(max(0.0, seconds / speed) if speed else 0)
+
+    return ReplayClock()
+
+
+class Replayer:
+    def __init__(self, main, records: list[dict], client, secret: str | None = None):
+        from systems.perf.recorder import anonymize
+
+        self.main = main
+        self.records = records
+        self.client = client
+        self.members = {}
+        self.roles = {}
+        self.skipped: dict[str, int] = {}
+        self._threat_message = None
+        self._threat_event = None
+
+        # Recorded hash → user id
+        players = sorted(main.quest_manager.players)
+        if secret:
+            self.user_map = {anonymize(secret.encode(), uid): uid for uid in players}
+        else:
+            self.user_map = {}
+        self._pool = iter([uid for uid in players if uid not in self.user_map.values()])
+        self._fresh = synthetic.FIRST_USER_ID + 10_000_000
+
+        self.handlers = self._build_handlers()
+
+    # ---------- Fixtures ----------
+    async def setup(self):
+        from .run import BenchContext
+
+        guild = synthetic.SyntheticGuild(data_dir=os.environ["DATA_DIR"], player_ids=[], player_roles={})
+        ctx = BenchContext(self.main, guild, client=self.client)
+        await ctx.anchor_embeds()
+        self.season_message = ctx.season_message
+
+        from systems.seasonal.views import SeasonalVoteView
+
+        self.vote_view = SeasonalVoteView()
+
+    def _user_id(self, user_hash: str) -> int:
+        uid = self.user_map.get(user_hash)
+        if uid is None:
+            uid = next(self._pool, None)
+            if uid is None:
+                self._fresh += 1
+                uid = self._fresh
+            self.user_map[user_hash] = uid
+        return uid
+
+    def _member(self, record: dict):
+        from .fakes import FakeMember, FakeRole
+
+        uid = self._user_id(record["u"])
+        roles = []
+        for rid in record.get("r", []):
+            role = self.roles.get(rid)
+            if role is None:
+                role = self.roles[rid] = FakeRole(rid)
+                self.client.guild.roles[rid] = role
+            roles.append(role)
+
+        member = self.members.get(uid)
+        if member is None:
+            member = self.members[uid] = FakeMember(uid, guild=self.client.guild, roles=roles)
+            self.client.guild.members.append(member)
+            for role in roles:
+                role.members.append(uid)
+        else:
+            member.roles = roles
+        return member
+
+    def _interaction(self, record: dict, message=None):
+        from .fakes import FakeInteraction
+
+        return FakeInteraction(self.client, self._member(record), self.client.get_channel(record["ch"]), message)
+
+    # ---------- Dispatch ----------
+    def _build_handlers(self) -> dict:
+        main = self.main
+        handlers = {}
+
+        for name in QUEST_COMMANDS:
+            command = getattr(main, name, None)
+            if command is not None:
+                handlers[name] = lambda r, c=command: c.callback(self._interaction(r))
+
+        async def board_daily(record):
+            inter = self._interaction(record)
+            await inter.response.defer(ephemeral=True)
+            await main.send_daily_quest(inter)
+
+        handlers[BOARD_DAILY] = board_daily
+        handlers[BOARD_PROFILE] = lambda r: main.profile.callback(self._interaction(r))
+
+        for custom_id, action in VOTE_ACTIONS.items():
+            handlers[custom_id] = lambda r, a=action: self.vote_view._handle_vote(
+                self._interaction(r, message=self.season_message), a
+            )
+
+        handlers[WANDERING_JOIN] = self._wandering_join
+        for legacy, key in LEGACY_KEYS.items():
+            handlers[legacy] = handlers[key]
+        return handlers
+
+    async def _wandering_join(self, record: dict):
+        from systems import clock
+        from systems.engine.wandering import create_event
+
+        manager = self.main.wandering_manager
+        event = self._threat_event
+        if event is None or event.resolved or clock.now() >= event.ends_at or self._threat_message is None:
+            # Recorded joins imply a live threat; keep one up
+            event = create_event("Replayed Threat", "Replay", "critical", record["ch"])
+            msg = await self.client.get_channel(record["ch"]).send(content="threat")
+            event.message_id = msg.id
+            manager.track(event)
+            self._threat_event = event
+            self._threat_message = msg
+
+        inter = self._interaction(record, message=self._threat_message)
+        await manager.handle_participation(inter, event.event_id)
+
+    async def run(self, speed: float, concurrency: int, meter) -> dict:
+        from systems import clock
+
+        runnable = [r for r in self.records if r["c"] in self.handlers]
+        for r in self.records:
+            if r["c"] not in self.handlers:
+                self.skipped[r["c"]] = self.skipped.get(r["c"], 0) + 1
+        if not runnable:
+            return {"results": [], "lag_ms": [], "wall_seconds": 0.0}
+
+        origin = runnable[0]["t"]
+        replay_clock = _make_replay_clock(origin, speed)
+        previous_clock = clock.set_clock(replay_clock)
+
+        sem = asyncio.Semaphore(concurrency)
+        results: dict[str, harness.BenchResult] = {}
+        lag_ms: list[float] = []
+        calls_before = sum(self.client.calls.values())
+        bytes_before = meter.bytes_written
+
+        async def _one(record: dict, due: float):
+            async with sem:
+                lag_ms.append(max(0.0, time.perf_counter() - due) * 1000)
+                if not speed:
+                    replay_clock.cursor = record["t"]
+
+                result = results.get(record["c"])
+                if result is None:
+                    result = results[record["c"]] = harness.BenchResult(
+                        name=record["c"], ops=0, concurrency=concurrency, wall_seconds=0.0
+                    )
+                result.ops += 1
+
+                t0 = time.perf_counter()
+                try:
+                    await self.handlers[record["c"]](record)
+                except Exception as e:
+                    result.errors += 1
+                    if result.errors <= 3:
+                        print(f"[REPLAY] {record['c']} failed: {e!r}", file=sys.stderr)
+                result.latencies_ms.append((time.perf_counter() - t0) * 1000)
+
+        # Open loop: records fire on schedule whether or not earlier ones finished
+        tasks = []
+        started = replay_clock.real0 = time.perf_counter()
+        try:
+            for record in runnable:
+                due = started + ((record["t"] - origin) / speed if speed else 0.0)
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(_one(record, due)))
+            await asyncio.gather(*tasks)
+        finally:
+            clock.set_clock(previous_clock)
+        wall = time.perf_counter() - started
+
+        rest_calls = sum(self.client.calls.values()) - calls_before
+        written = meter.bytes_written - bytes_before
+        total_ops = len(runnable)
+        for result in results.values():
+            result.wall_seconds = wall
+            # Shared side effects, attributed by share of ops
+            result.rest_calls = round(rest_calls * result.ops / total_ops)
+            result.bytes_written = round(written * result.ops / total_ops)
+
+        return {"results": list(results.values()), "lag_ms": lag_ms, "wall_seconds": wall}
+
+
+# =================================================
+# ================  REPORTING  ====================
+# =================================================
+
+def build_report(outcome: dict, records: int, skipped: dict[str, int], speed: float) -> dict:
+    rows = sorted((r.as_dict() for r in outcome["results"]), key=lambda r: -r["ops"])
+    all_latencies = sorted(l for r in outcome["results"] for l in r.latencies_ms)
+    lag = sorted(outcome["lag_ms"])
+    total_ops = sum(r["ops"] for r in rows)
+    wall = outcome["wall_seconds"]
+
+    return {
+        "speed": speed,
+        "records": records,
+        "replayed": total_ops,
+        "skipped": skipped,
+        "wall_seconds": round(wall, 3),
+        "ops_per_sec": round(total_ops / wall, 1) if wall else 0.0,
+        "p50_ms": round(harness.percentile(all_latencies, 50), 3),
+        "p95_ms": round(harness.percentile(all_latencies, 95), 3),
+        "p99_ms": round(harness.percentile(all_latencies, 99), 3),
+        # How far dispatch fell behind the recorded schedule (backpressure)
+        "lag_p95_ms": round(harness.percentile(lag, 95), 3),
+        "errors": sum(r["errors"] for r in rows),
+        "commands": rows,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [harness.format_table(report["commands"])] if report["commands"] else ["(nothing replayed)"]
+    lines.append("")
+    lines.append(
+        f"replayed {report['replayed']}/{report['records']} records at speed {report['speed'] or 'max'} "
+        f"in {report['wall_seconds']}s — {report['ops_per_sec']} ops/s, "
+        f"p50 {report['p50_ms']}ms, p95 {report['p95_ms']}ms, p99 {report['p99_ms']}ms, "
+        f"schedule lag p95 {report['lag_p95_ms']}ms, errors {report['errors']}"
+    )
+    if report["skipped"]:
+        skipped = ", ".join(f"{k}×{v}" for k, v in sorted(report["skipped"].items(), key=lambda kv: -kv[1]))
+        lines.append(f"skipped (no replay handler): {skipped}")
+    return "\n".join(lines)
+
+
+def format_comparison(before: dict, after: dict) -> str:
+    """Per-command p95 and throughput deltas against a previous --json report."""
+    def pct(old, new):
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    old_rows = {r["scenario"]: r for r in before.get("commands", [])}
+    lines = ["command               p95 before → after          ops/s before → after"]
+    for row in after["commands"]:
+        old = old_rows.get(row["scenario"])
+        if old is None:
+            continue
+        lines.append(
+            f"{row['scenario']:<20}  {old['p95_ms']:>8} → {row['p95_ms']:<8} ({pct(old['p95_ms'], row['p95_ms'])})"
+            f"  {old['ops_per_sec']:>8} → {row['ops_per_sec']:<8} ({pct(old['ops_per_sec'], row['ops_per_sec'])})"
+        )
+    lines.append(
+        f"{'overall':<20}  {before['p95_ms']:>8} → {after['p95_ms']:<8} ({pct(before['p95_ms'], after['p95_ms'])})"
+        f"  {before['ops_per_sec']:>8} → {after['ops_per_sec']:<8} ({pct(before['ops_per_sec'], after['ops_per_sec'])})"
+    )
+    return "\n".join(lines)
+
+
+# =================================================
+# ===================  CLI  =======================
+# =================================================
+
+def _prepare_data_dir(args) -> str:
+    scratch = tempfile.mkdtemp(prefix="jollyfox-replay-")
+    if args.data_dir:
+        # Never replay into the source — handlers write through
+        shutil.copytree(args.data_dir, scratch, dirs_exist_ok=True)
+    harness.bootstrap_environment(scratch)
+    if not args.data_dir:
+        synthetic.generate_guild(scratch, players=args.synthetic_players, templates=200, npcs=20, seed=args.seed)
+    return scratch
+
+
+async def main_async(args) -> dict:
+    _prepare_data_dir(args)
+
+    from systems.perf.recorder import read_records
+    from .fakes import FakeClient
+
+    records = read_records(args.recording)
+    if args.limit:
+        records = records[: args.limit]
+
+    bot_module = harness.load_bot()
+    client = FakeClient(guild_id=int(os.environ["GUILD_ID"]), latency=args.latency, seed=args.seed)
+
+    replayer = Replayer(bot_module, records, client, secret=args.secret)
+    await replayer.setup()
+
+    with harness.WriteMeter(os.environ["DATA_DIR"]) as meter:
+        outcome = await replayer.run(args.speed, args.concurrency, meter)
+    return build_report(outcome, len(records), replayer.skipped, args.speed)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded interaction stream offline")
+    parser.add_argument("recording", help="JSONL file written by the interaction recorder")
+    parser.add_argument("--data-dir", default=None, help="data dir to copy and replay against")
+    parser.add_argument("--synthetic-players", type=int, default=1000,
+                        help="without --data-dir, replay against a synthetic guild this size")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = real time, N = N× faster, 0 = max")
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated Discord REST latency (s)")
+    parser.add_argument("--secret", default=None, help="INTERACTION_RECORD_SECRET used when recording")
+    parser.add_argument("--limit", type=int, default=0, help="replay only the first N records")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", default=None, help="write the report to this file")
+    parser.add_argument("--compare", default=None, help="previous --json report to diff against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+
+    print(format_report(report))
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print()
+            print(format_comparison(json.load(f), report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
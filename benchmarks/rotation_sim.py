@@ -0,0 +1,128 @@
+"""
+Simulates daily-quest assignment for a guild over many days and compares
+the old uniform pick (random.choice over eligible templates) with the
+rotation engine: repeat rates, back-to-back quest types, type balance and
+cost per assignment.
+
+    python -m benchmarks.rotation_sim --players 2000 --days 60 --templates 120
+"""
+import argparse
+import random
+import time
+from collections import Counter, deque
+from types import SimpleNamespace
+
+from systems.quests.quest_models import QuestTemplate, QuestType
+from systems.quests.rotation import RotationEngine
+
+# Skewed like a real board: lots of social quests, few travel ones
+TYPE_MIX = [(QuestType.SOCIAL, 0.5), (QuestType.SKILL, 0.25), (QuestType.FETCH, 0.15), (QuestType.TRAVEL, 0.10)]
+GATING_ROLES = [101, 102, 103, 201, 202]
+
+
+def make_templates(n: int, rng: random.Random) -> dict[str, QuestTemplate]:
+    types, weights = zip(*TYPE_MIX)
+    templates = {}
+    for i in range(n):
+        qtype = rng.choices(types, weights)[0]
+        # A third of the board is faction / RP gated
+        allowed = [rng.choice(GATING_ROLES)] if i % 3 == 0 else []
+        tags = ["rare"] if i % 17 == 0 else []
+        qid = f"sim_{qtype.value.lower()}_{i}"
+        templates[qid] = QuestTemplate(
+            quest_id=qid, name=qid, type=qtype, points=5, tags=tags, allowed_roles=allowed
+        )
+    return templates
+
+
+def run_policy(policy: str, templates: dict, players: int, days: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    engine = RotationEngine(rng=rng)
+    engine.sync(templates)
+
+    gating = set(GATING_ROLES)
+    member_roles = [
+        frozenset(r for r in rng.sample(GATING_ROLES, rng.randint(0, 2)) if r in gating)
+        for _ in range(players)
+    ]
+    by_class = {}
+    for role_class in set(member_roles):
+        by_class[role_class] = [
+            t for t in templates.values() if not t.allowed_roles or any(r in role_class for r in t.allowed_roles)
+        ]
+
+    states = [SimpleNamespace(quest_history=[], quest_history_head=0) for _ in range(players)]
+    seen = [deque(maxlen=7) for _ in range(players)]
+    last_type = [None] * players
+
+    repeat_1 = repeat_7 = same_type = assignments = 0
+    type_share = Counter()
+    elapsed = 0.0
+
+    for _day in range(days):
+        for p in range(players):
+            role_class = member_roles[p]
+            eligible = by_class[role_class]
+
+            t0 = time.perf_counter()
+            if policy == "uniform":
+                chosen = rng.choice(eligible)
+            else:
+                chosen = engine.pick(states[p], role_class, eligible)
+                engine.remember(states[p], chosen.quest_id)
+            elapsed += time.perf_counter() - t0
+
+            assignments += 1
+            type_share[chosen.type] += 1
+            if seen[p] and seen[p][-1] == chosen.quest_id:
+                repeat_1 += 1
+            if chosen.quest_id in seen[p]:
+                repeat_7 += 1
+            if last_type[p] == chosen.type:
+                same_type += 1
+            seen[p].append(chosen.quest_id)
+            last_type[p] = chosen.type
+
+    return {
+        "policy": policy,
+        "repeat_yesterday_pct": 100 * repeat_1 / assignments,
+        "repeat_7d_pct": 100 * repeat_7 / assignments,
+        "same_type_as_yesterday_pct": 100 * same_type / assignments,
+        "type_share_pct": {t.value: 100 * n / assignments for t, n in sorted(type_share.items())},
+        "us_per_assignment": elapsed / assignments * 1e6,
+    }
+
+
+def format_report(rows: list[dict]) -> str:
+    lines = [
+        f"{'policy':<9} {'repeat 1d':>10} {'repeat 7d':>10} {'same type':>10} {'µs/pick':>8}   type share",
+        "-" * 84,
+    ]
+    for r in rows:
+        share = "  ".join(f"{k} {v:.0f}%" for k, v in r["type_share_pct"].items())
+        lines.append(
+            f"{r['policy']:<9} {r['repeat_yesterday_pct']:>9.2f}% {r['repeat_7d_pct']:>9.2f}% "
+            f"{r['same_type_as_yesterday_pct']:>9.2f}% {r['us_per_assignment']:>8.2f}   {share}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare uniform vs rotation daily-quest assignment")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--templates", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    templates = make_templates(args.templates, random.Random(args.seed))
+    rows = [
+        run_policy(policy, templates, args.players, args.days, args.seed)
+        for policy in ("uniform", "rotation")
+    ]
+    print(f"{args.players} players × {args.days} days, {args.templates} templates\n")
+    print(format_report(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+End-to-end load benchmark — runs the real command handlers against a
+synthetic guild with fake Discord objects. No network, no token.
+
+    python -m benchmarks.run --players 2000 --templates 300 --ops 1000 --concurrency 64
+    python -m benchmarks.run --scenario talk --scenario vote --json results.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import date
+
+from . import harness, synthetic
+
+SCENARIOS = ["daily_quest", "talk", "skill", "checkin", "fetch", "turnin", "vote", "wandering_join"]
+
+# Quest type + channel key used to stage each quest-action flow
+QUEST_FLOWS = {
+    "talk": ("SOCIAL", "required_channel_id"),
+    "skill": ("SKILL", "required_channel_id"),
+    "checkin": ("TRAVEL", "required_channel_id"),
+    "fetch": ("FETCH", "source_channel_id"),
+    "turnin": ("FETCH", "turnin_channel_id"),
+}
+
+
+class BenchContext:
+    def __init__(self, main, guild: synthetic.SyntheticGuild, client=None):
+        from .fakes import FakeClient, FakeMember, FakeRole
+
+        self.main = main
+        self.guild_data = guild
+        self.client = client or FakeClient(guild_id=synthetic.GUILD_ID)
+        self.members = {}
+
+        roles = {}
+        for uid, role_ids in guild.player_roles.items():
+            member_roles = []
+            for rid in role_ids:
+                role = roles.get(rid)
+                if role is None:
+                    role = roles[rid] = FakeRole(rid)
+                    self.client.guild.roles[rid] = role
+                role.members.append(uid)
+                member_roles.append(role)
+            member = FakeMember(uid, guild=self.client.guild, roles=member_roles)
+            self.members[uid] = member
+            self.client.guild.members.append(member)
+
+        # Module-level helpers (log_to_points, board refresh, wandering) use the
+        # global `bot` rather than interaction.client — route them to the fakes.
+        self.client.bind(main.bot)
+
+    def member(self, i: int):
+        uid = self.guild_data.player_ids[i % len(self.guild_data.player_ids)]
+        return self.members[uid]
+
+    def interaction(self, member, channel_id: int, message=None):
+        from .fakes import FakeInteraction
+
+        return FakeInteraction(self.client, member, self.client.get_channel(channel_id), message)
+
+    async def anchor_embeds(self):
+        """Post the board + seasonal embeds so refresh paths do real edits."""
+        main = self.main
+        harness.bind_anchors(main)
+        board = main.quest_manager.quest_board
+        board_msg = await self.client.get_channel(synthetic.BOARD_CHANNEL_ID).send(content="board")
+        board.display_channel_id = synthetic.BOARD_CHANNEL_ID
+        board.message_id = board_msg.id
+
+        from systems.seasonal.storage import load_season, save_season
+
+        state = load_season()
+        season_msg = await self.client.get_channel(synthetic.SEASON_CHANNEL_ID).send(content="season")
+        state["embed"] = {"channel_id": synthetic.SEASON_CHANNEL_ID, "message_id": season_msg.id}
+        save_season(state)
+        self.season_message = season_msg
+
+
+def _stage_quest(ctx: BenchContext, i: int, qtype: str, with_item: bool = False):
+    member = ctx.member(i)
+    templates = ctx.guild_data.templates_by_type[qtype]
+    # Only un-gated templates so role checks always pass
+    open_templates = [t for t in templates if not t["allowed_roles"]] or templates
+    tmpl = open_templates[i % len(open_templates)]
+
+    player = ctx.main.quest_manager.get_or_create_player(member.id)
+    player.daily_quest = {
+        "quest_id": tmpl["quest_id"],
+        "assigned_date": str(date.today()),
+        "completed": False,
+        "role_snapshot": [r.id for r in member.roles],
+    }
+    player.inventory.clear()
+    if with_item:
+        player.add_item(tmpl["item_name"])
+    return member, tmpl
+
+
+async def run_scenario(ctx: BenchContext, name: str, ops: int, concurrency: int, meter) -> harness.BenchResult:
+    main = ctx.main
+    staged: dict[int, tuple] = {}
+
+    if name == "daily_quest":
+        def prepare(i):
+            member = ctx.member(i)
+            main.quest_manager.get_or_create_player(member.id).daily_quest = {}
+            staged[i] = member
+
+        async def op(i):
+            inter = ctx.interaction(staged.pop(i), synthetic.BOARD_CHANNEL_ID)
+            await inter.response.defer(ephemeral=True)
+            await main.send_daily_quest(inter)
+
+    elif name in QUEST_FLOWS:
+        qtype, channel_key = QUEST_FLOWS[name]
+        command = getattr(main, name)
+
+        def prepare(i):
+            staged[i] = _stage_quest(ctx, i, qtype, with_item=(name == "turnin"))
+
+        async def op(i):
+            member, tmpl = staged.pop(i)
+            inter = ctx.interaction(member, tmpl[channel_key])
+            await command.callback(inter)
+
+    elif name == "vote":
+        from systems.seasonal.views import SeasonalVoteView
+
+        view = SeasonalVoteView()
+        actions = ["attack", "defend", "heal"]
+
+        def prepare(i):
+            staged[i] = ctx.member(i)
+
+        async def op(i):
+            inter = ctx.interaction(staged.pop(i), synthetic.SEASON_CHANNEL_ID, message=ctx.season_message)
+            await view._handle_vote(inter, actions[i % len(actions)])
+
+    elif name == "wandering_join":
+        from systems.engine.wandering import create_event
+
+        manager = main.wandering_manager
+        event = create_event("Synthetic Threat", "Generated", "critical", synthetic.LUNETH_VALE_CHANNEL_ID)
+        msg = await ctx.client.get_channel(synthetic.LUNETH_VALE_CHANNEL_ID).send(content="threat")
+        event.message_id = msg.id
+        manager.track(event)
+
+        def prepare(i):
+            staged[i] = ctx.member(i)
+
+        async def op(i):
+            inter = ctx.interaction(staged.pop(i), synthetic.LUNETH_VALE_CHANNEL_ID, message=msg)
+            await manager.handle_participation(inter, event.event_id)
+
+    else:
+        raise ValueError(f"Unknown scenario: {name}")
+
+    return await harness.drive(name, op, ops, concurrency, meter, client=ctx.client, prepare=prepare)
+
+
+async def main_async(args) -> list[dict]:
+    data_dir = harness.bootstrap_environment(args.data_dir)
+    guild = synthetic.generate_guild(
+        data_dir,
+        players=args.players,
+        templates=args.templates,
+        npcs=args.npcs,
+        seed=args.seed,
+    )
+    bot_module = harness.load_bot()
+
+    ctx = BenchContext(bot_module, guild)
+    await ctx.anchor_embeds()
+
+    rows = []
+    with harness.WriteMeter(data_dir) as meter:
+        for name in args.scenario or SCENARIOS:
+            result = await run_scenario(ctx, name, args.ops, args.concurrency, meter)
+            rows.append(result.as_dict())
+            print(f"[BENCH] {name}: {rows[-1]['ops_per_sec']} ops/s", file=sys.stderr)
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline Jolly Fox bot load benchmark")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--templates", type=int, default=200)
+    parser.add_argument("--npcs", type=int, default=20)
+    parser.add_argument("--ops", type=int, default=500, help="operations per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--data-dir", default=None, help="scratch data dir (default: new temp dir)")
+    parser.add_argument("--json", default=None, help="also write results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = asyncio.run(main_async(args))
+
+    print(harness.format_table(rows))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
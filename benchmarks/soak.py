@@ -0,0 +1,228 @@
+"""
+Soak test — runs the real background loops (wandering spawn/resolve,
+seasonal midnight resolve, quest board refresh) for simulated days
+against the fake Discord client, sampling memory and live task counts.
+
+    python -m benchmarks.soak --days 14
+    python -m benchmarks.soak --days 30 --latency 0.002 --rate-limit-every 25
+
+Exits non-zero if live asyncio tasks or traced memory keep growing, or
+if the loops stop doing their work: scheduled hunts that never resolve,
+anchored embeds that are never edited, failed refreshes or joins.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+
+from . import harness, synthetic
+
+HOUR = 60 * 60
+
+
+@dataclass
+class Sample:
+    sim_time: datetime
+    tasks: int
+    timers: int
+    manager_tasks: int
+    traced_kb: float
+    rest_calls: int
+    rate_limited: int
+
+
+# Work that raised inside the soak's own drivers, by kind
+failures: Counter = Counter()
+
+
+async def board_refresher(main, bot, clock, minutes: int):
+    while True:
+        try:
+            await main.refresh_quest_board(bot)
+        except Exception as e:
+            failures["board refresh"] += 1
+            print(f"[SOAK] board refresh failed: {e!r}")
+        await clock.sleep(minutes * 60)
+
+
+async def hunters(ctx, clock, joins_per_event: int, seed: int):
+    """Every few simulated minutes, send a handful of members at the active event."""
+    rng = random.Random(seed)
+    manager = ctx.main.wandering_manager
+    while True:
+        await clock.sleep(5 * 60)
+        live = [e for e in manager.events.values() if not e.resolved and e.message_id]
+        if not live:
+            continue
+        event = rng.choice(live)
+        for _ in range(rng.randint(0, joins_per_event)):
+            member = ctx.member(rng.randrange(len(ctx.guild_data.player_ids)))
+            channel = ctx.client.get_channel(event.channel_id)
+            inter = ctx.interaction(member, channel.id, message=channel.messages.get(event.message_id))
+            try:
+                await manager.handle_participation(inter, event.event_id)
+            except Exception as e:
+                failures["join"] += 1
+                print(f"[SOAK] join failed: {e!r}")
+
+
+def spawn_slots(start: datetime, end: datetime, hours: list[int]) -> int:
+    """Scheduled spawn times in (start, end]."""
+    count = 0
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day <= end:
+        for hour in hours:
+            if start < day + timedelta(hours=hour) <= end:
+                count += 1
+        day += timedelta(days=1)
+    return count
+
+
+def sample(ctx, clock) -> Sample:
+    current, _ = tracemalloc.get_traced_memory()
+    return Sample(
+        sim_time=clock.now(),
+        tasks=len(asyncio.all_tasks()),
+        timers=clock.pending_timers,
+        manager_tasks=len(ctx.main.wandering_manager._background_tasks),
+        traced_kb=current / 1024,
+        rest_calls=sum(ctx.client.calls.values()),
+        rate_limited=sum(ctx.client.rate_limited.values()),
+    )
+
+
+def format_samples(samples: list[Sample]) -> str:
+    lines = [f"{'sim time (UTC)':<20} {'tasks':>6} {'timers':>7} {'mgr':>4} {'traced KB':>10} {'REST':>8} {'429s':>6}"]
+    for s in samples:
+        lines.append(
+            f"{s.sim_time:%Y-%m-%d %H:%M}     {s.tasks:>6} {s.timers:>7} {s.manager_tasks:>4} "
+            f"{s.traced_kb:>10.1f} {s.rest_calls:>8} {s.rate_limited:>6}"
+        )
+    return "\n".join(lines)
+
+
+async def main_async(args) -> int:
+    data_dir = harness.bootstrap_environment(args.data_dir)
+    guild = synthetic.generate_guild(data_dir, players=args.players, templates=args.templates, seed=args.seed)
+    bot_module = harness.load_bot()
+
+    from systems import clock as clock_module
+    from systems.clock import SimulatedClock
+
+    from .fakes import FakeClient
+    from .run import BenchContext
+
+    client = FakeClient(
+        guild_id=synthetic.GUILD_ID,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    ctx = BenchContext(bot_module, guild, client=client)
+
+    start = datetime.combine(datetime.now(timezone.utc).date(), time(0, 5), tzinfo=timezone.utc)
+    settle = (args.latency + args.retry_after) * 4 if (args.latency or args.rate_limit_every) else 0.0
+    clock = SimulatedClock(start=start, settle_delay=settle)
+    clock_module.set_clock(clock)
+
+    await ctx.anchor_embeds()
+
+    tracemalloc.start()
+    bot = bot_module.bot
+    bot_module.points_log.start(bot)
+    bot_module.announcements.start(bot)
+    bot_module.spawn_background(bot_module.start_wandering_system(bot))
+    bot_module.spawn_background(bot_module.seasonal_midnight_loop(bot))
+    bot_module.spawn_background(board_refresher(bot_module, bot, clock, args.board_refresh_minutes))
+    bot_module.spawn_background(hunters(ctx, clock, args.joins_per_event, args.seed))
+
+    # Warm-up day: caches, lazy imports and first spawn settle before the baseline
+    await clock.advance(24 * HOUR)
+    samples = [sample(ctx, clock)]
+
+    for _ in range(args.days):
+        for _ in range(24 // args.sample_hours):
+            await clock.advance(args.sample_hours * HOUR)
+        samples.append(sample(ctx, clock))
+        if args.verbose:
+            print(format_samples(samples[-1:]).splitlines()[-1], file=sys.stderr)
+
+    client.close()
+    for task in list(bot_module._background_tasks):
+        task.cancel()
+    await asyncio.gather(*bot_module._background_tasks, return_exceptions=True)
+    tracemalloc.stop()
+    end = clock.now()
+    clock_module.set_clock(None)
+
+    print(format_samples(samples))
+
+    baseline, last = samples[0], samples[-1]
+    task_growth = last.tasks - baseline.tasks
+    mem_growth_kb = last.traced_kb - baseline.traced_kb
+    print(f"\n[SOAK] {args.days} simulated days — task growth: {task_growth:+d}, "
+          f"traced memory growth: {mem_growth_kb:+.1f} KB")
+
+    failed = False
+    if task_growth > args.max_task_growth:
+        print(f"[SOAK] FAIL: live tasks grew by {task_growth} (limit {args.max_task_growth})")
+        failed = True
+    if mem_growth_kb > args.max_mem_growth_kb:
+        print(f"[SOAK] FAIL: traced memory grew by {mem_growth_kb:.1f} KB (limit {args.max_mem_growth_kb})")
+        failed = True
+
+    # 🐲 Every slot should have produced a hunt (the last one may still be running)
+    from systems.outbound.anchors import anchors
+
+    manager = bot_module.wandering_manager
+    slots = spawn_slots(start, end, manager.spawn_hours()) * len(manager.channel_ids)
+    hunts = manager.history.count
+    edits = client.calls["message.edit"]
+    print(f"[SOAK] hunts resolved: {hunts} / {slots} scheduled • message edits: {edits} • "
+          f"anchors healed {anchors.stats['healed']}, cleared {anchors.stats['cleared']}")
+
+    if hunts < slots - len(manager.channel_ids):
+        print(f"[SOAK] FAIL: only {hunts} of {slots} scheduled hunts were spawned and resolved")
+        failed = True
+    if edits == 0:
+        print("[SOAK] FAIL: anchored embeds were never edited")
+        failed = True
+    if anchors.stats["cleared"]:
+        print(f"[SOAK] FAIL: {anchors.stats['cleared']} anchored messages were lost")
+        failed = True
+    for kind, n in failures.items():
+        print(f"[SOAK] FAIL: {n} {kind} errors")
+        failed = True
+    return 1 if failed else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulated-time soak test for the background loops")
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--templates", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--latency", type=float, default=0.0, help="fake REST latency in real seconds")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="inject a 429 every N calls per route")
+    parser.add_argument("--retry-after", type=float, default=0.01)
+    parser.add_argument("--joins-per-event", type=int, default=4)
+    parser.add_argument("--board-refresh-minutes", type=int, default=30)
+    parser.add_argument("--sample-hours", type=int, default=6, choices=[1, 2, 3, 4, 6, 8, 12, 24])
+    parser.add_argument("--max-task-growth", type=int, default=2)
+    parser.add_argument("--max-mem-growth-kb", type=float, default=2048.0)
+    parser.add_argument("--data-dir", default=None)
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    sys.exit(asyncio.run(main_async(parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Synthetic guild generator: N players, M quest templates, NPCs and an
+active seasonal boss, written as regular data files into a scratch
+DATA_DIR so the real storage layer loads them unchanged.
+"""
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import date
+
+QUEST_TYPES = ["SOCIAL", "SKILL", "TRAVEL", "FETCH"]
+FACTION_IDS = ["shieldborne", "spellfire", "verdant"]
+
+# Fixed synthetic snowflakes — exported via env before the bot modules import
+GUILD_ID = 900_000_000_000_000_001
+FACTION_ROLE_IDS = {
+    "shieldborne": 900_000_000_000_000_101,
+    "spellfire": 900_000_000_000_000_102,
+    "verdant": 900_000_000_000_000_103,
+}
+RP_ROLE_IDS = [900_000_000_000_000_200 + i for i in range(8)]
+POINTS_LOG_CHANNEL_ID = 900_000_000_000_000_301
+BADGE_ANNOUNCE_CHANNEL_ID = 900_000_000_000_000_302
+LUNETH_VALE_CHANNEL_ID = 900_000_000_000_000_303
+BOARD_CHANNEL_ID = 900_000_000_000_000_304
+SEASON_CHANNEL_ID = 900_000_000_000_000_305
+QUEST_CHANNEL_BASE = 900_000_000_000_001_000
+FIRST_USER_ID = 800_000_000_000_000_000
+
+
+def bot_env() -> dict[str, str]:
+    """Environment the bot modules read at import time."""
+    return {
+        "GUILD_ID": str(GUILD_ID),
+        "POINTS_LOG_CHANNEL_ID": str(POINTS_LOG_CHANNEL_ID),
+        "BADGE_ANNOUNCE_CHANNEL_ID": str(BADGE_ANNOUNCE_CHANNEL_ID),
+        "LUNETH_VALE_CHANNEL_ID": str(LUNETH_VALE_CHANNEL_ID),
+        "ROLE_SHIELDBORNE_ID": str(FACTION_ROLE_IDS["shieldborne"]),
+        "ROLE_SPELLFIRE_ID": str(FACTION_ROLE_IDS["spellfire"]),
+        "ROLE_VERDANT_ID": str(FACTION_ROLE_IDS["verdant"]),
+    }
+
+
+@dataclass
+class SyntheticGuild:
+    data_dir: str
+    player_ids: list[int]
+    player_roles: dict[int, list[int]]
+    templates_by_type: dict[str, list[dict]] = field(default_factory=dict)
+    npc_ids: list[str] = field(default_factory=list)
+
+
+def _template(i: int, rng: random.Random, npc_ids: list[str]) -> dict:
+    qtype = QUEST_TYPES[i % len(QUEST_TYPES)]
+    channel = QUEST_CHANNEL_BASE + (i % 50)
+    t = {
+        "quest_id": f"synthetic_{qtype.lower()}_{i}",
+        "name": f"Synthetic {qtype.title()} Quest #{i}",
+        "type": qtype,
+        "points": 5,
+        "summary": "A generated quest for load testing.",
+        "details": "Generated.",
+        "tags": [qtype.lower(), rng.choice(["npc", "travel", "training", "errand"])],
+        # ~25% of templates are role-gated
+        "allowed_roles": [rng.choice(RP_ROLE_IDS)] if rng.random() < 0.25 else [],
+        "required_channel_id": channel,
+    }
+    if qtype == "SOCIAL":
+        t["npc_id"] = rng.choice(npc_ids)
+    elif qtype == "SKILL":
+        t["dc"] = rng.randint(5, 15)
+        t["npc_id"] = rng.choice(npc_ids)
+    elif qtype == "FETCH":
+        t["item_name"] = f"Parcel #{i}"
+        t["source_channel_id"] = channel
+        t["turnin_channel_id"] = channel + 1
+    return t
+
+
+def _npc(npc_id: str) -> dict:
+    return {
+        "npc_id": npc_id,
+        "name": npc_id.title(),
+        "avatar_url": f"https://cdn.example/npcs/{npc_id}.png",
+        "greetings": ["Well met.", "Ah, a visitor."],
+        "idle_lines": ["..."],
+        "quest_dialogue": {qt: [f"{qt.title()} done, well met."] for qt in QUEST_TYPES},
+        "default_reply": "Hm.",
+        "personality": "synthetic",
+    }
+
+
+def _season_state() -> dict:
+    votes = {fid: {"attack": [], "defend": [], "heal": [], "power": []} for fid in FACTION_IDS}
+    return {
+        "active": True,
+        "day": 2,
+        "max_days": 7,
+        "started_on": str(date.today()),
+        "ended_reason": None,
+        "date": str(date.today()),
+        "difficulty": "normal",
+        "boss_type": "seasonal",
+        "boss": {"name": "Synthetic Colossus", "hp": 50_000, "max_hp": 50_000, "avatar_url": ""},
+        "votes": votes,
+        "faction_health": {fid: {"hp": 5_000, "max_hp": 5_000} for fid in FACTION_IDS},
+        "faction_powers": {fid: {"unlocked": True, "used": False} for fid in FACTION_IDS},
+        "alive_factions": list(FACTION_IDS),
+        "embed": {"channel_id": SEASON_CHANNEL_ID, "message_id": None},
+    }
+
+
+def generate_guild(
+    data_dir: str,
+    players: int = 1000,
+    templates: int = 200,
+    npcs: int = 20,
+    seed: int = 1234,
+) -> SyntheticGuild:
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+
+    npc_ids = [f"npc_{i}" for i in range(npcs)] + ["trinity", "grimbald"]
+    npc_data = {nid: _npc(nid) for nid in npc_ids}
+
+    template_data = {}
+    by_type: dict[str, list[dict]] = {qt: [] for qt in QUEST_TYPES}
+    for i in range(templates):
+        t = _template(i, rng, npc_ids)
+        template_data[t["quest_id"]] = t
+        by_type[t["type"]].append(t)
+
+    player_data = {}
+    player_ids = []
+    player_roles = {}
+    for i in range(players):
+        uid = FIRST_USER_ID + i
+        faction = FACTION_IDS[i % len(FACTION_IDS)]
+        roles = [FACTION_ROLE_IDS[faction]] + rng.sample(RP_ROLE_IDS, k=rng.randint(0, 2))
+        player_ids.append(uid)
+        player_roles[uid] = roles
+        player_data[str(uid)] = {
+            "user_id": uid,
+            "daily_quest": {},
+            "inventory": {},
+            "faction_id": faction,
+            "lifetime_completed": rng.randint(0, 60),
+            "season_completed": rng.randint(0, 20),
+            "monsters_season": rng.randint(0, 10),
+            "monsters_lifetime": rng.randint(0, 40),
+            "xp": rng.randint(0, 99),
+            "level": rng.randint(1, 12),
+            "badges": ["quest_initiate"],
+            "season_victories": [],
+            "title": None,
+        }
+
+    board = {
+        "season_id": "synthetic_season",
+        "global_points": 0,
+        "faction_points": {fid: 0 for fid in FACTION_IDS},
+        "faction_goal": 250,
+        "display_channel_id": BOARD_CHANNEL_ID,
+        "message_id": None,
+        "season_goal": 10_000,
+        "season_reward": "Bragging rights",
+    }
+
+    files = {
+        "players.json": player_data,
+        "quests.json": template_data,
+        "npcs.json": npc_data,
+        "quest_board.json": board,
+        "seasonal_event.json": _season_state(),
+    }
+    for name, payload in files.items():
+        with open(os.path.join(data_dir, name), "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=4)
+
+    return SyntheticGuild(
+        data_dir=data_dir,
+        player_ids=player_ids,
+        player_roles=player_roles,
+        templates_by_type=by_type,
+        npc_ids=npc_ids,
+    )
@@ -0,0 +1,96 @@
+"""
+Checks the epoch-stamped season reset against the old eager reset.
+
+Both models see the same random stream of quest completions, monster
+kills, season resets and save/load round-trips; after every step the
+per-player seasonal counters and the scoreboard totals must match.
+
+    python -m benchmarks.verify_season_epoch --players 2000 --steps 20000
+"""
+import argparse
+import random
+import sys
+import time
+
+from systems.quests import season_epoch
+from systems.quests.player_state import PlayerState
+from systems.quests.quest_board import QuestBoard
+
+
+def run(players: int, steps: int, seed: int) -> int:
+    rng = random.Random(seed)
+    season_epoch.set_current(0)
+    board = QuestBoard()
+
+    lazy = {uid: PlayerState(user_id=uid) for uid in range(players)}
+    eager = {uid: {"season_completed": 0, "monsters_season": 0, "lifetime": 0} for uid in range(players)}
+
+    resets = 0
+    lazy_reset_s = eager_reset_s = 0.0
+
+    for step in range(steps):
+        roll = rng.random()
+        uid = rng.randrange(players)
+
+        if roll < 0.60:
+            lazy[uid].season_completed += 1
+            lazy[uid].lifetime_completed += 1
+            eager[uid]["season_completed"] += 1
+            eager[uid]["lifetime"] += 1
+        elif roll < 0.95:
+            n = rng.randint(1, 3)
+            lazy[uid].monsters_season += n
+            eager[uid]["monsters_season"] += n
+        elif roll < 0.999:
+            # Save/load round-trip of one profile
+            lazy[uid] = PlayerState.from_dict(lazy[uid].to_dict())
+        else:
+            resets += 1
+            t0 = time.perf_counter()
+            board.reset_season(f"season_{resets}")
+            lazy_reset_s += time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            for p in eager.values():
+                p["season_completed"] = 0
+                p["monsters_season"] = 0
+            eager_reset_s += time.perf_counter() - t0
+
+        if step % 997 == 0 or step == steps - 1:
+            for pid in range(players):
+                got = (lazy[pid].season_completed, lazy[pid].monsters_season, lazy[pid].lifetime_completed)
+                want = (eager[pid]["season_completed"], eager[pid]["monsters_season"], eager[pid]["lifetime"])
+                if got != want:
+                    print(f"MISMATCH at step {step}, player {pid}: lazy={got} eager={want}")
+                    return 1
+
+    totals_lazy = (
+        sum(p.season_completed for p in lazy.values()),
+        sum(p.monsters_season for p in lazy.values()),
+    )
+    totals_eager = (
+        sum(p["season_completed"] for p in eager.values()),
+        sum(p["monsters_season"] for p in eager.values()),
+    )
+    if totals_lazy != totals_eager:
+        print(f"TOTALS MISMATCH: lazy={totals_lazy} eager={totals_eager}")
+        return 1
+
+    print(f"OK — {players} players, {steps} steps, {resets} season resets")
+    print(f"   season totals (completed, monsters): {totals_lazy}")
+    if resets:
+        print(f"   avg reset: epoch {lazy_reset_s / resets * 1e6:.1f} µs vs eager {eager_reset_s / resets * 1e6:.1f} µs")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify lazy epoch resets match eager resets")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    sys.exit(run(args.players, args.steps, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,41 +7,70 @@ from discord.ext import commands
 import io
 import json
 import asyncio
+from collections import Counter
 from datetime import datetime, timedelta, timezone
-from systems.seasonal.state import BASE_ATTACK_DAMAGE
 from systems.seasonal.views import SeasonalEndedView
 from systems.seasonal.state import (
     get_season_state,
-    resolve_daily_boss,
-    reset_votes_for_new_day,
     reset_season_state,
 )
 from systems.seasonal.storage import save_season
 from systems.seasonal.views import build_seasonal_embed, SeasonalVoteView
 from systems.quests.factions import FACTION_ROLE_IDS
-from systems.seasonal.state import sync_power_unlocks_from_board
-from systems.seasonal.state import DIFFICULTY_PRESETS
 from systems.quests.npc_models import get_npc_quest_dialogue
 from systems.quests.quest_manager import QuestManager
+from systems.quests.xp_curve import set_active_curve
+from systems.quests.watcher import DataFileWatcher
 from systems.quests.quest_models import QuestType, QuestTemplate
 from systems.quests.factions import get_faction, FACTIONS
 from systems.quests.npc_models import NPC
 from systems.quests import storage
+from systems.quests import importer
 from systems.quests.storage import QUESTS_FILE
 from discord import app_commands
 from datetime import date
 from systems.seasonal.views import build_seasonal_embed, SeasonalVoteView
 from systems.seasonal.state import get_season_state
-from systems.quests.factions import get_member_faction_id
 from systems.seasonal.storage import load_season, save_season
+from systems.seasonal import archive as season_archive
 from systems.badges.definitions import BADGES
 from systems.quests.quest_manager import evaluate_join_date_badges
 from discord import app_commands
 from systems.quests.wandering import WanderingEventManager
+from systems.quests.wandering.views import WanderingEventView
+from systems.engine import GameEngine, QUEST_POINTS
+from systems.engine.board import (
+    effective_goal,
+    get_crown_holder,
+    make_progress_bar,
+    percent_of_goal,
+)
+from systems.engine.season import expected_votes_for_members
+from systems.engine.wandering import SPAWN_HOURS
+from systems import clock
+from systems.outbound import Priority, outbound, webhook_route
+from systems.outbound.anchors import anchors
+from systems.outbound.announcements import AnnouncementBatcher
+from systems.outbound.points_log import PointsLogAggregator
+from systems.stats import activity
+from systems.listing import Listing, make_filter
+from systems.listing.views import send_listing
+from systems.autocomplete import LiveIndex
+from systems.perf.recorder import InteractionRecorder
+from systems.stats.report import format_daily_report, history_line, quest_sparkline, summary_lines
+from systems.startup import (
+    StartupTimer,
+    command_sync_needed,
+    command_tree_hash,
+    remember_command_sync,
+)
 from typing import Literal
 from datetime import datetime, timedelta, timezone
 
 
+startup_timer = StartupTimer()
+
+
 # ========= Constants / IDs =========
 
 # Env
@@ -49,25 +78,58 @@ TOKEN = os.getenv("DISCORD_TOKEN")
 GUILD_ID = int(os.getenv("GUILD_ID", 0))
 POINTS_LOG_CHANNEL_ID = int(os.getenv("POINTS_LOG_CHANNEL_ID", 0))
 BADGE_ANNOUNCE_CHANNEL_ID = int(os.getenv("BADGE_ANNOUNCE_CHANNEL_ID", 0))
-GRIMBALD_ROLE_ID = int(os.getenv("GRIMBALD_ROLE_ID"))
+GRIMBALD_ROLE_ID = int(os.getenv("GRIMBALD_ROLE_ID", 0))
 TAVERN_CHANNEL_ID = int(os.getenv("TAVERN_CHANNEL_ID", 0))
 LUNETH_VALE_CHANNEL_ID = int(os.getenv("LUNETH_VALE_CHANNEL_ID", 0))
 WANDERING_PING_ROLE_ID = int(os.getenv("WANDERING_PING_ROLE_ID", 0))
-QUEST_POINTS = 5
-DAILY_QUEST_COMPLETIONS = 0
+# Comma-separated channels that each get their own wandering threat (default: Luneth Vale)
+WANDERING_CHANNEL_IDS = [int(c) for c in os.getenv("WANDERING_CHANNEL_IDS", "").split(",") if c.strip()]
+# Spawn at the best-attended hours from hunt history instead of the fixed SPAWN_HOURS
+WANDERING_AUTO_HOURS = os.getenv("WANDERING_AUTO_HOURS", "0") == "1"
+DAILY_PREASSIGN = os.getenv("DAILY_PREASSIGN", "1") == "1"
+# Poll quests.json / npcs.json for hand edits every N seconds (0 = off)
+DATA_WATCH_SECONDS = float(os.getenv("DATA_WATCH_SECONDS", 0))
+
+# Quest Manager (data files are loaded concurrently in setup_hook)
+quest_manager = QuestManager(autoload=False)
+
+# Discord-free game rules; handlers below are thin adapters over it
+engine = GameEngine(quest_manager)
+
+# Points-log lines are buffered and posted as combined messages
+points_log = PointsLogAggregator(
+    POINTS_LOG_CHANNEL_ID,
+    flush_seconds=float(os.getenv("POINTS_LOG_FLUSH_SECONDS", 60)),
+)
+
+# Badge / level-up posts are grouped into Trinity digests
+announcements = AnnouncementBatcher(
+    BADGE_ANNOUNCE_CHANNEL_ID,
+    author=lambda: quest_manager.get_npc("trinity"),
+    window_seconds=float(os.getenv("ANNOUNCE_WINDOW_SECONDS", 15)),
+)
 
-# Quest Manager
-quest_manager = QuestManager()
-print("QUEST MANAGER INITIALIZED")
+# Hand edits to quests.json / npcs.json are picked up without a restart
+data_watcher = DataFileWatcher(quest_manager, poll_seconds=DATA_WATCH_SECONDS) if DATA_WATCH_SECONDS > 0 else None
+
+def log_data_reload(diff):
+    points_log.add(f"🔄 **{diff.kind.title()} reloaded** — {diff.summary()}")
+
+quest_manager.add_reload_listener(log_data_reload)
+
+# Optional anonymised interaction log for offline replay (INTERACTION_RECORD_PATH)
+interaction_recorder = InteractionRecorder.from_env(guild_id=GUILD_ID)
 
 wandering_manager = WanderingEventManager(
     quest_manager=quest_manager,
     luneth_channel_id=LUNETH_VALE_CHANNEL_ID,
+    points_log=points_log,
+    announcements=announcements,
+    channel_ids=WANDERING_CHANNEL_IDS,
+    auto_hours=WANDERING_AUTO_HOURS,
+    guild_id=GUILD_ID,
 )
 
-if not TOKEN or not GUILD_ID:
-    raise ValueError("Missing DISCORD_TOKEN or GUILD_ID environment variable.")
-
 
 # ========= Bot Setup =========
 
@@ -121,30 +183,22 @@ GUILD_HERO_STRIKES = [
 def roll_guild_hero_strike() -> dict:
     return random.choice(GUILD_HERO_STRIKES)
 
+def member_role_ids(member) -> list[int]:
+    return [role.id for role in getattr(member, "roles", [])]
+
 
 async def update_seasonal_embed(bot):
     state = get_season_state()
     embed_info = state.get("embed", {})
 
-    channel_id = embed_info.get("channel_id")
-    message_id = embed_info.get("message_id")
-
-    if not channel_id or not message_id:
-        return
-
-    channel = bot.get_channel(channel_id)
-    if not channel:
+    if not embed_info.get("channel_id") or not embed_info.get("message_id"):
         return
 
     try:
-        message = await channel.fetch_message(message_id)
-
         # 🧠 Choose view based on event state
-        view = SeasonalVoteView() if state.get("active") else SeasonalEndedView()
-
-        await message.edit(embed=build_seasonal_embed(), view=view)
-
+        view = SeasonalVoteView if state.get("active") else SeasonalEndedView
 
+        await anchors.edit("seasonal", embed=build_seasonal_embed, view=view)
 
     except Exception as e:
         print(f"[SEASON] Failed to update embed: {e}")
@@ -166,154 +220,40 @@ def estimate_expected_daily_votes(
         if role:
             total_members += len(role.members)
 
+    return expected_votes_for_members(total_members, participation_rate)
 
-    # Safety floor so small servers don’t break
-    return max(5, int(total_members * participation_rate))
+def post_daily_activity_reports():
+    """Report every closed day since the last report (catches up after downtime)."""
+    for day in activity.unreported_days(clock.today()):
+        points_log.add(format_daily_report(day, activity.day_totals(day)))
+        activity.mark_reported(day)
 
 async def seasonal_midnight_loop(bot: discord.Client):
-    global DAILY_QUEST_COMPLETIONS
-
-    # 📊 Log daily quest completions
-    log_channel = bot.get_channel(POINTS_LOG_CHANNEL_ID)
-    if log_channel:
-        await log_channel.send(
-            f"📊 **Daily Quest Report**\n"
-            f"• Date (UTC): {date.today()}\n"
-            f"• Quests Completed: **{DAILY_QUEST_COMPLETIONS}**"
-        )
-
-    # 🔄 Reset counter
-    DAILY_QUEST_COMPLETIONS = 0
     await bot.wait_until_ready()
 
+    # 📊 Days that closed while the bot was down
+    post_daily_activity_reports()
+
     while not bot.is_closed():
         await sleep_until_midnight_utc()
 
-        state = get_season_state()
-
-        # Do nothing if season is inactive
-        if not state.get("active"):
-            continue
-
-        # 🔥 Resolve the day
-        summary = resolve_daily_boss(state)
-
-        state["last_net_damage"] = summary.get("net_damage", 0)
-        state["last_retaliation"] = summary.get("retaliation_applied", 0)
+        # 📊 Yesterday's activity, from the rollups
+        post_daily_activity_reports()
 
-        # 📅 Advance the day counter (day starts at 1)
-        state["day"] = int(state.get("day", 1)) + 1
-
-        # ⏳ Time limit: if the boss is still alive after max_days, the boss wins
-        max_days = int(state.get("max_days", 0) or 0)
-        if (
-            state.get("active")
-            and max_days > 0
-            and state["day"] > max_days
-            and state.get("ended_reason") is None
-        ):
-            state["active"] = False
-            state["ended_reason"] = "time_expired"
-
-        # 🔄 Reset votes for the new day
-        if state.get("active"):
-            reset_votes_for_new_day(state)
+        # 📜 Hand out today's quests in one batch instead of one save per /quest
+        if DAILY_PREASSIGN:
+            result = quest_manager.preassign_daily()
+            print(
+                f"[PREASSIGN] {result['assigned']} quests assigned across {result['classes']} role classes "
+                f"({result['inactive']} inactive, {result['no_eligible']} without eligible quests)"
+            )
 
-        # 💾 Persist state
-        save_season(state)
+        # 🔥 Resolve the day (no-op if season is inactive)
+        if engine.resolve() is None:
+            continue
 
         # 🖼️ Update embed if it exists
-        embed_info = state.get("embed", {})
-        channel_id = embed_info.get("channel_id")
-        message_id = embed_info.get("message_id")
-
-        if channel_id and message_id:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                try:
-                    message = await channel.fetch_message(message_id)
-                    view = SeasonalVoteView() if state.get("active") else SeasonalEndedView()
-                    await message.edit(embed=build_seasonal_embed(), view=view)
-
-                except Exception as e:
-                    print(f"[SEASON] Failed to update embed: {e}")
-
-def initialize_season_boss_and_factions(
-    state: dict,
-    expected_votes: int,
-    target_days: int = 7,
-    difficulty: str = "normal",
-):
-    sync_power_unlocks_from_board(state, quest_manager.quest_board)
-
-    preset = DIFFICULTY_PRESETS.get(difficulty, DIFFICULTY_PRESETS["normal"])
-    state["difficulty"] = difficulty
-
-    # Assume not all votes are attacks
-    expected_attack_votes = max(1, int(expected_votes * 0.45))
-
-    padding = 1.1 if target_days == 5 else 1.25
-
-    base_boss_hp = int(
-        expected_attack_votes
-        * BASE_ATTACK_DAMAGE
-        * target_days
-        * padding
-    )
-
-    boss_hp = int(base_boss_hp * preset["boss_hp_multiplier"])
-    boss_hp = max(500, boss_hp)
-
-    state["boss"]["hp"] = boss_hp
-    state["boss"]["max_hp"] = boss_hp
-
-    # Faction HP should survive ~2–3 strong retaliation hits
-    base_faction_hp = max(
-        300,
-        expected_attack_votes * 60
-    )
-
-    faction_hp = int(base_faction_hp * preset["faction_hp_multiplier"])
-
-    for fid in state["faction_health"]:
-        state["faction_health"][fid]["hp"] = faction_hp
-        state["faction_health"][fid]["max_hp"] = faction_hp
-
-
-    # Reset faction power usage
-    for fp in state["faction_powers"].values():
-        fp["used"] = False
-
-    # Mark season active
-    state["active"] = True
-    state["max_days"] = int(target_days)
-    state["started_on"] = str(date.today())
-    state["ended_reason"] = None
-    state["day"] = 1
-
-    # 🟢 New boss = everyone alive again
-    state["alive_factions"] = {
-        fid
-        for fid, fh in state.get("faction_health", {}).items()
-        if fh["hp"] > 0
-    }
-
-
-
-def make_progress_bar(value: int, max_value: int, length: int = 20) -> str:
-    """Simple text progress bar for embeds."""
-    if max_value <= 0:
-        max_value = 1
-
-    ratio = max(0.0, min(1.0, value / max_value))
-    filled = int(ratio * length)
-    empty = length - filled
-    return f"[{'█' * filled}{'░' * empty}]"
-
-def get_crown_holder(faction_points: dict[str, int]) -> str | None:
-    if not faction_points:
-        return None
-    return max(faction_points.items(), key=lambda x: x[1])[0]
+        await update_seasonal_embed(bot)
 
 def build_board_embed():
     """Build the quest board embed including faction standings."""
@@ -325,7 +265,7 @@ def build_board_embed():
     monsters_completed = stats["season_monsters_completed"]
 
     # Use board.season_goal but default to 100 if something weird
-    season_goal = board.season_goal if getattr(board, "season_goal", 0) > 0 else 100
+    season_goal = effective_goal(getattr(board, "season_goal", 0), 100)
     progress_bar = make_progress_bar(global_points, season_goal)
 
     # Build description including season name + reward text
@@ -342,11 +282,7 @@ def build_board_embed():
     )
 
     # Global progress
-    # Prevent division by zero
-    if season_goal > 0:
-        pct = (global_points / season_goal) * 100
-    else:
-        pct = 0
+    pct = percent_of_goal(global_points, season_goal)
 
     pct_text = f"{pct:.1f}%"  # one decimal place, e.g., 4.2%
 
@@ -372,7 +308,7 @@ def build_board_embed():
     # Faction standings
     faction_points = board.faction_points or {}
 
-    faction_goal = board.faction_goal if getattr(board, "faction_goal", 0) > 0 else 250
+    faction_goal = effective_goal(getattr(board, "faction_goal", 0), 250)
 
     for faction_id, fac in FACTIONS.items():
         pts = faction_points.get(faction_id, 0)
@@ -549,13 +485,11 @@ async def refresh_quest_board(bot: commands.Bot):
         return
 
     try:
-        channel = bot.get_channel(board.display_channel_id)
-        if channel is None:
-            channel = await bot.fetch_channel(board.display_channel_id)
-
-        msg = await channel.fetch_message(board.message_id)
-        embed = build_board_embed()
-        await msg.edit(embed=embed, view=QuestBoardView())
+        # Queued + coalesced: a burst of completions becomes one edit,
+        # built from the latest scores when it is actually sent.
+        # A deleted board is reposted by the anchor registry.
+        if not await anchors.edit("quest_board", embed=build_board_embed, view=QuestBoardView):
+            return
 
         # --------------------------------------------------
         # 🔄 SYNC FACTION POWER UNLOCKS → SEASONAL STATE
@@ -578,14 +512,6 @@ async def refresh_quest_board(bot: commands.Bot):
             if state.get("active"):
                 await update_seasonal_embed(bot)
 
-    except discord.NotFound:
-        # 🔥 AUTO-HEAL: message was deleted
-        print("⚠ Quest board message missing. Clearing anchor.")
-
-        board.display_channel_id = None
-        board.message_id = None
-        quest_manager.save_board()
-
     except discord.Forbidden as e:
         print("⚠ Quest board forbidden:", e)
 
@@ -681,70 +607,10 @@ async def _ensure_active_daily(interaction, expected_type=None, create_if_missin
 
     return player, template
 
-def validate_quest_data(quests: dict) -> tuple[bool, str]:
-    """Validate quest JSON before import."""
-
-    for qid, q in quests.items():
-        if not isinstance(q, dict):
-            return False, f"Quest '{qid}' must be an object."
-
-        # Required fields
-        required = ["quest_id", "name", "type"]
-        for field in required:
-            if field not in q:
-                return False, f"Quest '{qid}' missing required field '{field}'."
-
-        # Validate type
-        if q["type"] not in QuestType.__members__:
-            return False, f"Quest '{qid}' has invalid type '{q['type']}'."
-
-        t = q["type"]
-
-        # Type-specific validation
-        if t == "SOCIAL":
-            if "npc_id" not in q:
-                return False, f"Social quest '{qid}' missing npc_id."
-
-        if t == "FETCH":
-            for f in ["item_name", "source_channel_id", "turnin_channel_id"]:
-                if f not in q:
-                    return False, f"Fetch quest '{qid}' missing '{f}'."
-
-        if t == "SKILL":
-            if "dc" not in q:
-                return False, f"Skill quest '{qid}' missing dc."
-
-
-        if t == "TRAVEL":
-            if "required_channel_id" not in q:
-                return False, f"Travel quest '{qid}' missing required_channel_id."
-
-    return True, "OK"
-
-def validate_npc_data(npcs: dict) -> tuple[bool, str]:
-    for npc_id, n in npcs.items():
-        if not isinstance(n, dict):
-            return False, f"NPC '{npc_id}' must be an object."
-
-        if "npc_id" not in n or "name" not in n:
-            return False, f"NPC '{npc_id}' missing npc_id or name."
-
-        # Validate lists/dicts
-        if "greetings" in n and not isinstance(n["greetings"], list):
-            return False, f"NPC '{npc_id}' greetings must be a list."
-
-        if "idle_lines" in n and not isinstance(n.get("idle_lines", []), list):
-            return False, f"NPC '{npc_id}' idle_lines must be a list."
-
-        if "quest_dialogue" in n and not isinstance(n["quest_dialogue"], dict):
-            return False, f"NPC '{npc_id}' quest_dialogue must be a dict."
-
-    return True, "OK"
-
 async def send_daily_quest(interaction: discord.Interaction):
     user = interaction.user
     user_id = user.id
-    today = str(date.today())
+    today = str(clock.today())
 
     # Get or create player FIRST
     player = quest_manager.get_or_create_player(user_id)
@@ -768,16 +634,18 @@ async def send_daily_quest(interaction: discord.Interaction):
         return
 
     # 📜 If they already have an active daily today, just show it
+    # (rollover pre-assignments go through assign() to re-check changed roles)
     if (
         player.daily_quest
         and player.daily_quest.get("assigned_date") == today
         and not player.daily_quest.get("completed")
+        and not player.daily_quest.get("preassigned")
+        and not player.daily_quest.get("template_removed")
     ):
         quest_id = player.daily_quest.get("quest_id")
     else:
         # ✅ SAFE: assign a new daily quest
-        role_ids = [role.id for role in getattr(user, "roles", [])]
-        quest_id = quest_manager.assign_daily(user_id, role_ids)
+        quest_id = engine.assign(user_id, member_role_ids(user))
 
         if quest_id is None:
             await interaction.followup.send(
@@ -960,84 +828,90 @@ async def send_npc_response(
 )
 
 async def log_admin_action(bot, message: str):
-    channel = bot.get_channel(POINTS_LOG_CHANNEL_ID)
-    if channel:
-        await channel.send(message)
+    points_log.add(message)
 
-def dict_autocomplete(source_dict, label_fn=None):
-    async def _autocomplete(interaction, current: str):
-        results = []
-        for key, value in source_dict.items():
-            if current.lower() in key.lower():
-                label = (
-                    label_fn(key, value)
-                    if label_fn
-                    else key
-                )
-                results.append(
-                    app_commands.Choice(name=label, value=key)
-                )
-        return results[:25]
-    return _autocomplete
+# ---------- Autocomplete indexes (read-only: never create or save anything) ----------
 
-async def title_autocomplete(interaction, current: str):
-    player = quest_manager.get_or_create_player(interaction.user.id)
+def _choice_label(text: str) -> str:
+    return text if len(text) <= 100 else text[:99] + "…"
 
-    choices = []
-    for badge_id in player.badges:
-        badge = BADGES.get(badge_id)
-        if not badge:
-            continue
+# Bumped when a member's display name changes (player-name index version)
+member_name_changes = 0
 
-        title = badge["name"]
-        if current.lower() in title.lower():
-            choices.append(
-                app_commands.Choice(name=title, value=title)
-            )
 
-    return choices[:25]
+def _player_name_entries():
+    guild = bot.get_guild(GUILD_ID)
+    for uid in list(quest_manager.players):
+        member = guild.get_member(uid) if guild else None
+        label = f"{member.display_name} (@{member.name})" if member else f"Unknown member {uid}"
+        yield str(uid), label
 
-badge_autocomplete = dict_autocomplete(
-    BADGES,
-    lambda k, v: f"{k} — {v['name']}"
+
+def _archive_index_stamp():
+    try:
+        return os.stat(season_archive.ARCHIVE_INDEX_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+BADGE_INDEX = LiveIndex(lambda: ((k, f"{k} — {v['name']}") for k, v in BADGES.items()), lambda: len(BADGES))
+TITLE_INDEX = LiveIndex(lambda: ((v["name"], v["name"]) for v in BADGES.values()), lambda: len(BADGES))
+QUEST_INDEX = LiveIndex(
+    lambda: ((qid, f"{qid} — {t.name}") for qid, t in quest_manager.quest_templates.items()),
+    lambda: quest_manager.versions["templates"],
+)
+NPC_INDEX = LiveIndex(
+    lambda: ((npc_id, f"{npc_id} — {npc.name}") for npc_id, npc in quest_manager.npcs.items()),
+    lambda: quest_manager.versions["npcs"],
+)
+PLAYER_INDEX = LiveIndex(_player_name_entries, lambda: (len(quest_manager.players), member_name_changes))
+SEASON_INDEX = LiveIndex(
+    lambda: {(e["season_id"], e["season_id"]) for e in season_archive.load_index().values()},
+    _archive_index_stamp,
 )
 
-async def handle_progression_announcements(guild, member, result):
-    channel = guild.get_channel(BADGE_ANNOUNCE_CHANNEL_ID)
-    if not channel:
-        return
 
-    trinity = quest_manager.get_npc("trinity")
-    if not trinity:
-        return
+def index_autocomplete(index: LiveIndex):
+    async def _autocomplete(interaction, current: str):
+        return [
+            app_commands.Choice(name=_choice_label(label), value=value)
+            for value, label in index.search(current)
+        ]
+    return _autocomplete
 
-    # 🏅 Badge announcement
-    if result.get("new_badges"):
-        embed = discord.Embed(
-            description=(
-                f"🏅 **{member.display_name}** has earned a new guild badge!\n\n"
-                + "\n".join(
-                    f"{BADGES[b]['emoji']} **{BADGES[b]['name']}**"
-                    for b in result["new_badges"]
-                    if b in BADGES
-                )
-            ),
-            color=discord.Color.gold(),
-        )
-        embed.set_author(name=trinity.name, icon_url=trinity.avatar_url)
-        await channel.send(embed=embed)
+async def title_autocomplete(interaction, current: str):
+    # Read-only: someone without a profile simply has no titles yet
+    player = quest_manager.get_player(interaction.user.id)
+    if not player:
+        return []
 
-    # 🌟 Level-up announcement
-    if result.get("level_up"):
-        embed = discord.Embed(
-            description=(
-                f"🌟 **{member.display_name}** has reached "
-                f"**Level {result['level_up']}**!"
-            ),
-            color=discord.Color.blurple(),
-        )
-        embed.set_author(name=trinity.name, icon_url=trinity.avatar_url)
-        await channel.send(embed=embed)
+    owned = {BADGES[b]["name"] for b in player.badges if b in BADGES}
+    return [
+        app_commands.Choice(name=title, value=title)
+        for title, _ in TITLE_INDEX.search(current, allowed=owned)
+    ]
+
+badge_autocomplete = index_autocomplete(BADGE_INDEX)
+quest_id_autocomplete = index_autocomplete(QUEST_INDEX)
+npc_id_autocomplete = index_autocomplete(NPC_INDEX)
+player_autocomplete = index_autocomplete(PLAYER_INDEX)
+archived_season_autocomplete = index_autocomplete(SEASON_INDEX)
+
+
+def refresh_search_indexes(diff):
+    # Rebuild ahead of the next keystroke (in a thread for big maps)
+    (QUEST_INDEX if diff.kind == "templates" else NPC_INDEX).refresh()
+
+quest_manager.add_reload_listener(refresh_search_indexes)
+
+async def handle_progression_announcements(guild, member, result):
+    # Batched into one Trinity digest per window (see AnnouncementBatcher)
+    announcements.add(
+        member.id,
+        member.display_name,
+        badges=result.get("new_badges") or (),
+        level=result.get("level_up"),
+    )
 
 def detect_tavern_intent(text: str) -> str:
     if not text:
@@ -1150,11 +1024,16 @@ async def send_as_npc(
 ):
     webhook = await get_npc_webhook(channel, npc.name)
 
-    await webhook.send(
-        content,
-        username=npc.name,
-        avatar_url=npc.avatar_url,
-        allowed_mentions=discord.AllowedMentions.none()
+    # Direct reply to a member — jumps ahead of queued embeds/logs
+    await outbound.submit(
+        Priority.INTERACTION,
+        webhook_route(webhook.id),
+        lambda: webhook.send(
+            content,
+            username=npc.name,
+            avatar_url=npc.avatar_url,
+            allowed_mentions=discord.AllowedMentions.none()
+        ),
     )
 
 def strip_grimbald_mention(message: discord.Message) -> str:
@@ -1203,32 +1082,8 @@ async def season_resolve_now(interaction: discord.Interaction):
             ephemeral=True,
         )
 
-    # 🔥 Resolve immediately
-    summary = resolve_daily_boss(state)
-
-    # ✅ Store yesterday summary for the embed
-    state["last_net_damage"] = int(summary.get("net_damage", 0) or 0)
-    state["last_retaliation"] = int(summary.get("retaliation_applied", 0) or 0)
-    state["last_retaliation_target"] = summary.get("retaliation_target")  # optional
-
-    # ✅ Keep day progression consistent with midnight loop
-    state["day"] = int(state.get("day", 1)) + 1
-
-    max_days = int(state.get("max_days", 0) or 0)
-    if (
-        state.get("active")
-        and max_days > 0
-        and state["day"] > max_days
-        and state.get("ended_reason") is None
-    ):
-        state["active"] = False
-        state["ended_reason"] = "time_expired"
-        
-    # 🔄 FORCE reset votes (important)
-    reset_votes_for_new_day(state, force=True)
-
-    # 💾 Save
-    save_season(state)
+    # 🔥 Resolve immediately (advances the day + FORCE resets votes)
+    summary = engine.resolve(force_vote_reset=True)
 
     # 🖼️ EDIT the existing seasonal embed
     await update_seasonal_embed(bot)
@@ -1250,21 +1105,14 @@ async def season_event(interaction: discord.Interaction):
     view = SeasonalVoteView()
 
     # If we already have a message, edit it
-    if state["embed"]["channel_id"] and state["embed"]["message_id"]:
-        try:
-            channel = interaction.client.get_channel(state["embed"]["channel_id"])
-            if channel is None:
-                channel = await interaction.client.fetch_channel(state["embed"]["channel_id"])
-
-            msg = await channel.fetch_message(state["embed"]["message_id"])
-            await msg.edit(embed=embed, view=view)
-
+    try:
+        if await anchors.edit("seasonal", force=True, embed=embed, view=view):
             return await interaction.response.send_message(
                 "🔄 Seasonal event updated.",
                 ephemeral=True,
             )
-        except Exception:
-            pass  # Fall through to repost
+    except Exception:
+        pass  # Fall through to repost
 
     # Otherwise post new
     await interaction.response.send_message(embed=embed, view=view)
@@ -1539,7 +1387,7 @@ async def season_boss_set(
         # Minor bosses are shorter
         target_days = 5 if boss_type.value == "minor" else 7
 
-        initialize_season_boss_and_factions(
+        engine.start_season(
             state,
             votes,
             target_days=target_days,
@@ -1576,15 +1424,10 @@ async def season_boss_set(
     save_season(state)
 
     # Update embed if posted
-    embed_data = state.get("embed", {})
-    if embed_data.get("channel_id") and embed_data.get("message_id"):
-        channel = interaction.client.get_channel(embed_data["channel_id"])
-        if channel:
-            try:
-                msg = await channel.fetch_message(embed_data["message_id"])
-                await msg.edit(embed=build_seasonal_embed(), view=SeasonalVoteView())
-            except Exception:
-                pass
+    try:
+        await anchors.edit("seasonal", force=True, embed=build_seasonal_embed, view=SeasonalVoteView)
+    except Exception:
+        pass
 
     # Log change
     await log_admin_action(
@@ -1601,13 +1444,14 @@ async def season_boss_set(
         ephemeral=True,
     )
 
-@bot.tree.command(name="quest_admin_spawn_event", description="Admin: Spawn a wandering event in Luneth Vale.")
+@bot.tree.command(name="quest_admin_spawn_event", description="Admin: Spawn a wandering event (Luneth Vale unless a channel is given).")
 @app_commands.default_permissions(manage_guild=True)
 async def quest_admin_spawn_event(
     interaction: discord.Interaction,
     difficulty: Literal["test", "minor", "standard", "major", "critical"],
     title: str,
     description: str,
+    channel: discord.TextChannel | None = None,
 ):
     try:
         await wandering_manager.spawn(
@@ -1615,12 +1459,92 @@ async def quest_admin_spawn_event(
             title=title,
             description=description,
             difficulty=difficulty,
+            channel_id=channel.id if channel else None,
         )
         await interaction.response.send_message("✅ Wandering event spawned.", ephemeral=True)
     except Exception as e:
         await interaction.response.send_message(f"⚠️ Could not spawn event: {e}", ephemeral=True)
 
 
+@bot.tree.command(name="quest_admin_wandering_history", description="Admin: Past wandering hunts, turnout by hour and hunter streaks.")
+@app_commands.default_permissions(manage_guild=True)
+async def quest_admin_wandering_history(interaction: discord.Interaction, member: discord.Member | None = None):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    history = wandering_manager.history
+    if not history.count:
+        return await interaction.response.send_message("ℹ️ No wandering hunts recorded yet.", ephemeral=True)
+
+    embed = discord.Embed(
+        title="🐲 Wandering Hunt History",
+        description=f"{history.count} hunts recorded",
+        color=discord.Color.dark_purple(),
+    )
+
+    recent = list(history.recent)[-5:][::-1]
+    embed.add_field(
+        name="Recent hunts",
+        value="\n".join(
+            f"{'✅' if r.success else '❌'} <t:{r.spawned_at}:f> **{r.title}** ({r.difficulty}) — "
+            f"{len(r.participants)}/{r.required} hunters"
+            for r in recent
+        ),
+        inline=False,
+    )
+
+    # A line per hour outgrows one 1024-char field once most hours have hunts
+    hour_fields, current = [], ""
+    for hour, stats in sorted(history.hours.items()):
+        line = f"`{hour:02d}:00` {stats.hunts} hunts • {stats.success_rate:.0%} won • {stats.turnout:.1f} hunters"
+        if current and len(current) + 1 + len(line) > 1024:
+            hour_fields.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    hour_fields.append(current)
+    for n, value in enumerate(hour_fields):
+        embed.add_field(
+            name="By spawn hour (UTC)" if n == 0 else "By spawn hour (cont.)",
+            value=value,
+            inline=False,
+        )
+
+    streaks = history.top_streaks(5)
+    if streaks:
+        embed.add_field(
+            name="Longest streaks",
+            value="\n".join(
+                f"<@{uid}> best **{p.best}** • now {history.current_streak(uid)} • {p.joins} hunts"
+                for uid, p in streaks
+            ),
+            inline=False,
+        )
+
+    current = wandering_manager.spawn_hours()
+    recommended = history.recommend_hours(SPAWN_HOURS)
+    embed.add_field(
+        name="Spawn hours (UTC)",
+        value=(
+            f"In use: {', '.join(map(str, current))}{' (auto)' if wandering_manager.auto_hours else ''}\n"
+            f"Best turnout: {', '.join(map(str, recommended))}"
+        ),
+        inline=False,
+    )
+
+    if member is not None:
+        p = history.players.get(member.id)
+        embed.add_field(
+            name=f"{member.display_name}",
+            value=(
+                f"{p.joins} hunts • current streak {history.current_streak(member.id)} • best {p.best}"
+                if p else "Has not joined a hunt yet."
+            ),
+            inline=False,
+        )
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
 
 # ========= ADMIN: Badge =========
 
@@ -1641,7 +1565,7 @@ async def badge_backfill_join_dates(interaction: discord.Interaction):
         scanned += 1
 
         player = quest_manager.get_or_create_player(member.id)
-        new_badges = evaluate_join_date_badges(member, player)
+        new_badges = evaluate_join_date_badges(member.joined_at, player)
 
         if new_badges:
             granted += len(new_badges)
@@ -1655,6 +1579,14 @@ async def badge_backfill_join_dates(interaction: discord.Interaction):
         ephemeral=True,
     )
 
+@bot.tree.command(name="badge_list", description="Admin: List badges and how many players hold each.")
+@app_commands.default_permissions(manage_guild=True)
+async def badge_list(interaction: discord.Interaction):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    await send_listing(interaction, BADGE_LISTING)
+
 @bot.tree.command(name="badge_grant", description="Admin: Grant a badge to a user.")
 @app_commands.autocomplete(badge_id=badge_autocomplete)
 @app_commands.default_permissions(manage_guild=True)
@@ -1816,7 +1748,7 @@ async def quest_admin_reset_daily(
 
     # Only reset the daily quest
     player.daily_quest = {}
-    storage.save_players(quest_manager.players)
+    quest_manager.save_players()
 
     await interaction.response.send_message(
         f"🟢 Daily quest reset for **{member.display_name}**.\n"
@@ -1851,11 +1783,111 @@ async def quest_admin_cleanup(interaction: discord.Interaction):
 async def ping(interaction: discord.Interaction):
     await interaction.response.send_message("🦊 Pong!", ephemeral=True)
 
+@bot.tree.command(name="perf_profile", description="Admin: Profile the live bot for N seconds (max 60).")
+@app_commands.default_permissions(manage_guild=True)
+async def perf_profile(interaction: discord.Interaction, seconds: int = 10):
+    # Imported on first use — keeps cProfile/tracemalloc out of startup
+    from systems.perf.profiler import (
+        ProfilerBusyError,
+        clamp_seconds,
+        is_profiling,
+        profile_event_loop,
+    )
+
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    if is_profiling():
+        return await interaction.response.send_message(
+            "⚠️ A profiling session is already running. Try again when it finishes.",
+            ephemeral=True,
+        )
+
+    seconds = clamp_seconds(seconds)
+    await interaction.response.defer(ephemeral=True)
+
+    try:
+        report = await profile_event_loop(seconds)
+    except ProfilerBusyError:
+        return await interaction.followup.send(
+            "⚠️ A profiling session is already running. Try again when it finishes.",
+            ephemeral=True,
+        )
+
+    files = [
+        discord.File(fp=io.BytesIO(report.stats_bytes), filename="perf_profile.pstats"),
+        discord.File(fp=io.BytesIO(report.report_text.encode("utf-8")), filename="perf_report.txt"),
+    ]
+
+    await interaction.followup.send(
+        content=f"🩺 Profiled the event loop for **{report.seconds:.1f}s**.",
+        files=files,
+        ephemeral=True,
+    )
+
+
+@bot.tree.command(name="stats", description="Admin: Guild activity for the last hour, today and recent days.")
+@app_commands.default_permissions(manage_guild=True)
+async def stats(interaction: discord.Interaction, days: app_commands.Range[int, 1, 14] = 7):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    today = clock.today()
+    hours = activity.hour_totals(24)
+
+    embed = discord.Embed(title="📊 Guild Activity", color=discord.Color.blurple())
+    embed.add_field(name="Last 60 minutes", value="\n".join(summary_lines(activity.recent(60))), inline=False)
+    embed.add_field(name=f"Today ({today}, UTC)", value="\n".join(summary_lines(activity.day_totals(today))), inline=False)
+    embed.add_field(name="Quests per hour (last 24h)", value=f"`{quest_sparkline(hours)}`", inline=False)
+
+    history = []
+    for offset in range(1, days + 1):
+        day = today - timedelta(days=offset)
+        history.append(history_line(day, activity.day_totals(day)))
+    embed.add_field(name=f"Previous {days} days", value="\n".join(history), inline=False)
+
+    render = outbound.render.stats
+    embed.add_field(
+        name="Outbound (since start)",
+        value=(
+            f"Sent {outbound.stats['sent']} • coalesced {outbound.stats['coalesced']} • "
+            f"dropped {outbound.stats['dropped']} • 429s {outbound.stats['rate_limited']}\n"
+            f"Embed edits {render['edited']} • avoided {outbound.render.avoided} "
+            f"({render['skipped_version']} by version, {render['skipped_hash']} by content)"
+        ),
+        inline=False,
+    )
+
+    if wandering_manager.last_resolution_report:
+        embed.add_field(
+            name="Last wandering resolution",
+            value=f"`{wandering_manager.last_resolution_report}`",
+            inline=False,
+        )
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 # ========= ADMIN: Import / Export =========
 
-@bot.tree.command(name="quest_import",description="ADMIN: Import Quest JSON file (overwrite or merge).")
+# One pack import at a time — each one commits against the live maps
+import_lock = asyncio.Lock()
+
+
+async def _send_import_report(interaction: discord.Interaction, report, header: str):
+    lines = report.issue_lines(15)
+    msg = header + ("\n```\n" + "\n".join(lines) + "\n```" if lines else "")
+    if len(msg) > 1900:
+        msg = header + f"\n{report.error_count} error(s), {report.warning_count} warning(s) — see attached list."
+    kwargs = {}
+    if report.error_count + report.warning_count > 15:
+        kwargs["file"] = discord.File(
+            fp=io.BytesIO(report.full_text().encode("utf-8")), filename=f"{report.kind}_import_issues.txt"
+        )
+    await interaction.followup.send(msg, ephemeral=True, **kwargs)
+
+
+@bot.tree.command(name="quest_import",description="ADMIN: Import Quest JSON / JSON Lines file (overwrite or merge).")
 @app_commands.default_permissions(manage_guild=True)
 async def quest_import(interaction: discord.Interaction, file: discord.Attachment, mode: str = "overwrite"):
     if not interaction.user.guild_permissions.manage_guild:
@@ -1864,35 +1896,35 @@ async def quest_import(interaction: discord.Interaction, file: discord.Attachmen
     if mode not in ("overwrite", "merge"):
         return await interaction.response.send_message("❌ Mode must be overwrite or merge.", ephemeral=True)
 
-    try:
-        raw_bytes = await file.read()
-        new_data = json.loads(raw_bytes.decode("utf-8"))
-    except Exception as e:
-        return await interaction.response.send_message(f"❌ JSON error: {e}", ephemeral=True)
-        
-    valid, msg = validate_quest_data(new_data)
-    if not valid:
-        return await interaction.response.send_message(f"❌ Import failed: {msg}", ephemeral=True)
-    
-    # Load existing quests.json
-    try:
-        with open(QUESTS_FILE, "r", encoding="utf-8") as f:
-            current = json.load(f)
-    except:
-        current = {}
-
-    final_data = new_data if mode == "overwrite" else {**current, **new_data}
+    await interaction.response.defer(ephemeral=True)
+    raw_bytes = await file.read()
+
+    async with import_lock:
+        # Parse + validate off the loop against snapshots of the live maps
+        report = await asyncio.to_thread(
+            importer.read_pack_bytes, raw_bytes, importer.KIND_TEMPLATES, file.filename,
+            npc_ids=frozenset(quest_manager.npcs),
+        )
+        if not report.ok:
+            return await _send_import_report(
+                interaction, report,
+                f"❌ Import failed — **{report.error_count}** error(s) across {report.seen} entries. Nothing was changed.",
+            )
 
-    # Save updated quests.json
-    with open(QUESTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(final_data, f, indent=4)
+        models, raw = importer.merged(report, mode, dict(quest_manager.quest_templates))
+        try:
+            await asyncio.to_thread(importer.commit_pack, report, raw)
+        except Exception as e:
+            return await interaction.followup.send(f"❌ Could not write quests.json: {e}", ephemeral=True)
 
-    # Reload templates into memory
-    quest_manager.reload_templates()
+        # Apply only what changed to the in-memory templates
+        diff = quest_manager.apply_templates(models)
 
-    await interaction.response.send_message(
-        f"🟢 Quest import complete! Mode: **{mode}**\nImported **{len(new_data)}** quest(s).",
-        ephemeral=True
+    print(f"[IMPORT] {len(report.entries)} templates ({report.fmt}, {mode}) in {report.seconds:.2f}s: {diff.summary()}")
+    await _send_import_report(
+        interaction, report,
+        f"🟢 Quest import complete! Mode: **{mode}**\nImported **{len(report.entries)}** quest(s).\n"
+        f"Changes: {diff.summary()}",
     )
 
 @bot.tree.command(name="quest_export",description="ADMIN: Export current quest JSON file.")
@@ -1927,33 +1959,161 @@ async def quest_export(interaction: discord.Interaction):
         ephemeral=True
     )
 
-@bot.tree.command(name="quest_admin_list_quests",description="Admin: List all quest templates.")
+# ---------- Paginated listings ----------
+
+def _render_template_line(qid, tmpl) -> str:
+    roles = getattr(tmpl, "allowed_roles", []) or []
+    role_str = ", ".join(f"<@&{rid}>" for rid in roles) if roles else "Everyone"
+    return (
+        f"- `{qid}` — **{tmpl.name}** ({tmpl.type.value}, {tmpl.points} pts) "
+        f"[Roles: {role_str}]"
+    )
+
+
+def _template_facets(tmpl):
+    yield f"type:{tmpl.type.value}"
+    for tag in tmpl.tags or []:
+        yield f"tag:{tag}"
+    for rid in tmpl.allowed_roles or []:
+        yield f"role:{rid}"
+
+
+def _render_player_line(uid, player) -> str:
+    faction = get_faction(player.faction_id)
+    icon = faction.emoji if faction else "❔"
+    return (
+        f"- <@{uid}> {icon} Lv {player.level} • {player.total_xp} XP • "
+        f"{player.lifetime_completed} quests • {len(player.badges)} badges"
+    )
+
+
+def _player_facets(player):
+    if player.faction_id:
+        yield f"faction:{player.faction_id}"
+    for badge_id in player.badges:
+        yield f"badge:{badge_id}"
+
+
+# (players version, badge id → holder count): one pass over the players per version
+_badge_holders: tuple[int, Counter] = (-1, Counter())
+
+
+def _badge_holder_counts() -> Counter:
+    global _badge_holders
+    version = quest_manager.versions["players"]
+    if _badge_holders[0] != version:
+        counts = Counter(badge_id for p in quest_manager.players.values() for badge_id in p.badges)
+        _badge_holders = (version, counts)
+    return _badge_holders[1]
+
+
+def _render_badge_line(badge_id, badge) -> str:
+    holders = _badge_holder_counts()[badge_id]
+    return f"- {badge['emoji']} `{badge_id}` — **{badge['name']}** ({holders} holders)\n  {badge['description']}"
+
+
+TEMPLATE_LISTING = Listing(
+    name="templates",
+    title="Current Quest Templates",
+    source=lambda: quest_manager.quest_templates,
+    version=lambda: quest_manager.versions["templates"],
+    render=_render_template_line,
+    facets=_template_facets,
+    empty_text="No quest templates match.",
+)
+NPC_LISTING = Listing(
+    name="npcs",
+    title="Current Quest NPCs",
+    source=lambda: quest_manager.npcs,
+    version=lambda: quest_manager.versions["npcs"],
+    render=lambda npc_id, npc: f"- `{npc_id}` — **{npc.name}**",
+    empty_text="No NPCs are currently defined.",
+)
+PLAYER_LISTING = Listing(
+    name="players",
+    title="Guild Players",
+    source=lambda: quest_manager.players,
+    version=lambda: quest_manager.versions["players"],
+    render=_render_player_line,
+    facets=_player_facets,
+    sort_key=lambda uid, player: (-player.total_xp, uid),
+    empty_text="No players match.",
+)
+BADGE_LISTING = Listing(
+    name="badges",
+    title="Badges",
+    source=lambda: BADGES,
+    # Holder counts move with the players map
+    version=lambda: quest_manager.versions["players"],
+    render=_render_badge_line,
+    empty_text="No badges are defined.",
+)
+
+
+@bot.tree.command(name="quest_admin_list_quests",description="Admin: List quest templates (filter by type, tag or role).")
 @app_commands.default_permissions(manage_guild=True)
-async def quest_admin_list_quests(interaction: discord.Interaction):
+async def quest_admin_list_quests(
+    interaction: discord.Interaction,
+    quest_type: Literal["SOCIAL", "SKILL", "FETCH", "TRAVEL"] | None = None,
+    tag: str | None = None,
+    role: discord.Role | None = None,
+):
     if not require_admin(interaction):
         return await interaction.response.send_message("❌ No permission.", ephemeral=True)
 
+    flt = make_filter(type=quest_type, tag=tag, role=role.id if role else None)
+    await send_listing(interaction, TEMPLATE_LISTING, flt)
 
-    if not quest_manager.quest_templates:
-        await interaction.response.send_message(
-            "ℹ️ No quest templates are currently defined.",
-            ephemeral=True,
-        )
-        return
+@bot.tree.command(name="quest_admin_list_players",description="Admin: List player profiles by XP (filter by faction or badge).")
+@app_commands.autocomplete(badge_id=badge_autocomplete)
+@app_commands.default_permissions(manage_guild=True)
+async def quest_admin_list_players(
+    interaction: discord.Interaction,
+    faction: Literal["shieldborne", "spellfire", "verdant"] | None = None,
+    badge_id: str | None = None,
+):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
 
-    lines: list[str] = []
-    for qid, tmpl in sorted(quest_manager.quest_templates.items()):
-        roles = getattr(tmpl, "allowed_roles", []) or []
-        role_str = ", ".join(f"<@&{rid}>" for rid in roles) if roles else "Everyone"
-        lines.append(
-            f"- `{qid}` — **{tmpl.name}** ({tmpl.type.value}, {tmpl.points} pts) "
-            f"[Roles: {role_str}]"
-        )
+    await send_listing(interaction, PLAYER_LISTING, make_filter(faction=faction, badge=badge_id))
+
+@bot.tree.command(name="quest_admin_show_player",description="Admin: Show a player's stored profile (works for members who left).")
+@app_commands.autocomplete(player=player_autocomplete)
+@app_commands.default_permissions(manage_guild=True)
+async def quest_admin_show_player(interaction: discord.Interaction, player: str):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    state = quest_manager.get_player(int(player)) if player.isdigit() else None
+    if not state:
+        return await interaction.response.send_message("⚠️ No profile for that player.", ephemeral=True)
+
+    daily = state.daily_quest or {}
+    lines = [
+        f"**Player:** <@{state.user_id}> (`{state.user_id}`)",
+        _render_player_line(state.user_id, state).lstrip("- "),
+        f"**Daily:** `{daily.get('quest_id', '—')}` on {daily.get('assigned_date', '—')}"
+        + (" ✅" if daily.get("completed") else ""),
+        f"**Badges:** {', '.join(sorted(state.badges)) or '—'}",
+        f"**Title:** {state.title or '—'}",
+    ]
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+@bot.tree.command(name="quest_admin_show_quest",description="Admin: Show one quest template as stored.")
+@app_commands.autocomplete(quest_id=quest_id_autocomplete)
+@app_commands.default_permissions(manage_guild=True)
+async def quest_admin_show_quest(interaction: discord.Interaction, quest_id: str):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
 
-    msg = "**Current Quest Templates:**\n" + "\n".join(lines)
-    await interaction.response.send_message(msg, ephemeral=True)
+    tmpl = quest_manager.get_template(quest_id)
+    if not tmpl:
+        return await interaction.response.send_message(f"⚠️ Unknown quest `{quest_id}`.", ephemeral=True)
 
-@bot.tree.command(name="npc_import",description="ADMIN: Import NPC JSON file (overwrite or merge).")
+    content = json.dumps(tmpl.to_dict(), indent=2)[:1900]
+    await interaction.response.send_message(f"```json\n{content}\n```", ephemeral=True)
+
+@bot.tree.command(name="npc_import",description="ADMIN: Import NPC JSON / JSON Lines file (overwrite or merge).")
 @app_commands.default_permissions(manage_guild=True)
 async def npc_import(
     interaction: discord.Interaction,
@@ -1966,35 +2126,36 @@ async def npc_import(
     if mode not in ("overwrite", "merge"):
         return await interaction.response.send_message("❌ Mode must be 'overwrite' or 'merge'.", ephemeral=True)
 
-    # Read uploaded JSON
-    try:
-        raw_bytes = await file.read()
-        new_data = json.loads(raw_bytes.decode("utf-8"))
-    except Exception as e:
-        return await interaction.response.send_message(f"❌ JSON error: {e}", ephemeral=True)
-    
-    valid, msg = validate_npc_data(new_data)
-    if not valid:
-        return await interaction.response.send_message(f"❌ Import failed: {msg}", ephemeral=True)
-        
-    # Load existing NPCs
-    current = storage.load_npcs()
-
-    # Overwrite or merge
-    if mode == "overwrite":
-        final_data = new_data
-    else:  # merge
-        final_data = {**current, **new_data}
+    await interaction.response.defer(ephemeral=True)
+    raw_bytes = await file.read()
+
+    async with import_lock:
+        report = await asyncio.to_thread(
+            importer.read_pack_bytes, raw_bytes, importer.KIND_NPCS, file.filename,
+            template_ids=frozenset(quest_manager.quest_templates),
+        )
+        models, raw = importer.merged(report, mode, dict(quest_manager.npcs))
+        if report.ok:
+            importer.check_npc_removals(report, models, quest_manager.quest_templates)
+        if not report.ok:
+            return await _send_import_report(
+                interaction, report,
+                f"❌ Import failed — **{report.error_count}** error(s) across {report.seen} entries. Nothing was changed.",
+            )
 
-    # Save final NPC JSON
-    storage.save_npcs(final_data)
-    quest_manager.reload_npcs()
+        try:
+            await asyncio.to_thread(importer.commit_pack, report, raw)
+        except Exception as e:
+            return await interaction.followup.send(f"❌ Could not write npcs.json: {e}", ephemeral=True)
 
+        diff = quest_manager.apply_npcs(models)
 
-    await interaction.response.send_message(
+    print(f"[IMPORT] {len(report.entries)} NPCs ({report.fmt}, {mode}) in {report.seconds:.2f}s: {diff.summary()}")
+    await _send_import_report(
+        interaction, report,
         f"🟢 NPC import complete! Mode: **{mode}**\n"
-        f"Imported **{len(new_data)}** NPC(s).",
-        ephemeral=True
+        f"Imported **{len(report.entries)}** NPC(s).\n"
+        f"Changes: {diff.summary()}",
     )
 
 @bot.tree.command(name="npc_export",description="ADMIN: Export current NPC JSON file.")
@@ -2027,56 +2188,60 @@ async def quest_admin_list_npcs(interaction: discord.Interaction):
     if not require_admin(interaction):
         return await interaction.response.send_message("❌ No permission.", ephemeral=True)
 
-    if not quest_manager.npcs:
-        await interaction.response.send_message(
-            "ℹ️ No NPCs are currently defined.",
-            ephemeral=True,
-        )
-        return
+    await send_listing(interaction, NPC_LISTING)
+ 
 
-    lines: list[str] = []
-    for npc_id, npc in sorted(quest_manager.npcs.items()):
-        lines.append(f"- `{npc_id}` — **{npc.name}**")
 
-    msg = "**Current Quest NPCs:**\n" + "\n".join(lines)
-    await interaction.response.send_message(msg, ephemeral=True)
- 
+@bot.tree.command(name="quest_admin_show_npc",description="Admin: Show one NPC as stored.")
+@app_commands.autocomplete(npc_id=npc_id_autocomplete)
+@app_commands.default_permissions(manage_guild=True)
+async def quest_admin_show_npc(interaction: discord.Interaction, npc_id: str):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    npc = quest_manager.get_npc(npc_id)
+    if not npc:
+        return await interaction.response.send_message(f"⚠️ Unknown NPC `{npc_id}`.", ephemeral=True)
+
+    content = json.dumps(npc.to_dict(), indent=2)[:1900]
+    await interaction.response.send_message(f"```json\n{content}\n```", ephemeral=True)
 
 
 # ========= ADMIN: Board =========
 
+async def _archive_before_reset(reason: str) -> bool:
+    try:
+        # Copy on the loop (handlers mutate these dicts); compress + write off it
+        snapshot = season_archive.build_snapshot(quest_manager, get_season_state(), reason)
+        await asyncio.to_thread(season_archive.write_archive, snapshot)
+        return True
+    except Exception as e:
+        print(f"[ARCHIVE] Failed to archive season before {reason}: {e}")
+        return False
+
 @bot.tree.command(name="quest_board",description="Show or update the Jolly Fox seasonal quest scoreboard.")
 @app_commands.default_permissions(manage_guild=True)
 async def quest_board_cmd(interaction: discord.Interaction):
     board = quest_manager.quest_board
     embed = build_board_embed()
 
-    # Attempt to update existing board
-    if board.display_channel_id and board.message_id:
-        try:
-            channel = interaction.client.get_channel(board.display_channel_id)
-            if channel is None:
-                channel = await interaction.client.fetch_channel(
-                    board.display_channel_id
-                )
-
-            msg = await channel.fetch_message(board.message_id)
-            await msg.edit(embed=embed, view=QuestBoardView())
-
+    # Attempt to update existing board (a deleted one is cleared, then reposted below)
+    try:
+        if await anchors.edit("quest_board", force=True, embed=embed, view=QuestBoardView()):
             await interaction.response.send_message(
                 "🔄 Quest board updated.",
                 ephemeral=True,
             )
             return
 
-        except Exception as e:
-            print("Quest board update failed:", e)
-            await interaction.response.send_message(
-                "⚠️ Failed to update the existing quest board.\n"
-                "Use `/quest_admin_reset_board` and rerun `/quest_board`.",
-                ephemeral=True,
-            )
-            return
+    except Exception as e:
+        print("Quest board update failed:", e)
+        await interaction.response.send_message(
+            "⚠️ Failed to update the existing quest board.\n"
+            "Use `/quest_admin_reset_board` and rerun `/quest_board`.",
+            ephemeral=True,
+        )
+        return
 
     # ✅ NO BOARD EXISTS → POST IT
     await interaction.response.send_message(
@@ -2103,6 +2268,13 @@ async def quest_admin_set_season(
         return await interaction.response.send_message("❌ No permission.", ephemeral=True)
 
     board = quest_manager.quest_board
+
+    # 🗄️ Keep the outgoing season queryable before wiping it
+    if not await _archive_before_reset("set_season"):
+        return await interaction.response.send_message(
+            "❌ Could not archive the current season; nothing was reset.", ephemeral=True
+        )
+
     board.reset_season(season_id)
     board.season_goal = max(1, season_goal)
     board.faction_goal = max(1, faction_goal)
@@ -2136,13 +2308,14 @@ async def quest_admin_set_board_meta(
     season_goal: int | None = None,
     faction_goal: int | None = None,
     season_reward: str | None = None,
+    xp_curve: Literal["standard", "gentle", "steep", "flat"] | None = None,
 ):
     if not require_admin(interaction):
         return await interaction.response.send_message("❌ No permission.", ephemeral=True)
 
-    if season_goal is None and faction_goal is None and season_reward is None:
+    if season_goal is None and faction_goal is None and season_reward is None and xp_curve is None:
         await interaction.response.send_message(
-            "⚠️ You must provide at least one of `season_goal` or `season_reward`.",
+            "⚠️ You must provide at least one of `season_goal`, `faction_goal`, `season_reward` or `xp_curve`.",
             ephemeral=True,
         )
         return
@@ -2155,6 +2328,10 @@ async def quest_admin_set_board_meta(
         board.season_reward = season_reward
     if faction_goal is not None:
         board.faction_goal = max(1, faction_goal)
+    if xp_curve is not None:
+        # Levels are derived from total XP, so this re-levels everyone instantly
+        board.xp_curve = xp_curve
+        set_active_curve(xp_curve)
 
     quest_manager.save_board()
     await refresh_quest_board(interaction.client)
@@ -2170,6 +2347,9 @@ async def quest_admin_set_board_meta(
     if faction_goal is not None:
         log_lines.append(f"• New Faction Power Goal: **{board.faction_goal}** points")
 
+    if xp_curve is not None:
+        log_lines.append(f"• XP Curve: **{board.xp_curve}**")
+
     log_lines.append(f"• By: {interaction.user.mention}")
 
     await log_admin_action(
@@ -2194,6 +2374,12 @@ async def quest_admin_reset_board(interaction: discord.Interaction):
 
     board = quest_manager.quest_board
 
+    # 🗄️ Keep the outgoing season queryable before wiping it
+    if not await _archive_before_reset("reset_board"):
+        return await interaction.response.send_message(
+            "❌ Could not archive the current season; nothing was reset.", ephemeral=True
+        )
+
     # 🔥 CLEAR BOARD ANCHOR (THIS IS THE HEAL)
     board.display_channel_id = None
     board.message_id = None
@@ -2202,12 +2388,10 @@ async def quest_admin_reset_board(interaction: discord.Interaction):
     board.global_points = 0
     board.faction_points = {}
 
-    # 🔄 RESET PLAYER SEASONAL STATS
-    for player in quest_manager.players.values():
-        player.season_completed = 0
-        player.monsters_season = 0
+    # 🔄 RESET PLAYER SEASONAL STATS — O(1): counters from older epochs read as 0
+    # and are zeroed on disk the next time players are saved
+    board.advance_epoch()
 
-    quest_manager.save_players()
     quest_manager.save_board()
 
     await interaction.response.send_message(
@@ -2264,9 +2448,7 @@ async def quest_admin_adjust_points(
     )
 
     # 📢 Send to log channel
-    log_channel = interaction.client.get_channel(POINTS_LOG_CHANNEL_ID)
-    if log_channel:
-        await log_channel.send(log_msg)
+    points_log.add(log_msg)
 
     # 🔒 Confirm to admin
     await interaction.response.send_message(
@@ -2274,6 +2456,85 @@ async def quest_admin_adjust_points(
         ephemeral=True,
     )
 
+@bot.tree.command(name="season_archive_list",description="Admin: List archived seasons.")
+@app_commands.default_permissions(manage_guild=True)
+async def season_archive_list(interaction: discord.Interaction):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    index = season_archive.load_index()
+    if not index:
+        return await interaction.response.send_message("ℹ️ No seasons have been archived yet.", ephemeral=True)
+
+    lines = []
+    for key, entry in list(index.items())[-20:]:
+        outcome = entry.get("boss_outcome") or "no boss"
+        lines.append(
+            f"- `{key}` — **{entry['season_id']}** ({entry['archived_at'][:10]}, {entry['reason']}): "
+            f"{entry['global_points']} pts, {entry['season_completed']} quests, "
+            f"{entry['monsters_season']} monsters, {entry['players']} players, boss: {outcome}"
+        )
+
+    msg = "**Archived Seasons** (latest 20):\n" + "\n".join(lines)
+    await interaction.response.send_message(msg[:2000], ephemeral=True)
+
+@bot.tree.command(name="season_archive_top",description="Admin: Top players of an archived season.")
+@app_commands.default_permissions(manage_guild=True)
+@app_commands.autocomplete(season_id=archived_season_autocomplete)
+async def season_archive_top(
+    interaction: discord.Interaction,
+    season_id: str,
+    metric: Literal["season_completed", "monsters_season"] = "season_completed",
+    limit: app_commands.Range[int, 1, 50] = 10,
+):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    rows = await asyncio.to_thread(season_archive.top_players, season_id, metric, limit)
+    if not rows:
+        return await interaction.response.send_message(
+            f"ℹ️ No archived data for season **{season_id}**.", ephemeral=True
+        )
+
+    label = "quests" if metric == "season_completed" else "monsters"
+    lines = [f"{i}. <@{uid}> — **{value}** {label}" for i, (uid, value) in enumerate(rows, start=1)]
+    embed = discord.Embed(
+        title=f"🏆 Season {season_id} — Top {len(rows)} by {label}",
+        description="\n".join(lines),
+        color=discord.Color.gold(),
+    )
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@bot.tree.command(name="season_archive_factions",description="Admin: Faction totals across archived seasons.")
+@app_commands.default_permissions(manage_guild=True)
+async def season_archive_factions(interaction: discord.Interaction):
+    if not require_admin(interaction):
+        return await interaction.response.send_message("❌ No permission.", ephemeral=True)
+
+    rows = await asyncio.to_thread(season_archive.faction_totals)
+    if not rows:
+        return await interaction.response.send_message("ℹ️ No seasons have been archived yet.", ephemeral=True)
+
+    all_time = {}
+    lines = []
+    for row in rows[-20:]:
+        parts = []
+        for fid, pts in sorted(row["faction_points"].items()):
+            name = FACTIONS[fid].name if fid in FACTIONS else fid
+            parts.append(f"{name} {pts}")
+        lines.append(f"- **{row['season_id']}** ({row['archived_at'][:10]}): " + (", ".join(parts) or "no faction points"))
+
+    for row in rows:
+        for fid, pts in row["faction_points"].items():
+            all_time[fid] = all_time.get(fid, 0) + pts
+
+    totals = ", ".join(
+        f"{FACTIONS[fid].name if fid in FACTIONS else fid} **{pts}**"
+        for fid, pts in sorted(all_time.items(), key=lambda kv: -kv[1])
+    )
+    msg = "**Faction Totals by Season**\n" + "\n".join(lines) + f"\n\n**All seasons:** {totals or '—'}"
+    await interaction.response.send_message(msg[:2000], ephemeral=True)
+
 
 
 # ========= PLAYER: Core =========
@@ -2372,11 +2633,7 @@ async def talk(interaction: discord.Interaction):
     # -------------------------------------------------------------
     reply_text = get_npc_quest_dialogue(npc, template)
 
-    result = quest_manager.complete_daily(interaction.user.id)
-    global DAILY_QUEST_COMPLETIONS
-    if result.get("completed"):
-        DAILY_QUEST_COMPLETIONS += 1
-
+    result = engine.complete(interaction.user.id, member_role_ids(interaction.user), QUEST_POINTS)
     if result.get("completed"):
         await handle_progression_announcements(
             interaction.guild,
@@ -2384,8 +2641,6 @@ async def talk(interaction: discord.Interaction):
             result,
     )
 
-    faction_id = get_member_faction_id(interaction.user)
-    quest_manager.award_points(interaction.user.id, QUEST_POINTS, faction_id)
     await refresh_quest_board(interaction.client)
 
     # -------------------------------------------------------------
@@ -2432,11 +2687,7 @@ async def skill(interaction: discord.Interaction):
         if npc
         else None
     )
-    result = quest_manager.complete_daily(interaction.user.id)
-    global DAILY_QUEST_COMPLETIONS
-    if result.get("completed"):
-        DAILY_QUEST_COMPLETIONS += 1
-
+    result = engine.complete(interaction.user.id, member_role_ids(interaction.user), QUEST_POINTS)
     if result.get("completed"):
         await handle_progression_announcements(
             interaction.guild,
@@ -2444,8 +2695,6 @@ async def skill(interaction: discord.Interaction):
             result,
     )
 
-        faction_id = get_member_faction_id(interaction.user)
-        quest_manager.award_points(interaction.user.id,QUEST_POINTS,faction_id)
         await refresh_quest_board(interaction.client)
 
     # 🎭 NPC = embed | ⚙️ No NPC = text
@@ -2488,20 +2737,14 @@ async def checkin(interaction: discord.Interaction):
 
     npc = quest_manager.get_npc(template.npc_id) if template.npc_id else None
     dialogue = get_npc_quest_dialogue(npc, template) if npc else None
-    result = quest_manager.complete_daily(interaction.user.id)
-    global DAILY_QUEST_COMPLETIONS
-    if result.get("completed"):
-        DAILY_QUEST_COMPLETIONS += 1
-
+    result = engine.complete(interaction.user.id, member_role_ids(interaction.user), QUEST_POINTS)
     if result.get("completed"):
         await handle_progression_announcements(
             interaction.guild,
             interaction.user,
             result,
     )
-        
-    faction_id = get_member_faction_id(interaction.user)
-    quest_manager.award_points(interaction.user.id, QUEST_POINTS, faction_id)
+
     await refresh_quest_board(interaction.client)
 
     await send_npc_response(
@@ -2613,19 +2856,13 @@ async def turnin(interaction: discord.Interaction):
     # 📦 Consume item
     player.consume_item(template.item_name)
     quest_manager.save_players()
-    result = quest_manager.complete_daily(interaction.user.id)
-    global DAILY_QUEST_COMPLETIONS
-    if result.get("completed"):
-        DAILY_QUEST_COMPLETIONS += 1
-
+    result = engine.complete(interaction.user.id, member_role_ids(interaction.user), QUEST_POINTS)
     if result.get("completed"):
         await handle_progression_announcements(
             interaction.guild,
             interaction.user,
             result,
     )
-    faction_id = get_member_faction_id(interaction.user)
-    quest_manager.award_points(interaction.user.id, QUEST_POINTS, faction_id)
     await refresh_quest_board(interaction.client)
 
     await send_npc_response(
@@ -2651,52 +2888,150 @@ async def turnin(interaction: discord.Interaction):
 #     print("⚠ Global commands wiped and resynced")
 
 
+# ==== ANCHORED MESSAGES ====
+def _set_board_anchor(channel_id, message_id):
+    board = quest_manager.quest_board
+    board.display_channel_id = channel_id
+    board.message_id = message_id
+    quest_manager.save_board()
+
+def _get_season_anchor():
+    embed_info = get_season_state().get("embed", {})
+    return embed_info.get("channel_id"), embed_info.get("message_id")
+
+def _set_season_anchor(channel_id, message_id):
+    state = get_season_state()
+    state["embed"]["channel_id"] = channel_id
+    state["embed"]["message_id"] = message_id
+    save_season(state)
+
+def _recreate_season_message():
+    state = get_season_state()
+    view = SeasonalVoteView() if state.get("active") else SeasonalEndedView()
+    return {"embed": build_seasonal_embed(), "view": view}
+
+def register_anchors():
+    anchors.register(
+        "quest_board",
+        get=lambda: (quest_manager.quest_board.display_channel_id, quest_manager.quest_board.message_id),
+        set=_set_board_anchor,
+        recreate=lambda: {"embed": build_board_embed(), "view": QuestBoardView()},
+    )
+    anchors.register(
+        "seasonal",
+        get=_get_season_anchor,
+        set=_set_season_anchor,
+        recreate=_recreate_season_message,
+    )
+
+    # Buttons on messages posted before a restart keep working
+    anchors.add_persistent_view(QuestBoardView())
+    anchors.add_persistent_view(SeasonalVoteView())
+    anchors.add_persistent_view(WanderingEventView(wandering_manager))
+    anchors.bind(bot)
+
+
 @bot.event
 async def setup_hook():
     guild = discord.Object(id=GUILD_ID)
+    loop = asyncio.get_running_loop()
+
+    # 📂 Load all data files off the event loop, in parallel
+    with startup_timer.phase("load data files"):
+        await asyncio.gather(
+            loop.run_in_executor(None, quest_manager.load_all),
+            loop.run_in_executor(None, load_season),
+        )
+
+    register_anchors()
 
     # Copy all global commands into the guild
     bot.tree.copy_global_to(guild=guild)
 
 async def sleep_until_midnight_utc():
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     tomorrow = (now + timedelta(days=1)).replace(
         hour=0, minute=0, second=0, microsecond=0
     )
-    await asyncio.sleep((tomorrow - now).total_seconds())
+    await clock.sleep((tomorrow - now).total_seconds())
+
+async def start_wandering_system(bot: commands.Bot):
+    # Resume first so the spawn loop never stacks on a persisted event
+    await wandering_manager.startup_resume(bot)
+    await wandering_manager.scheduled_spawn_loop(bot)
+
+# Strong refs to long-running loops (the event loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+def spawn_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
+_startup_complete = False
 
 @bot.event
 async def on_ready():
+    global _startup_complete
+    print(f"Logged in as {bot.user}")
+
+    # on_ready fires again on every gateway reconnect
+    if _startup_complete:
+        return
+    _startup_complete = True
+
+    startup_timer.lap("gateway connect")
+
     guild = discord.Object(id=GUILD_ID)
-    cmds = await bot.tree.sync(guild=guild)
+
+    # Only sync when the command tree actually changed
+    with startup_timer.phase("command sync"):
+        digest = command_tree_hash(bot.tree, guild)
+        if command_sync_needed(GUILD_ID, digest):
+            cmds = await bot.tree.sync(guild=guild)
+            remember_command_sync(GUILD_ID, digest)
+            print(f"Synced {len(cmds)} commands to guild {GUILD_ID}")
+        else:
+            print("Command tree unchanged — skipping sync.")
+
+    # Posts any entries left over from before a restart, then every interval
+    points_log.start(bot)
+    announcements.start(bot)
+    activity.start()
+    if data_watcher is not None:
+        data_watcher.start()
+
+    # Build the larger autocomplete indexes off the loop before anyone types
+    for index in (QUEST_INDEX, NPC_INDEX, PLAYER_INDEX):
+        spawn_background(index.prime())
+
     if not os.getenv("WANDERING_PING_ROLE_ID"):
         print("[WANDERING] ⚠️ Ping role not configured")
-    print(f"Synced {len(cmds)} commands to guild {GUILD_ID}")
-    print(f"Logged in as {bot.user}")
 
-    # Sync commands (you already do this)
-    await bot.tree.sync(guild=discord.Object(id=GUILD_ID))
-    await wandering_manager.startup_resume(bot)
+    # 🔹 Check every anchored message at once, reposting any that were deleted
+    with startup_timer.phase("anchor warm-up"):
+        await anchors.warm()
 
-    bot.loop.create_task(
-        wandering_manager.scheduled_spawn_loop(bot)
-    )
+    # 🔹 AUTO refresh quest board
+    with startup_timer.phase("quest board refresh"):
+        try:
+            await refresh_quest_board(bot)
+            print("Quest board refreshed on startup.")
+        except Exception as e:
+            print(f"Quest board refresh failed: {e}")
 
-    bot.loop.create_task(seasonal_midnight_loop(bot))
+    # Non-critical: these wait on the Discord cache / timers, so don't block on them
+    spawn_background(start_wandering_system(bot))
+    spawn_background(seasonal_midnight_loop(bot))
 
-    # 🔹 AUTO refresh quest board
-    try:
-        await refresh_quest_board(bot)
-        print("Quest board refreshed on startup.")
-    except Exception as e:
-        print(f"Quest board refresh failed: {e}")
+    print(startup_timer.report())
 
 @bot.event
 async def on_member_join(member: discord.Member):
     player = quest_manager.get_or_create_player(member.id)
 
-    new_badges = evaluate_join_date_badges(member, player)
+    new_badges = evaluate_join_date_badges(member.joined_at, player)
     if new_badges:
         quest_manager.save_players()
 
@@ -2710,6 +3045,22 @@ async def on_member_join(member: discord.Member):
             }
         )
 
+@bot.event
+async def on_interaction(interaction: discord.Interaction):
+    if interaction_recorder is not None:
+        interaction_recorder.begin(interaction)
+
+@bot.event
+async def on_app_command_completion(interaction: discord.Interaction, command):
+    if interaction_recorder is not None:
+        interaction_recorder.finish(interaction)
+
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    global member_name_changes
+    if before.display_name != after.display_name and after.id in quest_manager.players:
+        member_name_changes += 1
+
 @bot.event
 async def on_member_remove(member: discord.Member):
     user_id = member.id
@@ -2752,4 +3103,8 @@ async def on_message(message: discord.Message):
                 response
             )
 
-bot.run(TOKEN)
+if __name__ == "__main__":
+    if not TOKEN or not GUILD_ID:
+        raise ValueError("Missing DISCORD_TOKEN or GUILD_ID environment variable.")
+
+    bot.run(TOKEN)
@@ -0,0 +1,195 @@
+import asyncio
+import bisect
+import math
+import re
+from typing import Callable, Iterable
+
+# ========= Autocomplete Settings =========
+MAX_CHOICES = 25          # Discord's cap
+NODE_CAP = 50             # word-start completions kept per trie node (first by label order)
+TRIE_DEPTH = 16           # longer queries are answered from the trigram postings
+FUZZY_MIN_SCORE = 0.3     # trigram similarity floor for fuzzy matches
+INLINE_BUILD_MAX = 200    # bigger indexes are rebuilt in a thread while the old one serves
+
+# Rank buckets (lower is better)
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+RANK_FUZZY = 4
+
+_WORD_SPLIT = re.compile(r"[\s_\-:./—]+")
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    Read-only lookup over (value, label) pairs.
+
+    Label prefixes are a bisect over the sorted labels, a lowercase trie
+    answers word prefixes, and trigram postings answer substrings and
+    typos. Results are ranked exact → prefix →
+    word prefix → substring → fuzzy, then by label.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]] = ()):
+        # Sorted so label prefixes are one contiguous run, and every trie
+        # node keeps its alphabetically-first completions
+        self.entries = sorted(entries, key=lambda e: (e[1].lower(), e[0]))
+        self.lowered = [label.lower() for _, label in self.entries]
+        self.trie: dict = {}
+        self.postings: dict[str, list[int]] = {}
+        self.grams: list[frozenset] = []
+
+        for i, label in enumerate(self.lowered):
+            for start in self._word_starts(label):
+                self._insert(label[start:], i)
+            grams = frozenset(_trigrams(label))
+            self.grams.append(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+
+    @staticmethod
+    def _word_starts(label: str) -> list[int]:
+        return [m.end() for m in _WORD_SPLIT.finditer(label) if m.end() < len(label)]
+
+    def _insert(self, key: str, i: int):
+        node = self.trie
+        for ch in key[:TRIE_DEPTH]:
+            node = node.setdefault(ch, {})
+            ids = node.setdefault("", [])
+            if len(ids) < NODE_CAP and (not ids or ids[-1] != i):
+                ids.append(i)
+
+    def _label_prefixed(self, query: str):
+        """Ids whose whole label starts with `query`, exact match first."""
+        for i in range(bisect.bisect_left(self.lowered, query), len(self.lowered)):
+            if not self.lowered[i].startswith(query):
+                return
+            yield i
+
+    def _word_prefixed(self, query: str) -> list[int]:
+        node = self.trie
+        for ch in query[:TRIE_DEPTH]:
+            node = node.get(ch)
+            if node is None:
+                return []
+        ids = node.get("", [])
+        if len(query) > TRIE_DEPTH:
+            # Past the trie depth: confirm the rest of the prefix by hand
+            ids = [i for i in ids if query in self.lowered[i]]
+        return ids
+
+    def search(self, query: str, limit: int = MAX_CHOICES, allowed=None) -> list[tuple[str, str]]:
+        """Best `limit` (value, label) pairs; `allowed` restricts to a set of values."""
+        q = query.strip().lower()
+        ok = (lambda i: True) if allowed is None else (lambda i: self.entries[i][0] in allowed)
+
+        if not q:
+            out = []
+            for i in range(len(self.entries)):
+                if ok(i):
+                    out.append(self.entries[i])
+                    if len(out) >= limit:
+                        break
+            return out
+
+        ranked: dict[int, tuple] = {}
+        for i in self._label_prefixed(q):
+            if ok(i):
+                ranked[i] = (RANK_EXACT if self.lowered[i] == q else RANK_PREFIX, 0.0)
+                if len(ranked) >= limit:
+                    break
+
+        if len(ranked) < limit:
+            for i in self._word_prefixed(q):
+                if i not in ranked and ok(i):
+                    ranked[i] = (RANK_WORD_PREFIX, 0.0)
+
+        if len(ranked) < limit:
+            self._fuzzy(q, ranked, ok)
+
+        best = sorted(ranked, key=lambda i: (ranked[i], self.lowered[i]))[:limit]
+        return [self.entries[i] for i in best]
+
+    def _fuzzy(self, q: str, ranked: dict, ok):
+        grams = _trigrams(q)
+        # Similarity ≥ FUZZY_MIN_SCORE needs at least this many shared trigrams,
+        # so every match contains one of the rarest (len - need + 1) of them
+        need = max(1, math.ceil(FUZZY_MIN_SCORE * len(grams)))
+        rarest = sorted(grams, key=lambda g: len(self.postings.get(g, ())))[:len(grams) - need + 1]
+
+        candidates = set()
+        for gram in rarest:
+            candidates.update(self.postings.get(gram, ()))
+
+        for i in candidates:
+            if i in ranked or not ok(i):
+                continue
+            if q in self.lowered[i]:
+                ranked[i] = (RANK_SUBSTRING, 0.0)
+                continue
+            entry_grams = self.grams[i]
+            shared = len(grams & entry_grams)
+            score = shared / (len(grams) + len(entry_grams) - shared)
+            if score >= FUZZY_MIN_SCORE:
+                ranked[i] = (RANK_FUZZY, -score)
+
+
+class LiveIndex:
+    """
+    A SearchIndex over data that changes, rebuilt when `version()` moves.
+
+    Small sources are rebuilt inline on the next search. Large ones are
+    snapshotted on the loop and rebuilt in a thread; searches keep using
+    the previous index until the new one is swapped in.
+    """
+
+    def __init__(self, entries: Callable[[], Iterable[tuple[str, str]]], version: Callable[[], object]):
+        self._entries = entries
+        self._version = version
+        self._built_for = None
+        self._building: asyncio.Task | None = None
+        self.index: SearchIndex | None = None
+
+    async def _build(self, entries: list, version):
+        try:
+            index = await asyncio.to_thread(SearchIndex, entries)
+            self.index, self._built_for = index, version
+        except Exception as e:
+            print(f"[AUTOCOMPLETE] Index rebuild failed: {e}")
+        finally:
+            self._building = None
+
+    def refresh(self):
+        """Bring the index up to date (in the background where possible)."""
+        version = self._version()
+        if self.index is not None and version == self._built_for:
+            return
+        if self._building is not None:
+            return
+
+        entries = list(self._entries())
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self.index is None or loop is None or len(entries) <= INLINE_BUILD_MAX:
+            self.index, self._built_for = SearchIndex(entries), version
+        else:
+            self._building = loop.create_task(self._build(entries, version))
+
+    async def prime(self):
+        """Build now without blocking the loop (used at startup)."""
+        self._built_for = None
+        entries = list(self._entries())
+        version = self._version()
+        await self._build(entries, version)
+
+    def search(self, query: str, limit: int = MAX_CHOICES, allowed=None) -> list[tuple[str, str]]:
+        self.refresh()
+        return self.index.search(query, limit, allowed)
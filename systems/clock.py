@@ -0,0 +1,109 @@
+import asyncio
+import heapq
+import itertools
+from datetime import date, datetime, timedelta, timezone
+
+
+# =================================================
+# ===============  WALL CLOCK  ====================
+# =================================================
+
+class Clock:
+    """Real time. All game/scheduler code reads time through the active clock."""
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    def today(self) -> date:
+        return date.today()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(max(0.0, seconds))
+
+
+# =================================================
+# ============  SIMULATED CLOCK  ==================
+# =================================================
+
+class SimulatedClock(Clock):
+    """
+    Virtual time for soak/integration runs.
+
+    sleep() parks the caller on a timer heap instead of the event loop;
+    advance()/run_until() jump straight to the next deadline, so the
+    spawn and midnight loops can cover days of game time in seconds.
+    """
+
+    def __init__(self, start: datetime | None = None, settle_delay: float = 0.0):
+        self._now = start or datetime.now(timezone.utc)
+        # Real seconds to wait after each wake-up when I/O fakes add latency
+        self.settle_delay = settle_delay
+        self._timers: list[tuple[datetime, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    def now(self) -> datetime:
+        return self._now
+
+    def today(self) -> date:
+        return self._now.date()
+
+    async def sleep(self, seconds: float):
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._timers, (self._now + timedelta(seconds=seconds), next(self._seq), fut))
+        await fut
+
+    @property
+    def pending_timers(self) -> int:
+        return sum(1 for _, _, fut in self._timers if not fut.done())
+
+    async def _settle(self, rounds: int = 20):
+        # Let woken tasks run until they park again (REST fakes yield a few times)
+        for _ in range(rounds):
+            await asyncio.sleep(0)
+        if self.settle_delay:
+            await asyncio.sleep(self.settle_delay)
+
+    async def run_until(self, deadline: datetime):
+        """Fire every timer due up to `deadline`, in order, then park at it."""
+        await self._settle()
+        while self._timers and self._timers[0][0] <= deadline:
+            when, _, fut = heapq.heappop(self._timers)
+            if fut.done():
+                continue
+            self._now = max(self._now, when)
+            fut.set_result(None)
+            await self._settle()
+        self._now = max(self._now, deadline)
+
+    async def advance(self, seconds: float):
+        await self.run_until(self._now + timedelta(seconds=seconds))
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock | None) -> Clock:
+    """Install a clock (None restores real time). Returns the previous one."""
+    global _clock
+    previous = _clock
+    _clock = clock or Clock()
+    return previous
+
+
+def now() -> datetime:
+    return _clock.now()
+
+
+def today() -> date:
+    return _clock.today()
+
+
+async def sleep(seconds: float):
+    await _clock.sleep(seconds)
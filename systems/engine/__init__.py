@@ -0,0 +1 @@
+from .service import GameEngine, QUEST_POINTS
@@ -0,0 +1,27 @@
+def make_progress_bar(value: int, max_value: int, length: int = 20) -> str:
+    """Simple text progress bar for embeds."""
+    if max_value <= 0:
+        max_value = 1
+
+    ratio = max(0.0, min(1.0, value / max_value))
+    filled = int(ratio * length)
+    empty = length - filled
+    return f"[{'█' * filled}{'░' * empty}]"
+
+
+def get_crown_holder(faction_points: dict[str, int]) -> str | None:
+    if not faction_points:
+        return None
+    return max(faction_points.items(), key=lambda x: x[1])[0]
+
+
+def percent_of_goal(points: int, goal: int) -> float:
+    # Prevent division by zero
+    if goal <= 0:
+        return 0.0
+    return (points / goal) * 100
+
+
+def effective_goal(goal: int, default: int) -> int:
+    """Board goals fall back to a default if unset or non-positive."""
+    return goal if goal and goal > 0 else default
@@ -0,0 +1,168 @@
+from typing import Iterable
+
+from systems import clock
+from systems.quests.factions import get_faction_id_for_roles
+from systems.seasonal.state import (
+    BASE_ATTACK_DAMAGE,
+    DIFFICULTY_PRESETS,
+    get_season_state,
+    register_vote,
+    reset_votes_for_new_day,
+    resolve_daily_boss,
+    sync_power_unlocks_from_board,
+)
+from systems.seasonal.storage import save_season
+from systems.stats import VOTE, activity
+
+# cast_vote() outcomes
+VOTE_OK = "ok"
+VOTE_INACTIVE = "inactive"
+VOTE_NO_FACTION = "no_faction"
+VOTE_FACTION_DEFEATED = "faction_defeated"
+VOTE_POWER_LOCKED = "power_locked"
+VOTE_POWER_USED = "power_used"
+VOTE_INVALID = "invalid"
+
+
+def expected_votes_for_members(total_members: int, participation_rate: float = 0.35) -> int:
+    """Estimate total daily votes from the number of faction members."""
+    # Safety floor so small servers don’t break
+    return max(5, int(total_members * participation_rate))
+
+
+def initialize_season_boss_and_factions(
+    state: dict,
+    board,
+    expected_votes: int,
+    target_days: int = 7,
+    difficulty: str = "normal",
+):
+    sync_power_unlocks_from_board(state, board)
+
+    preset = DIFFICULTY_PRESETS.get(difficulty, DIFFICULTY_PRESETS["normal"])
+    state["difficulty"] = difficulty
+
+    # Assume not all votes are attacks
+    expected_attack_votes = max(1, int(expected_votes * 0.45))
+
+    padding = 1.1 if target_days == 5 else 1.25
+
+    base_boss_hp = int(
+        expected_attack_votes
+        * BASE_ATTACK_DAMAGE
+        * target_days
+        * padding
+    )
+
+    boss_hp = int(base_boss_hp * preset["boss_hp_multiplier"])
+    boss_hp = max(500, boss_hp)
+
+    state["boss"]["hp"] = boss_hp
+    state["boss"]["max_hp"] = boss_hp
+
+    # Faction HP should survive ~2–3 strong retaliation hits
+    base_faction_hp = max(
+        300,
+        expected_attack_votes * 60
+    )
+
+    faction_hp = int(base_faction_hp * preset["faction_hp_multiplier"])
+
+    for fid in state["faction_health"]:
+        state["faction_health"][fid]["hp"] = faction_hp
+        state["faction_health"][fid]["max_hp"] = faction_hp
+
+    # Reset faction power usage
+    for fp in state["faction_powers"].values():
+        fp["used"] = False
+
+    # Mark season active
+    state["active"] = True
+    state["max_days"] = int(target_days)
+    state["started_on"] = str(clock.today())
+    state["ended_reason"] = None
+    state["day"] = 1
+
+    # 🟢 New boss = everyone alive again
+    state["alive_factions"] = {
+        fid
+        for fid, fh in state.get("faction_health", {}).items()
+        if fh["hp"] > 0
+    }
+
+
+def resolve_season_day(state: dict, force_vote_reset: bool = False) -> dict | None:
+    """
+    Resolve one boss day, advance the day counter and persist.
+    Shared by the midnight loop and the admin force-resolve.
+    Returns the resolve summary, or None if no boss is active.
+    """
+    if not state.get("active"):
+        return None
+
+    # 🔥 Resolve the day
+    summary = resolve_daily_boss(state)
+
+    # ✅ Store yesterday summary for the embed
+    state["last_net_damage"] = int(summary.get("net_damage", 0) or 0)
+    state["last_retaliation"] = int(summary.get("retaliation_applied", 0) or 0)
+    state["last_retaliation_target"] = summary.get("retaliation_target")
+
+    # 📅 Advance the day counter (day starts at 1)
+    state["day"] = int(state.get("day", 1)) + 1
+
+    # ⏳ Time limit: if the boss is still alive after max_days, the boss wins
+    max_days = int(state.get("max_days", 0) or 0)
+    if (
+        state.get("active")
+        and max_days > 0
+        and state["day"] > max_days
+        and state.get("ended_reason") is None
+    ):
+        state["active"] = False
+        state["ended_reason"] = "time_expired"
+
+    # 🔄 Reset votes for the new day
+    if force_vote_reset:
+        reset_votes_for_new_day(state, force=True)
+    elif state.get("active"):
+        reset_votes_for_new_day(state)
+
+    # 💾 Persist state
+    save_season(state)
+    return summary
+
+
+def cast_vote(user_id: int, role_ids: Iterable[int], action: str, state: dict | None = None) -> str:
+    """
+    Register a seasonal vote for a user identified by id + role ids.
+    Returns one of the VOTE_* outcomes.
+    """
+    if state is None:
+        state = get_season_state()
+
+    if not state.get("active"):
+        return VOTE_INACTIVE
+
+    faction = get_faction_id_for_roles(role_ids)
+    if not faction:
+        return VOTE_NO_FACTION
+
+    if faction not in state.get("alive_factions", set()):
+        return VOTE_FACTION_DEFEATED
+
+    # ❌ Block power vote if not allowed
+    if action == "power":
+        fp = state["faction_powers"].get(faction)
+
+        if not fp or not fp.get("unlocked"):
+            return VOTE_POWER_LOCKED
+
+        if fp.get("used"):
+            return VOTE_POWER_USED
+
+    if not register_vote(state, user_id, faction, action):
+        return VOTE_INVALID
+
+    activity.record(VOTE, f"{faction}.{action}")
+    return VOTE_OK
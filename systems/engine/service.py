@@ -0,0 +1,94 @@
+from typing import Iterable
+
+from systems.quests.factions import get_faction_id_for_roles
+from systems.quests.quest_manager import QuestManager
+from systems.quests.wandering.models import WanderingEvent
+from systems.seasonal.state import get_season_state
+from . import season, wandering
+
+QUEST_POINTS = 5
+
+
+class GameEngine:
+    """
+    Discord-free facade over the game rules.
+
+    Every call takes plain user ids / role id collections and returns
+    plain data, so the Discord layer only has to translate interactions
+    in and render results out.
+    """
+
+    def __init__(self, quest_manager: QuestManager | None = None):
+        self.quest_manager = quest_manager if quest_manager is not None else QuestManager()
+
+    # -----------------------------------------------------
+    # Daily quests
+    # -----------------------------------------------------
+    def assign(self, user_id: int, role_ids: Iterable[int]) -> str | None:
+        return self.quest_manager.assign_daily(user_id, list(role_ids))
+
+    def complete(self, user_id: int, role_ids: Iterable[int], points: int = QUEST_POINTS) -> dict:
+        """
+        Complete the user's daily quest and award board points.
+        Result keys: completed, new_badges, level_up, faction_id, points.
+        """
+        result = self.quest_manager.complete_daily(user_id)
+        faction_id = get_faction_id_for_roles(role_ids)
+
+        result["faction_id"] = faction_id
+        result["points"] = 0
+
+        if result.get("completed"):
+            self.award(user_id, points, faction_id)
+            result["points"] = points
+
+        return result
+
+    def award(self, user_id: int, amount: int, faction_id: str | None = None):
+        self.quest_manager.award_points(user_id, amount, faction_id)
+
+    # -----------------------------------------------------
+    # Seasonal boss
+    # -----------------------------------------------------
+    def vote(self, user_id: int, role_ids: Iterable[int], action: str) -> str:
+        return season.cast_vote(user_id, role_ids, action)
+
+    def resolve(self, force_vote_reset: bool = False) -> dict | None:
+        return season.resolve_season_day(get_season_state(), force_vote_reset=force_vote_reset)
+
+    def start_season(
+        self,
+        state: dict,
+        expected_votes: int,
+        target_days: int = 7,
+        difficulty: str = "normal",
+    ):
+        season.initialize_season_boss_and_factions(
+            state,
+            self.quest_manager.quest_board,
+            expected_votes,
+            target_days=target_days,
+            difficulty=difficulty,
+        )
+
+    # -----------------------------------------------------
+    # Wandering events
+    # -----------------------------------------------------
+    def spawn(
+        self,
+        title: str,
+        description: str,
+        difficulty: str,
+        channel_id: int,
+        image: str | None = None,
+    ) -> WanderingEvent:
+        return wandering.create_event(title, description, difficulty, channel_id, image)
+
+    def join(self, event: WanderingEvent | None, user_id: int) -> str:
+        player = self.quest_manager.get_player(user_id)
+        faction_id = player.faction_id if player else None
+        return wandering.join_event(event, user_id, faction_id)
+
+    def resolve_event(self, event: WanderingEvent) -> dict | None:
+        """Reward deltas on success (see QuestManager.reward_players), None on failure."""
+        return wandering.apply_event_rewards(self.quest_manager, event)
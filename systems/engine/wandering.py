@@ -0,0 +1,176 @@
+import random
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from systems import clock
+from systems.quests.wandering.models import WanderingEvent
+from systems.quests.wandering.monsters import WANDERING_MONSTERS
+from systems.stats import WANDERING_CLEAR, WANDERING_FAIL, WANDERING_JOIN, activity
+
+
+EVENT_INTERVAL = 3 * 60 * 60  # 3 hours
+SPAWN_HOURS = [0, 4, 8, 12, 16, 20]
+
+DIFFICULTY_TABLE = {
+    "test":    {"minutes": 5,  "required": 1,  "faction": 5,  "global": 5,  "xp": 10},
+    "minor":   {"minutes": 15, "required": 3,  "faction": 10, "global": 10, "xp": 20},
+    "standard":{"minutes": 20, "required": 5,  "faction": 20, "global": 20, "xp": 30},
+    "major":   {"minutes": 30, "required": 8,  "faction": 30, "global": 25, "xp": 40},
+    "critical":{"minutes": 30, "required": 12, "faction": 40, "global": 30, "xp": 50},
+}
+
+DIFFICULTY_SPAWN_WEIGHT = {
+    "minor": 50,
+    "standard": 25,
+    "major": 10,
+    "critical": 3,
+}
+
+# join_event() outcomes
+JOIN_OK = "ok"
+JOIN_INACTIVE = "inactive"
+JOIN_ENDED = "ended"
+JOIN_ALREADY = "already"
+
+
+def seconds_until_next_spawn(spawn_hours: list[int]) -> float:
+    now = clock.now()
+    today = now.date()
+
+    candidates = []
+
+    for hour in spawn_hours:
+        candidate = datetime(
+            year=today.year,
+            month=today.month,
+            day=today.day,
+            hour=hour,
+            minute=0,
+            second=0,
+            tzinfo=timezone.utc,
+        )
+        GRACE_SECONDS = 60  # allow 1 minute late
+
+        if candidate + timedelta(seconds=GRACE_SECONDS) > now:
+            candidates.append(candidate)
+
+    # If no times left today, take first spawn tomorrow
+    if not candidates:
+        first_hour = min(spawn_hours)
+        candidate = datetime(
+            year=today.year,
+            month=today.month,
+            day=today.day,
+            hour=first_hour,
+            minute=0,
+            second=0,
+            tzinfo=timezone.utc,
+        ) + timedelta(days=1)
+        candidates.append(candidate)
+
+    next_spawn = min(candidates)
+    return (next_spawn - now).total_seconds()
+
+
+def get_next_spawn_time() -> datetime:
+    delay = seconds_until_next_spawn(SPAWN_HOURS)
+    return clock.now() + timedelta(seconds=delay)
+
+
+def pick_random_monster():
+    # 1️⃣ Pick difficulty first (excluding test)
+    difficulties = list(DIFFICULTY_SPAWN_WEIGHT.keys())
+    weights = list(DIFFICULTY_SPAWN_WEIGHT.values())
+
+    difficulty = random.choices(
+        difficulties,
+        weights=weights,
+        k=1,
+    )[0]
+
+    # 2️⃣ Pick any monster of that difficulty
+    candidates = [
+        m for m in WANDERING_MONSTERS
+        if m["difficulty"] == difficulty
+    ]
+
+    if not candidates:
+        raise RuntimeError(f"No monsters defined for difficulty '{difficulty}'")
+
+    return random.choice(candidates)
+
+
+def create_event(
+    title: str,
+    description: str,
+    difficulty: str,
+    channel_id: int,
+    image: str | None = None,
+) -> WanderingEvent:
+    """Build a new (unposted) wandering event from the difficulty table."""
+    if difficulty not in DIFFICULTY_TABLE:
+        raise ValueError(f"Invalid difficulty: {difficulty}")
+
+    cfg = DIFFICULTY_TABLE[difficulty]
+    ends_at = clock.now() + timedelta(minutes=cfg["minutes"])
+
+    return WanderingEvent(
+        event_id=secrets.token_hex(8),
+        channel_id=channel_id,
+        message_id=None,
+        duration_minutes=cfg["minutes"],
+        ends_at=ends_at,
+        title=title,
+        description=description,
+        difficulty=difficulty,
+        required_participants=cfg["required"],
+        faction_reward=cfg["faction"],
+        global_reward=cfg["global"],
+        xp_reward=cfg["xp"],
+        image=image,
+    )
+
+
+def join_event(event: WanderingEvent | None, user_id: int, faction_id: str | None) -> str:
+    """Add a hunter to the event. Returns one of the JOIN_* outcomes."""
+    if not event:
+        return JOIN_INACTIVE
+
+    if event.resolved or clock.now() >= event.ends_at:
+        return JOIN_ENDED
+
+    if user_id in event.participants:
+        return JOIN_ALREADY
+
+    event.participants.add(user_id)
+
+    if faction_id:
+        event.participating_factions.add(faction_id)
+
+    activity.record(WANDERING_JOIN)
+    return JOIN_OK
+
+
+def is_event_successful(event: WanderingEvent) -> bool:
+    return len(event.participants) >= event.required_participants
+
+
+def apply_event_rewards(quest_manager, event: WanderingEvent) -> dict | None:
+    """
+    Apply board + player rewards for a finished event.
+    Returns the reward deltas from QuestManager.reward_players
+    (level-ups / new badges to announce), or None if the hunt failed.
+    """
+    if not is_event_successful(event):
+        activity.record(WANDERING_FAIL)
+        return None
+
+    activity.record(WANDERING_CLEAR)
+    return quest_manager.reward_players(
+        event.participants,
+        xp=event.xp_reward,
+        monsters=1,
+        # 🌍 global ONCE, ⚡ faction power per participating faction
+        global_points=event.global_reward,
+        faction_points={fid: event.faction_reward for fid in event.participating_factions},
+    )
@@ -0,0 +1 @@
+from .pages import PAGE_SIZE, Listing, ListingCache, Page, listing_cache, make_filter
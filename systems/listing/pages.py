@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+# ========= Listing Settings =========
+PAGE_SIZE = 15
+MAX_LINE_CHARS = 200           # 15 × 200 stays well inside an embed description
+MAX_CACHED_FILTERS = 16        # per listing
+
+
+@dataclass
+class Listing:
+    """
+    How to list one id → item map.
+
+    `version()` must change whenever the map does; everything derived from
+    it (sorted keys, facets, rendered pages) is reused until then.
+    `facets(item)` returns filter tokens such as "type:SOCIAL", "tag:rare"
+    or "role:123"; a filter matches items carrying all of its tokens.
+    """
+    name: str
+    title: str
+    source: Callable[[], dict]
+    version: Callable[[], int]
+    render: Callable[[object, object], str]
+    facets: Callable[[object], Iterable[str]] = lambda item: ()
+    sort_key: Callable[[object, object], object] | None = None
+    empty_text: str = "Nothing to list."
+
+
+@dataclass
+class Page:
+    title: str
+    text: str
+    number: int       # 0-based
+    pages: int
+    total: int        # entries matching the filter
+
+
+@dataclass
+class _Index:
+    version: object
+    keys: list                                   # all ids, sorted
+    facets: dict                                 # id → frozenset of tokens
+    filtered: OrderedDict = field(default_factory=OrderedDict)   # filter → [ids]
+    rendered: dict = field(default_factory=dict)                 # (filter, page) → text
+
+
+def make_filter(**tokens) -> tuple:
+    """make_filter(type="SOCIAL", tag=None) → ("type:SOCIAL",); empty values are dropped."""
+    return tuple(sorted(f"{k}:{v}" for k, v in tokens.items() if v not in (None, "")))
+
+
+def _clip(line: str) -> str:
+    return line if len(line) <= MAX_LINE_CHARS else line[:MAX_LINE_CHARS - 1] + "…"
+
+
+class ListingCache:
+    """
+    Sorted key index + rendered pages per listing, rebuilt only when the
+    listing's version changes. Only the page being looked at is rendered.
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE):
+        self.page_size = page_size
+        self._indexes: dict[str, _Index] = {}
+        self.renders = 0   # lines rendered since start
+
+    def _index(self, listing: Listing, items: dict) -> _Index:
+        version = listing.version()
+        index = self._indexes.get(listing.name)
+        if index is None or index.version != version:
+            if listing.sort_key is None:
+                keys = sorted(items)
+            else:
+                keys = sorted(items, key=lambda k: listing.sort_key(k, items[k]))
+            index = self._indexes[listing.name] = _Index(version=version, keys=keys, facets={})
+        return index
+
+    def _matching(self, listing: Listing, index: _Index, items: dict, flt: tuple) -> list:
+        keys = index.filtered.get(flt)
+        if keys is not None:
+            index.filtered.move_to_end(flt)
+            return keys
+
+        if not flt:
+            keys = index.keys
+        else:
+            wanted = set(flt)
+            keys = []
+            for key in index.keys:
+                tokens = index.facets.get(key)
+                if tokens is None:
+                    tokens = index.facets[key] = frozenset(listing.facets(items[key]))
+                if wanted <= tokens:
+                    keys.append(key)
+
+        index.filtered[flt] = keys
+        if len(index.filtered) > MAX_CACHED_FILTERS:
+            dropped, _ = index.filtered.popitem(last=False)
+            index.rendered = {k: v for k, v in index.rendered.items() if k[0] != dropped}
+        return keys
+
+    def page(self, listing: Listing, flt: tuple = (), number: int = 0) -> Page:
+        items = listing.source()
+        index = self._index(listing, items)
+        keys = self._matching(listing, index, items, flt)
+
+        pages = max(1, -(-len(keys) // self.page_size))
+        number = min(max(number, 0), pages - 1)
+        title = listing.title + (f" — {', '.join(flt)}" if flt else "")
+
+        text = index.rendered.get((flt, number))
+        if text is None:
+            start = number * self.page_size
+            chunk = keys[start:start + self.page_size]
+            self.renders += len(chunk)
+            text = "\n".join(_clip(listing.render(key, items[key])) for key in chunk) or listing.empty_text
+            index.rendered[(flt, number)] = text
+
+        return Page(title=title, text=text, number=number, pages=pages, total=len(keys))
+
+    def invalidate(self, name: str | None = None):
+        if name is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(name, None)
+
+
+listing_cache = ListingCache()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+import discord
+
+from .pages import Listing, Page, listing_cache
+
+LIST_VIEW_TIMEOUT = 300
+
+
+def build_page_embed(page: Page) -> discord.Embed:
+    embed = discord.Embed(title=page.title, description=page.text, color=discord.Color.blurple())
+    embed.set_footer(text=f"Page {page.number + 1}/{page.pages} • {page.total} entries")
+    return embed
+
+
+class ListingView(discord.ui.View):
+    """◀ / ▶ pager over a Listing. Each click renders (or reuses) just that page."""
+
+    def __init__(self, listing: Listing, flt: tuple = (), owner_id: int | None = None):
+        super().__init__(timeout=LIST_VIEW_TIMEOUT)
+        self.listing = listing
+        self.flt = flt
+        self.owner_id = owner_id
+        self.number = 0
+
+    def current(self) -> Page:
+        page = listing_cache.page(self.listing, self.flt, self.number)
+        # The map may have shrunk since the last click
+        self.number = page.number
+        self.prev_page.disabled = page.number == 0
+        self.next_page.disabled = page.number >= page.pages - 1
+        return page
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if self.owner_id is not None and interaction.user.id != self.owner_id:
+            await interaction.response.send_message("❌ This list belongs to someone else.", ephemeral=True)
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction, step: int):
+        self.number += step
+        page = self.current()
+        await interaction.response.edit_message(embed=build_page_embed(page), view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, -1)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, 1)
+
+    @discord.ui.button(label="🔄", style=discord.ButtonStyle.secondary)
+    async def refresh(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, 0)
+
+
+async def send_listing(interaction: discord.Interaction, listing: Listing, flt: tuple = ()):
+    view = ListingView(listing, flt, owner_id=interaction.user.id)
+    page = view.current()
+    if page.total == 0:
+        return await interaction.response.send_message(f"ℹ️ {listing.empty_text}", ephemeral=True)
+    if page.pages == 1:
+        view = discord.utils.MISSING
+    await interaction.response.send_message(embed=build_page_embed(page), view=view, ephemeral=True)
@@ -0,0 +1,2 @@
+from .dispatcher import Dropped, OutboundDispatcher, Priority, channel_route, outbound, webhook_route
+from .effects import EffectRun
@@ -0,0 +1,195 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Callable
+
+import discord
+
+from .dispatcher import Priority, channel_route, outbound
+from .render import NO_VERSION
+
+
+class AnchorsNotBound(RuntimeError):
+    """An anchored message was used before bind() gave the registry a client."""
+
+
+@dataclass
+class Anchor:
+    """
+    A long-lived bot message whose (channel_id, message_id) lives in some
+    owner's state (board, season state, wandering event). `get` / `set`
+    read and persist that pair; `recreate` returns send kwargs for a
+    replacement when the message has been deleted, or None to let it go.
+    """
+    name: str
+    get: Callable[[], tuple[int | None, int | None]]
+    set: Callable[[int | None, int | None], None]
+    recreate: Callable[[], dict | None] | None = None
+
+
+class AnchorRegistry:
+    """
+    One place to reach anchored messages.
+
+    - partial() hands out PartialMessage handles built from cached ids —
+      edits and deletes never need a fetch first.
+    - A NotFound on edit heals the anchor: the owner's recreate() payload
+      is posted in the same channel and the new id stored, or the anchor
+      is cleared when there's nothing to recreate.
+    - Persistent views are added to the client at bind() so buttons on
+      old messages keep working across restarts.
+    - warm() checks every anchor concurrently at boot.
+    """
+
+    def __init__(self):
+        self.client: discord.Client | None = None
+        self._anchors: dict[str, Anchor] = {}
+        self._views: list[discord.ui.View] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._healing: dict[str, asyncio.Task] = {}
+        self.stats = {"edits": 0, "healed": 0, "cleared": 0}
+
+    # ---------- Setup ----------
+    def bind(self, client: discord.Client):
+        self.client = client
+        for view in self._views:
+            client.add_view(view)
+
+    def add_persistent_view(self, view: discord.ui.View):
+        """Register a timeout=None view whose items all carry stable custom_ids."""
+        self._views.append(view)
+        if self.client is not None:
+            self.client.add_view(view)
+
+    def register(self, name: str, *, get, set, recreate=None):
+        self._anchors[name] = Anchor(name=name, get=get, set=set, recreate=recreate)
+
+    def unregister(self, name: str):
+        self._anchors.pop(name, None)
+
+    # ---------- Handles ----------
+    def location(self, name: str) -> tuple[int, int] | None:
+        anchor = self._anchors.get(name)
+        if anchor is None:
+            return None
+        channel_id, message_id = anchor.get()
+        return (channel_id, message_id) if channel_id and message_id else None
+
+    def _client(self) -> discord.Client:
+        if self.client is None:
+            # Failing loudly: a silent None here turns every edit into a no-op
+            raise AnchorsNotBound("anchor registry has no client; call anchors.bind() first")
+        return self.client
+
+    def channel(self, channel_id: int):
+        """Cached channel, else a partial messageable — no REST either way."""
+        client = self._client()
+        return client.get_channel(channel_id) or client.get_partial_messageable(channel_id)
+
+    def partial(self, name: str) -> discord.PartialMessage | None:
+        """Handle to the anchored message, or None if the anchor isn't set."""
+        self._client()
+        where = self.location(name)
+        if where is None:
+            return None
+        channel_id, message_id = where
+        return self.channel(channel_id).get_partial_message(message_id)
+
+    # ---------- Operations ----------
+    async def edit(self, name: str, *, version=NO_VERSION, force: bool = False, **edit_kwargs) -> bool:
+        """
+        Queue an edit of the anchored message (see OutboundDispatcher.queue_edit).
+        Returns True if the anchor still points at a live message afterwards.
+        """
+        message = self.partial(name)
+        if message is None:
+            return False
+        if force:
+            outbound.forget_render(message.channel.id, message.id)
+
+        try:
+            await outbound.queue_edit(message.channel, message.id, message=message, version=version, **edit_kwargs)
+            self.stats["edits"] += 1
+            return True
+        except discord.NotFound:
+            return await self.heal(name)
+
+    def edit_soon(self, name: str, **kwargs):
+        """Fire-and-forget edit() for handlers that must answer the interaction first."""
+        task = asyncio.get_running_loop().create_task(self.edit(name, **kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def delete(self, name: str) -> bool:
+        message = self.partial(name)
+        if message is None:
+            return False
+        try:
+            await outbound.submit(Priority.EMBED, channel_route(message.channel.id), message.delete)
+            return True
+        except discord.NotFound:
+            return False
+        finally:
+            outbound.forget_render(message.channel.id, message.id)
+
+    async def heal(self, name: str) -> bool:
+        """The anchored message is gone: post a replacement, or clear the anchor."""
+        # An edit and warm() can notice the same loss at once — repost only once
+        task = self._healing.get(name)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._heal(name))
+            self._healing[name] = task
+            task.add_done_callback(lambda _: self._healing.pop(name, None))
+        return await asyncio.shield(task)
+
+    async def _heal(self, name: str) -> bool:
+        anchor = self._anchors.get(name)
+        where = self.location(name)
+        if anchor is None or where is None:
+            return False
+        channel_id, message_id = where
+        outbound.forget_render(channel_id, message_id)
+
+        payload = anchor.recreate() if anchor.recreate else None
+        if payload:
+            channel = self.channel(channel_id)
+            try:
+                msg = await outbound.submit(
+                    Priority.EMBED, channel_route(channel_id), lambda: channel.send(**payload)
+                )
+                anchor.set(channel_id, msg.id)
+                self.stats["healed"] += 1
+                print(f"[ANCHOR] {name}: message {message_id} was missing — reposted as {msg.id}")
+                return True
+            except (discord.NotFound, discord.Forbidden) as e:
+                print(f"[ANCHOR] {name}: could not repost in channel {channel_id}: {e}")
+
+        anchor.set(None, None)
+        self.stats["cleared"] += 1
+        print(f"[ANCHOR] {name}: message {message_id} missing — anchor cleared")
+        return False
+
+    async def _check(self, name: str) -> str:
+        where = self.location(name)
+        if where is None:
+            return "unset"
+        channel_id, message_id = where
+        try:
+            channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(channel_id)
+            await channel.fetch_message(message_id)
+            return "ok"
+        except discord.NotFound:
+            return "healed" if await self.heal(name) else "cleared"
+        except Exception as e:
+            return f"error: {e}"
+
+    async def warm(self) -> dict[str, str]:
+        """Check (and heal) every anchor concurrently. Returns name → status."""
+        names = list(self._anchors)
+        results = await asyncio.gather(*(self._check(name) for name in names))
+        status = dict(zip(names, results))
+        print("[ANCHOR] " + ", ".join(f"{name}: {result}" for name, result in status.items()))
+        return status
+
+
+# Process-wide registry; bound to the bot in setup_hook
+anchors = AnchorRegistry()
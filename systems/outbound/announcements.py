@@ -0,0 +1,227 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import discord
+
+from systems import clock
+from systems.badges.definitions import BADGES
+
+from .dispatcher import Dropped, Priority, channel_route, outbound
+
+DEFAULT_WINDOW_SECONDS = 15
+
+# Discord embed limits
+EMBED_TOTAL_LIMIT = 6000
+EMBED_FIELD_LIMIT = 25
+FIELD_VALUE_LIMIT = 1024
+# Headroom for titles/author/footer when packing fields
+EMBED_BUDGET = EMBED_TOTAL_LIMIT - 500
+
+
+@dataclass
+class _MemberProgress:
+    user_id: int
+    name: str | None = None
+    badges: list[str] = field(default_factory=list)
+    level: int | None = None
+
+    @property
+    def label(self) -> str:
+        return f"**{self.name}**" if self.name else f"<@{self.user_id}>"
+
+
+def _badge_text(badge_id: str) -> str:
+    badge = BADGES[badge_id]
+    return f"{badge['emoji']} **{badge['name']}**"
+
+
+def _chunk_lines(lines: list[str], limit: int = FIELD_VALUE_LIMIT) -> list[str]:
+    chunks, current = [], ""
+    for line in lines:
+        if len(line) > limit:
+            line = line[: limit - 1] + "…"
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_single_embed(entry: _MemberProgress) -> discord.Embed:
+    """One member in the window — same wording as the old per-event posts."""
+    parts = []
+    badges = [b for b in entry.badges if b in BADGES]
+    if badges:
+        parts.append(
+            f"🏅 {entry.label} has earned a new guild badge!\n\n"
+            + "\n".join(_badge_text(b) for b in badges)
+        )
+    if entry.level:
+        parts.append(f"🌟 {entry.label} has reached **Level {entry.level}**!")
+
+    color = discord.Color.gold() if badges else discord.Color.blurple()
+    return discord.Embed(description="\n\n".join(parts), color=color)
+
+
+def build_digest_embeds(entries: list[_MemberProgress]) -> list[discord.Embed]:
+    """Pack badge + level-up lines into as few embeds as the limits allow."""
+    badge_lines = [
+        f"{e.label} — " + ", ".join(_badge_text(b) for b in e.badges if b in BADGES)
+        for e in entries
+        if any(b in BADGES for b in e.badges)
+    ]
+    level_lines = [
+        f"{e.label} reached **Level {e.level}**"
+        for e in sorted((e for e in entries if e.level), key=lambda e: -e.level)
+    ]
+
+    fields = [("🏅 New Guild Badges", chunk) for chunk in _chunk_lines(badge_lines)]
+    fields += [("🌟 Level Ups", chunk) for chunk in _chunk_lines(level_lines)]
+
+    embeds, embed, size = [], None, 0
+    for name, value in fields:
+        cost = len(name) + len(value)
+        if embed is None or len(embed.fields) >= EMBED_FIELD_LIMIT or size + cost > EMBED_BUDGET:
+            embed = discord.Embed(
+                description="📣 **Guild progress update**" if not embeds else None,
+                color=discord.Color.gold(),
+            )
+            embeds.append(embed)
+            size = 0
+        embed.add_field(name=name, value=value, inline=False)
+        size += cost
+    return embeds
+
+
+class AnnouncementBatcher:
+    """
+    Collects badge and level-up events for BADGE_ANNOUNCE_CHANNEL_ID and
+    posts them as one digest per `window_seconds` instead of one embed per
+    event. Repeat events for the same member inside a window merge (badges
+    union, highest level wins).
+    """
+
+    def __init__(self, channel_id: int, author=None, window_seconds: float = DEFAULT_WINDOW_SECONDS):
+        self.channel_id = channel_id
+        # Zero-arg callable returning the NPC (name, avatar_url) to post as
+        self.author = author
+        self.window_seconds = window_seconds
+
+        self.pending: dict[int, _MemberProgress] = {}
+        self._bot = None
+        self._channel = None
+        self._flush_task: asyncio.Task | None = None
+
+    def start(self, bot):
+        self._bot = bot
+        if self.pending:
+            self._schedule_flush()
+
+    def add(self, user_id: int, name: str | None = None, badges=(), level: int | None = None):
+        if not self.channel_id or (not badges and not level):
+            return
+
+        entry = self.pending.get(user_id)
+        if entry is None:
+            entry = self.pending[user_id] = _MemberProgress(user_id=user_id)
+        if name:
+            entry.name = name
+        for badge_id in badges:
+            if badge_id not in entry.badges:
+                entry.badges.append(badge_id)
+        if level and (entry.level is None or level > entry.level):
+            entry.level = level
+
+        if self._bot is not None:
+            self._schedule_flush()
+
+    async def flush(self) -> int:
+        """Post the current window and wait for it. Returns the number of embeds sent."""
+        if not self.pending:
+            return 0
+
+        # Resolve first: if either is missing the window stays pending for the next try
+        channel = await self._resolve_channel()
+        npc = self.author() if self.author else None
+        if channel is None or npc is None:
+            return 0
+
+        # Taken after the await so entries added while resolving ride along
+        entries = list(self.pending.values())
+        self.pending = {}
+
+        if len(entries) == 1:
+            embeds = [build_single_embed(entries[0])]
+        else:
+            embeds = build_digest_embeds(entries)
+
+        for embed in embeds:
+            embed.set_author(name=npc.name, icon_url=npc.avatar_url)
+        results = await asyncio.gather(
+            *(
+                outbound.submit(Priority.ANNOUNCE, channel_route(channel.id), lambda e=embed: channel.send(embed=e))
+                for embed in embeds
+            ),
+            return_exceptions=True,
+        )
+
+        failed = [r for r in results if isinstance(r, Exception)]
+        if failed:
+            if not isinstance(failed[0], Dropped):
+                # The channel may have been deleted or re-permissioned
+                self._channel = None
+            if len(failed) == len(embeds):
+                # Nothing went out: the whole window waits for the next flush
+                print(f"[ANNOUNCE] Digest failed ({failed[0]}); keeping {len(entries)} members")
+                self._restore(entries)
+            else:
+                # Lines aren't tracked per embed; re-posting would repeat the ones that landed
+                print(f"[ANNOUNCE] {len(failed)}/{len(embeds)} digest embeds failed ({failed[0]}); those lines are lost")
+        return len(embeds) - len(failed)
+
+    # ---------- Internals ----------
+    def _restore(self, entries: list[_MemberProgress]):
+        """Put an unsent window back, merged with anything added since."""
+        for entry in entries:
+            newer = self.pending.get(entry.user_id)
+            self.pending[entry.user_id] = entry
+            if newer is not None:
+                self.add(newer.user_id, newer.name, newer.badges, newer.level)
+
+    def _schedule_flush(self):
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self):
+        await clock.sleep(self.window_seconds)
+        sent = 0
+        try:
+            sent = await self.flush()
+        except Exception as e:
+            print(f"[ANNOUNCE] Digest failed: {e}")
+        finally:
+            self._flush_task = None
+
+        # add() during the flush saw this task still running and didn't schedule;
+        # only retry on our own when the flush got through, not on a missing channel
+        if sent and self.pending:
+            self._schedule_flush()
+
+    async def _resolve_channel(self):
+        if self._channel is not None:
+            return self._channel
+        if self._bot is None:
+            return None
+
+        channel = self._bot.get_channel(self.channel_id)
+        if channel is None:
+            try:
+                channel = await self._bot.fetch_channel(self.channel_id)
+            except Exception as e:
+                print(f"[ANNOUNCE] Could not resolve channel {self.channel_id}: {e}")
+                return None
+
+        self._channel = channel
+        return channel
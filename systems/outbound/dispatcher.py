@@ -0,0 +1,433 @@
+import asyncio
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Hashable
+
+from systems import clock
+from .render import NO_VERSION, RenderCache
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Static budgets mirroring Discord's published limits
+GLOBAL_RATE = 50.0           # requests / second, bot-wide
+CHANNEL_BUCKET = (5, 5.0)    # 5 requests per 5 s per channel
+WEBHOOK_BUCKET = (5, 2.0)    # 5 requests per 2 s per webhook
+
+
+class Priority(IntEnum):
+    INTERACTION = 0   # direct replies to a user action
+    EMBED = 1         # board / seasonal / wandering embed edits
+    ANNOUNCE = 2      # spawns, results, badges, level-ups
+    LOG = 3           # points-log / admin audit lines
+
+
+# =================================================
+# ===============  TOKEN BUCKETS  =================
+# =================================================
+
+class TokenBucket:
+    def __init__(self, capacity: float, per_seconds: float):
+        self.capacity = capacity
+        self.rate = capacity / per_seconds
+        self.tokens = capacity
+        self.updated = 0.0
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        if self.updated:
+            self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+    def block(self, now: float, seconds: float):
+        """Back off after a 429."""
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0
+
+
+def _now() -> float:
+    # Bucket and staleness time follow the game clock, so a simulated
+    # run refills buckets as its virtual time advances
+    return clock.now().timestamp()
+
+
+class Dropped(Exception):
+    """The request was dropped (stale or evicted LOG line) and never sent."""
+
+
+def channel_route(channel_id: int) -> str:
+    return f"channel:{channel_id}"
+
+
+def webhook_route(webhook_id: int) -> str:
+    return f"webhook:{webhook_id}"
+
+
+def _bucket_for_route(route: str) -> TokenBucket:
+    if route.startswith("webhook:"):
+        return TokenBucket(*WEBHOOK_BUCKET)
+    return TokenBucket(*CHANNEL_BUCKET)
+
+
+# =================================================
+# ===============  QUEUED REQUESTS  ===============
+# =================================================
+
+@dataclass
+class _Request:
+    seq: int
+    priority: Priority
+    route: str
+    factory: Callable[[], Awaitable[Any]]
+    enqueued_at: float
+    key: Hashable | None = None
+    text: str | None = None
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+def _consume_exception(fut: asyncio.Future):
+    # Fire-and-forget callers never await; don't warn about unretrieved errors
+    if not fut.cancelled():
+        fut.exception()
+
+
+class OutboundDispatcher:
+    """
+    Single choke point for bot-initiated REST calls.
+
+    Requests are queued per Priority and released highest-priority-first,
+    as soon as both the global bucket and the request's route bucket have
+    a token, so a busy log channel never holds up an embed edit.
+
+    - submit(key=...) coalesces: a pending request with the same key
+      (e.g. an edit to one message) is superseded by the newer one.
+    - send_text() under backpressure merges LOG lines bound for the
+      same channel into one message, and drops LOG lines older than
+      `stale_after` seconds instead of sending them late (their futures
+      raise Dropped).
+    - Bucket time, staleness and waits follow systems.clock.
+    - edit_message() skips edits that wouldn't change what the message
+      shows (see RenderCache) — no fetch, no PATCH, no bucket token.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        backpressure_at: int = 50,
+        max_pending: int = 1000,
+        stale_after: float = 120.0,
+    ):
+        self.concurrency = concurrency
+        self.backpressure_at = backpressure_at
+        self.max_pending = max_pending
+        self.stale_after = stale_after
+
+        self._queues: dict[Priority, deque[_Request]] = {p: deque() for p in Priority}
+        self._by_key: dict[Hashable, _Request] = {}
+        self._open_text: dict[tuple[str, Priority], _Request] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._global = TokenBucket(GLOBAL_RATE, 1.0)
+        self._seq = itertools.count()
+
+        self._runner: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self.render = RenderCache()
+
+        self.stats = {
+            "submitted": 0, "sent": 0, "failed": 0,
+            "coalesced": 0, "merged": 0, "dropped": 0, "rate_limited": 0,
+        }
+
+    # ---------- Public API ----------
+    @property
+    def pending(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def depth_by_priority(self) -> dict[str, int]:
+        return {p.name: len(q) for p, q in self._queues.items()}
+
+    def submit(
+        self,
+        priority: Priority,
+        route: str,
+        factory: Callable[[], Awaitable[Any]],
+        key: Hashable | None = None,
+    ) -> asyncio.Future:
+        """
+        Queue `factory()` (called only when the request is released).
+        Returns a future for its result; awaiting it is optional.
+        """
+        fut = self._new_future()
+        self.stats["submitted"] += 1
+
+        if key is not None and key in self._by_key:
+            req = self._by_key[key]
+            req.factory = factory
+            req.futures.append(fut)
+            self.stats["coalesced"] += 1
+            return fut
+
+        req = self._enqueue(priority, route, factory, fut)
+        if key is not None:
+            req.key = key
+            self._by_key[key] = req
+        return fut
+
+    def send_text(self, channel, content: str, priority: Priority = Priority.LOG) -> asyncio.Future:
+        """Queue channel.send(content); merges with a pending line under backpressure."""
+        route = channel_route(channel.id)
+        fut = self._new_future()
+        self.stats["submitted"] += 1
+
+        open_req = self._open_text.get((route, priority))
+        if (
+            open_req is not None
+            and self.pending >= self.backpressure_at
+            and len(open_req.text) + 1 + len(content) <= DISCORD_MESSAGE_LIMIT
+        ):
+            open_req.text += "\n" + content
+            open_req.futures.append(fut)
+            self.stats["merged"] += 1
+            return fut
+
+        req = self._enqueue(priority, route, None, fut)
+        req.text = content
+        req.factory = lambda: channel.send(req.text)
+        self._open_text[(route, priority)] = req
+        return fut
+
+    def queue_edit(
+        self,
+        channel,
+        message_id: int,
+        priority: Priority = Priority.EMBED,
+        *,
+        message=None,
+        version=NO_VERSION,
+        **edit_kwargs,
+    ) -> asyncio.Future:
+        """
+        Coalesced fetch + edit. `edit_kwargs` values may be zero-arg callables,
+        evaluated once: at submit time when a `version` pins the state they
+        render, otherwise at send time so a superseded edit always ships the
+        newest state.
+
+        `version` identifies the source state; an edit whose version (or,
+        failing that, rendered content) matches what the message already
+        shows is dropped. Pass `message` to skip the fetch.
+        """
+        key = ("edit", channel.id, message_id)
+        shown_key = (channel.id, message_id)
+        # A payload rendered here for a known version is still that version's at send time
+        rendered = None
+
+        if key not in self._by_key:
+            # Nothing queued for this message — it shows the last recorded payload
+            if self.render.unchanged_version(shown_key, version):
+                return self._done_future()
+            if version is not NO_VERSION:
+                payload = self.render.render(edit_kwargs)
+                unchanged, digest = self.render.unchanged_payload(shown_key, version, payload)
+                if unchanged:
+                    return self._done_future()
+                rendered = (payload, digest)
+
+        async def _edit():
+            if self.render.unchanged_version(shown_key, version):
+                return None
+            if rendered is None:
+                payload = self.render.render(edit_kwargs)
+                unchanged, digest = self.render.unchanged_payload(shown_key, version, payload)
+            else:
+                payload, digest = rendered
+                unchanged = self.render.unchanged_digest(shown_key, version, digest)
+            if unchanged:
+                return None
+            msg = message if message is not None else await channel.fetch_message(message_id)
+            result = await msg.edit(**payload)
+            self.render.record(shown_key, version, digest, payload)
+            return result
+
+        return self.submit(priority, channel_route(channel.id), _edit, key=key)
+
+    async def edit_message(self, channel, message_id: int, priority: Priority = Priority.EMBED, **kwargs):
+        """queue_edit() and wait for it."""
+        return await self.queue_edit(channel, message_id, priority, **kwargs)
+
+    def forget_render(self, channel_id: int, message_id: int):
+        """Call after editing an anchored message outside the dispatcher."""
+        self.render.forget((channel_id, message_id))
+
+    async def drain(self):
+        """Wait until everything queued so far has been sent (or dropped)."""
+        while self.pending or self._inflight:
+            futures = [f for q in self._queues.values() for r in q for f in r.futures]
+            futures += list(self._inflight)
+            await asyncio.gather(*futures, return_exceptions=True)
+
+    # ---------- Internals ----------
+    def _done_future(self) -> asyncio.Future:
+        fut = self._new_future()
+        fut.set_result(None)
+        return fut
+
+    def _new_future(self) -> asyncio.Future:
+        self._ensure_running()
+        fut = asyncio.get_running_loop().create_future()
+        fut.add_done_callback(_consume_exception)
+        return fut
+
+    def _enqueue(self, priority, route, factory, fut) -> _Request:
+        if self.pending >= self.max_pending:
+            self._evict_one_log()
+
+        req = _Request(
+            seq=next(self._seq),
+            priority=Priority(priority),
+            route=route,
+            factory=factory,
+            enqueued_at=_now(),
+            futures=[fut],
+        )
+        self._queues[req.priority].append(req)
+        self._wakeup.set()
+        return req
+
+    def _requeue(self, req: _Request):
+        """Put a rate-limited request back at the front of its queue."""
+        if req.key is not None:
+            newer = self._by_key.get(req.key)
+            if newer is not None:
+                # Superseded while in flight: the newer request answers for both
+                newer.futures[:0] = req.futures
+                return
+            self._by_key[req.key] = req
+        self._queues[req.priority].appendleft(req)
+        self._wakeup.set()
+
+    def _evict_one_log(self):
+        logs = self._queues[Priority.LOG]
+        if logs:
+            self._finish_dropped(logs.popleft())
+
+    def _finish_dropped(self, req: _Request):
+        self._forget(req)
+        self.stats["dropped"] += 1
+        for fut in req.futures:
+            if not fut.done():
+                fut.set_exception(Dropped(f"{req.priority.name} to {req.route} dropped unsent"))
+
+    def _forget(self, req: _Request):
+        if req.key is not None and self._by_key.get(req.key) is req:
+            del self._by_key[req.key]
+        if req.text is not None and self._open_text.get((req.route, req.priority)) is req:
+            del self._open_text[(req.route, req.priority)]
+
+    def _bucket(self, route: str) -> TokenBucket:
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = self._buckets[route] = _bucket_for_route(route)
+        return bucket
+
+    def _take_ready(self, now: float) -> tuple[_Request | None, float | None]:
+        """Pop the highest-priority request whose buckets allow it, else the shortest wait."""
+        global_wait = self._global.wait_time(now)
+        if global_wait:
+            return None, global_wait
+
+        backpressured = self.pending >= self.backpressure_at
+        soonest = None
+        for priority in Priority:
+            queue = self._queues[priority]
+            if priority == Priority.LOG and backpressured:
+                while queue and now - queue[0].enqueued_at > self.stale_after:
+                    self._finish_dropped(queue.popleft())
+
+            for req in queue:
+                wait = self._bucket(req.route).wait_time(now)
+                if wait == 0:
+                    queue.remove(req)
+                    self._forget(req)
+                    self._bucket(req.route).take(now)
+                    self._global.take(now)
+                    return req, None
+                soonest = wait if soonest is None else min(soonest, wait)
+        return None, soonest
+
+    def _ensure_running(self):
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    async def _wait(self, seconds: float | None):
+        """Until something is enqueued, or `seconds` of clock time have passed."""
+        waiters = [asyncio.ensure_future(self._wakeup.wait())]
+        if seconds is not None:
+            waiters.append(asyncio.ensure_future(clock.sleep(seconds)))
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            req = None
+            while req is None:
+                req, wait = self._take_ready(_now())
+                if req is None:
+                    self._wakeup.clear()
+                    await self._wait(wait)
+
+            task = loop.create_task(self._execute(req))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+            task.add_done_callback(lambda _: self._slots.release())
+
+    async def _execute(self, req: _Request):
+        try:
+            result = await req.factory()
+        except Exception as e:
+            if getattr(e, "status", None) == 429:
+                # Bucket exhausted server-side: back off this route and retry
+                retry_after = float(getattr(e, "retry_after", 1.0) or 1.0)
+                self.stats["rate_limited"] += 1
+                self._bucket(req.route).block(_now(), retry_after)
+                self._requeue(req)
+                return
+
+            self.stats["failed"] += 1
+            if req.priority >= Priority.ANNOUNCE:
+                print(f"[OUTBOUND] {req.priority.name} to {req.route} failed: {e}")
+            for fut in req.futures:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        self.stats["sent"] += 1
+        for fut in req.futures:
+            if not fut.done():
+                fut.set_result(result)
+
+
+# Process-wide instance; all bot-initiated sends go through this
+outbound = OutboundDispatcher()
@@ -0,0 +1,56 @@
+import asyncio
+import time
+from typing import Any, Awaitable
+
+# ========= Side-Effect Settings =========
+EFFECT_CONCURRENCY = 4    # REST calls one flow may have in flight at once
+
+
+class EffectRun:
+    """
+    The Discord side effects of one flow (a wandering resolution, a spawn).
+
+    Independent steps are started together with gather(); a step that
+    needs another's result simply awaits it first inside its own
+    coroutine. A semaphore bounds how many are in flight, each step's
+    failure is logged and swallowed so the others still happen, and
+    wall-clock time is kept per step and for the whole run.
+    """
+
+    def __init__(self, label: str, limit: int = EFFECT_CONCURRENCY):
+        self.label = label
+        self._limit = asyncio.Semaphore(limit)
+        self._started = time.perf_counter()
+        self.steps: list[tuple[str, float, bool]] = []
+
+    async def step(self, name: str, aw: Awaitable[Any]) -> Any:
+        """Await one side effect; returns its result, or None if it failed."""
+        async with self._limit:
+            t0 = time.perf_counter()
+            ok = True
+            try:
+                return await aw
+            except Exception as e:
+                ok = False
+                print(f"[EFFECTS] {self.label}: {name} failed: {e}")
+                return None
+            finally:
+                self.steps.append((name, time.perf_counter() - t0, ok))
+
+    async def gather(self, *aws: Awaitable[Any]) -> list:
+        # step() never raises, but a bare coroutine passed here might
+        return await asyncio.gather(*aws, return_exceptions=True)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    @property
+    def failed(self) -> list[str]:
+        return [name for name, _, ok in self.steps if not ok]
+
+    def report(self) -> str:
+        parts = ", ".join(
+            f"{name} {seconds * 1000:.0f}ms" + ("" if ok else " ✗") for name, seconds, ok in self.steps
+        )
+        return f"{self.label}: {self.elapsed * 1000:.0f}ms wall ({parts})"
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import os
+
+from systems import clock
+from systems.quests.storage import DATA_DIR
+
+from .dispatcher import DISCORD_MESSAGE_LIMIT, Dropped, Priority, outbound
+
+# Journal of unposted entries: one JSON line per add(), rewritten only by flush()
+POINTS_LOG_PENDING_FILE = os.path.join(DATA_DIR, "points_log_pending.jsonl")
+# Pre-journal format (one JSON array), read once and folded into the journal
+LEGACY_PENDING_FILE = os.path.join(DATA_DIR, "points_log_pending.json")
+DEFAULT_FLUSH_SECONDS = 60
+ENTRY_SEPARATOR = "\n\n"
+
+
+def _valid(entry) -> bool:
+    return isinstance(entry, dict) and bool(entry.get("text"))
+
+
+def _load_pending(path: str, legacy_path: str | None = None) -> list[dict]:
+    entries = []
+    if legacy_path and os.path.exists(legacy_path):
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                entries += [e for e in json.load(f) if _valid(e)]
+        except Exception as e:
+            print(f"[POINTS LOG] Could not read legacy pending entries: {e}")
+
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from a crash mid-append
+                if _valid(entry):
+                    entries.append(entry)
+
+    if legacy_path and os.path.exists(legacy_path):
+        _save_pending(path, entries)
+        os.remove(legacy_path)
+    return entries
+
+
+def _save_pending(path: str, entries: list[dict]):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
+
+
+def _append_pending(path: str, entry: dict):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def pack_batches(entries: list[dict], limit: int = DISCORD_MESSAGE_LIMIT) -> list[tuple[str, list[dict]]]:
+    """Join timestamped entries into as few messages as fit under `limit`, each with its entries."""
+    batches, current, members = [], "", []
+    for entry in entries:
+        line = f"<t:{int(entry['ts'])}:t> {entry['text']}"
+        if len(line) > limit:
+            line = line[: limit - 1] + "…"
+
+        if current and len(current) + len(ENTRY_SEPARATOR) + len(line) > limit:
+            batches.append((current, members))
+            current, members = "", []
+        current = f"{current}{ENTRY_SEPARATOR}{line}" if current else line
+        members.append(entry)
+
+    if current:
+        batches.append((current, members))
+    return batches
+
+
+class PointsLogAggregator:
+    """
+    Buffers points-log / admin-audit lines and posts them as combined
+    messages every `flush_seconds`, or as soon as a message's worth has
+    piled up. Each entry is appended to a journal on disk, so a restart
+    posts them on the next flush instead of losing them; flush() rewrites
+    the journal with whatever is still unsent.
+    """
+
+    def __init__(
+        self,
+        channel_id: int,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+        path: str = POINTS_LOG_PENDING_FILE,
+    ):
+        self.channel_id = channel_id
+        self.flush_seconds = flush_seconds
+        self.path = path
+
+        self.entries: list[dict] = _load_pending(
+            path, LEGACY_PENDING_FILE if path == POINTS_LOG_PENDING_FILE else None
+        )
+        self._chars = sum(len(e["text"]) for e in self.entries)
+        self._bot = None
+        self._channel = None
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    # ---------- Public API ----------
+    def start(self, bot):
+        """Bind the client and start the periodic flusher (idempotent)."""
+        self._bot = bot
+        if not any(t.get_name() == "points-log-flusher" for t in self._tasks):
+            self._spawn(self._flush_loop(), name="points-log-flusher")
+
+    def add(self, text: str):
+        if not self.channel_id or not text:
+            return
+
+        entry = {"ts": clock.now().timestamp(), "text": text}
+        self.entries.append(entry)
+        self._chars += len(text)
+        _append_pending(self.path, entry)
+
+        # A full message is ready — don't wait for the interval
+        if self._bot is not None and self._chars >= DISCORD_MESSAGE_LIMIT and not self._lock.locked():
+            self._spawn(self.flush())
+
+    async def flush(self) -> int:
+        """Post everything buffered. Returns the number of messages sent."""
+        async with self._lock:
+            if not self.entries:
+                return 0
+
+            channel = await self._resolve_channel()
+            if channel is None:
+                return 0
+
+            batches = pack_batches(self.entries)
+            self.entries, self._chars = [], 0
+
+            results = await asyncio.gather(
+                *(outbound.send_text(channel, text, Priority.LOG) for text, _ in batches),
+                return_exceptions=True,
+            )
+            # Dropped (stale under backpressure) counts as unsent, like any other failure
+            unsent = [
+                entry
+                for (_, members), result in zip(batches, results)
+                if isinstance(result, Exception)
+                for entry in members
+            ]
+            failed = [r for r in results if isinstance(r, Exception)]
+            if failed:
+                # Keep only the failed messages' entries; the channel may have been deleted or re-permissioned
+                print(f"[POINTS LOG] {len(failed)}/{len(batches)} messages failed ({failed[0]}); keeping {len(unsent)} entries")
+                if not isinstance(failed[0], Dropped):
+                    self._channel = None
+                self.entries = unsent + self.entries
+                self._chars = sum(len(e["text"]) for e in self.entries)
+
+            _save_pending(self.path, self.entries)
+            return len(batches) - len(failed)
+
+    # ---------- Internals ----------
+    def _spawn(self, coro, name: str | None = None):
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve_channel(self):
+        if self._channel is not None:
+            return self._channel
+        if self._bot is None:
+            return None
+
+        channel = self._bot.get_channel(self.channel_id)
+        if channel is None:
+            try:
+                channel = await self._bot.fetch_channel(self.channel_id)
+            except Exception as e:
+                print(f"[POINTS LOG] Could not resolve channel {self.channel_id}: {e}")
+                return None
+
+        self._channel = channel
+        return channel
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[POINTS LOG] Flush error: {e}")
+            await clock.sleep(self.flush_seconds)
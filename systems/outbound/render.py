@@ -0,0 +1,108 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+# Render-state sentinel: no version supplied by the caller
+NO_VERSION = object()
+
+
+def _component_signature(view) -> list:
+    """What a view looks like on screen. Random custom_ids of non-persistent views are left out."""
+    persistent = view.is_persistent() if hasattr(view, "is_persistent") else False
+    items = []
+    for item in getattr(view, "children", []):
+        style = getattr(item, "style", None)
+        emoji = getattr(item, "emoji", None)
+        items.append([
+            type(item).__name__,
+            getattr(item, "label", None),
+            str(emoji) if emoji else None,
+            getattr(style, "value", style),
+            getattr(item, "disabled", None),
+            getattr(item, "url", None),
+            getattr(item, "row", None),
+            getattr(item, "custom_id", None) if persistent else None,
+        ])
+    return items
+
+
+def _canonical(key: str, value) -> Any:
+    if value is None:
+        return None
+    if key == "view":
+        return _component_signature(value)
+    if key in ("embed", "embeds"):
+        embeds = value if isinstance(value, (list, tuple)) else [value]
+        return [e.to_dict() if hasattr(e, "to_dict") else e for e in embeds]
+    return value if isinstance(value, (str, int, float, bool)) else repr(value)
+
+
+def payload_digest(kwargs: dict) -> str:
+    canonical = {k: _canonical(k, v) for k, v in sorted(kwargs.items())}
+    blob = json.dumps(canonical, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class _Rendered:
+    version: Any
+    digest: str
+    payload: dict
+
+
+class RenderCache:
+    """
+    Last payload successfully shown on each anchored message, with the
+    source-state version it was rendered from and its content hash.
+
+    unchanged_version() and unchanged_payload() answer "would this edit
+    change anything?": an unchanged version skips without rendering;
+    otherwise the payload is rendered and compared by hash. Only successful edits are recorded, and anything
+    that edits the message some other way must forget() it.
+    """
+
+    def __init__(self):
+        self._shown: dict[Hashable, _Rendered] = {}
+        self.stats = {"rendered": 0, "edited": 0, "skipped_version": 0, "skipped_hash": 0}
+
+    @property
+    def avoided(self) -> int:
+        return self.stats["skipped_version"] + self.stats["skipped_hash"]
+
+    def render(self, edit_kwargs: dict) -> dict:
+        """Evaluate zero-arg callables in `edit_kwargs` (embed builders, view factories)."""
+        self.stats["rendered"] += 1
+        return {k: (v() if callable(v) else v) for k, v in edit_kwargs.items()}
+
+    def unchanged_version(self, key: Hashable, version) -> bool:
+        shown = self._shown.get(key)
+        if version is not NO_VERSION and shown is not None and shown.version == version:
+            self.stats["skipped_version"] += 1
+            return True
+        return False
+
+    def unchanged_payload(self, key: Hashable, version, payload: dict) -> tuple[bool, str]:
+        digest = payload_digest(payload)
+        return self.unchanged_digest(key, version, digest), digest
+
+    def unchanged_digest(self, key: Hashable, version, digest: str) -> bool:
+        """unchanged_payload() for a payload already hashed."""
+        shown = self._shown.get(key)
+        if shown is not None and shown.digest == digest:
+            # Same pixels under a new version — remember the version too
+            shown.version = version
+            self.stats["skipped_hash"] += 1
+            return True
+        return False
+
+    def record(self, key: Hashable, version, digest: str, payload: dict):
+        self._shown[key] = _Rendered(version=version, digest=digest, payload=payload)
+        self.stats["edited"] += 1
+
+    def last_payload(self, key: Hashable) -> dict | None:
+        shown = self._shown.get(key)
+        return shown.payload if shown else None
+
+    def forget(self, key: Hashable):
+        self._shown.pop(key, None)
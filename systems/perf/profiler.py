@@ -0,0 +1,126 @@
+import asyncio
+import cProfile
+import io
+import marshal
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+# ========= Profiler Limits =========
+MIN_PROFILE_SECONDS = 1
+MAX_PROFILE_SECONDS = 60          # hard cap so a typo can't profile for an hour
+DEFAULT_PROFILE_SECONDS = 10
+TRACEMALLOC_FRAMES = 5            # deeper stacks = more overhead per allocation
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+# Only one session at a time — cProfile hooks the whole thread
+_session_lock = asyncio.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling session is already running."""
+
+
+@dataclass
+class ProfileReport:
+    seconds: float
+    stats_bytes: bytes      # marshal dump, loadable with pstats / snakeviz
+    report_text: str
+
+
+def is_profiling() -> bool:
+    return _session_lock.locked()
+
+
+def clamp_seconds(seconds: int) -> int:
+    return max(MIN_PROFILE_SECONDS, min(MAX_PROFILE_SECONDS, int(seconds)))
+
+
+def _format_pstats(profiler: cProfile.Profile) -> tuple[bytes, str]:
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    raw = marshal.dumps(stats.stats)
+
+    out.write("=== Top functions by cumulative time ===\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+    out.write("\n=== Top functions by own time ===\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+
+    return raw, out.getvalue()
+
+
+def _format_allocations(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> str:
+    # Hide the profiler's own bookkeeping
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ]
+    before = before.filter_traces(filters)
+    after = after.filter_traces(filters)
+
+    diff = after.compare_to(before, "lineno")
+
+    lines = ["=== Top allocation growth during session ==="]
+    for stat in diff[:TOP_ALLOCATIONS]:
+        lines.append(str(stat))
+
+    current, peak = tracemalloc.get_traced_memory()
+    lines.append("")
+    lines.append(f"Traced memory now: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)")
+    return "\n".join(lines)
+
+
+async def profile_event_loop(seconds: int = DEFAULT_PROFILE_SECONDS) -> ProfileReport:
+    """
+    Profile everything the event loop runs for `seconds` seconds.
+
+    cProfile is attached to the loop's thread, so every callback, task
+    step and command handler executed during the window is captured.
+    A tracemalloc snapshot is taken at both ends and diffed.
+    Raises ProfilerBusyError if another session is in progress.
+    """
+    if _session_lock.locked():
+        raise ProfilerBusyError("A profiling session is already running.")
+
+    async with _session_lock:
+        seconds = clamp_seconds(seconds)
+
+        # Don't stop tracemalloc afterwards if someone else started it
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+        try:
+            before = tracemalloc.take_snapshot()
+
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+
+            after = tracemalloc.take_snapshot()
+            allocations_text = _format_allocations(before, after)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        stats_bytes, pstats_text = _format_pstats(profiler)
+
+        header = (
+            f"Event loop profile — {elapsed:.2f}s wall clock\n"
+            f"(requested {seconds}s, tracemalloc frames: {TRACEMALLOC_FRAMES})\n\n"
+        )
+
+        return ProfileReport(
+            seconds=elapsed,
+            stats_bytes=stats_bytes,
+            report_text=header + pstats_text + "\n" + allocations_text + "\n",
+        )
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import time
+
+from systems import clock
+
+# ========= Recorder Settings =========
+RECORD_FORMAT_VERSION = 1
+USER_HASH_CHARS = 16              # 64 bits of the HMAC — plenty for one guild
+RESPONSE_WINDOW_SECONDS = 3.0     # Discord's deadline for the initial response
+COMPLETION_WINDOW_SECONDS = 60.0  # deferred commands may finish later than that
+FLUSH_SECONDS = 5.0
+
+# discord.py gives non-persistent components a random 32-hex custom_id
+_RANDOM_CUSTOM_ID = re.compile(r"[0-9a-f]{32}")
+
+# Interaction kinds
+KIND_COMMAND = "cmd"
+KIND_COMPONENT = "btn"
+KIND_AUTOCOMPLETE = "ac"
+KIND_MODAL = "modal"
+KIND_OTHER = "other"
+
+# Outcomes
+OUTCOME_OK = "ok"                  # app command returned normally
+OUTCOME_RESPONDED = "responded"    # a response was sent (components, or command still running)
+OUTCOME_UNANSWERED = "unanswered"  # nothing sent within the response window
+
+
+def anonymize(secret: bytes, user_id: int) -> str:
+    return hmac.new(secret, str(user_id).encode(), hashlib.sha256).hexdigest()[:USER_HASH_CHARS]
+
+
+def _kind(interaction) -> str:
+    name = getattr(interaction.type, "name", str(interaction.type))
+    return {
+        "application_command": KIND_COMMAND,
+        "component": KIND_COMPONENT,
+        "autocomplete": KIND_AUTOCOMPLETE,
+        "modal_submit": KIND_MODAL,
+    }.get(name, KIND_OTHER)
+
+
+def _button_label(interaction, custom_id: str) -> str | None:
+    message = getattr(interaction, "message", None)
+    for row in getattr(message, "components", None) or []:
+        for child in getattr(row, "children", None) or []:
+            if getattr(child, "custom_id", None) == custom_id:
+                return getattr(child, "label", None)
+    return None
+
+
+def command_key(interaction) -> str:
+    """
+    Stable, content-free name for what was invoked: the slash command name,
+    a persistent custom_id, or the button label when the id is random.
+    """
+    data = interaction.data or {}
+    kind = _kind(interaction)
+
+    if kind in (KIND_COMMAND, KIND_AUTOCOMPLETE):
+        return data.get("name", "?")
+
+    custom_id = data.get("custom_id", "?")
+    if kind == KIND_COMPONENT and _RANDOM_CUSTOM_ID.fullmatch(custom_id):
+        label = _button_label(interaction, custom_id)
+        if label:
+            return re.sub(r"[^a-z0-9]+", " ", label.lower()).strip() or custom_id
+    return custom_id
+
+
+def _created(interaction) -> float:
+    """Unix seconds Discord created the interaction at (from its snowflake)."""
+    created_at = getattr(interaction, "created_at", None)
+    return created_at.timestamp() if created_at is not None else time.time()
+
+
+class InteractionRecorder:
+    """
+    Appends one compact JSON line per interaction:
+
+        {"t": 1760000000.123, "u": "<hmac>", "k": "cmd", "c": "talk",
+         "ch": 123, "r": [456, 789], "o": "ok", "ms": 41.7}
+
+    User ids are HMAC-SHA256'd with `secret`; no message text, options or
+    names are kept. Outcome comes from on_app_command_completion when the
+    handler returns, otherwise from whether a response went out within
+    Discord's response window. `ms` is only known for app commands, and
+    runs from the interaction's snowflake time — on_interaction is
+    dispatched after the command task has started, so a timer started
+    there would miss the handler's synchronous part.
+    """
+
+    def __init__(self, path: str, secret: bytes, guild_id: int = 0):
+        self.path = path
+        self.secret = secret
+        self.guild_id = guild_id
+
+        self._pending: dict[int, tuple[dict, object, float]] = {}
+        self._file = None
+        self._flush_task: asyncio.Task | None = None
+        self.written = 0
+
+    @classmethod
+    def from_env(cls, guild_id: int = 0) -> "InteractionRecorder | None":
+        path = os.getenv("INTERACTION_RECORD_PATH")
+        if not path:
+            return None
+
+        secret = os.getenv("INTERACTION_RECORD_SECRET")
+        if not secret:
+            print("[RECORDER] INTERACTION_RECORD_SECRET not set — user hashes won't match across restarts")
+            secret = secrets.token_hex(32)
+        return cls(path, secret.encode(), guild_id=guild_id)
+
+    # ---------- Hooks ----------
+    def begin(self, interaction):
+        roles = getattr(interaction.user, "roles", None) or []
+        record = {
+            "t": round(clock.now().timestamp(), 3),
+            "u": anonymize(self.secret, interaction.user.id),
+            "k": _kind(interaction),
+            "c": command_key(interaction),
+            "ch": interaction.channel_id,
+            # @everyone carries the guild id and says nothing
+            "r": sorted(r.id for r in roles if r.id != self.guild_id),
+        }
+
+        # Autocomplete never "responds" the usual way; nothing to wait for
+        if record["k"] == KIND_AUTOCOMPLETE:
+            self._write(record)
+            return
+
+        self._pending[interaction.id] = (record, interaction, _created(interaction))
+        asyncio.get_running_loop().call_later(
+            RESPONSE_WINDOW_SECONDS, self._check_response, interaction.id
+        )
+
+    def finish(self, interaction, outcome: str = OUTCOME_OK):
+        pending = self._pending.pop(interaction.id, None)
+        if pending is None:
+            return
+        record, _, started = pending
+        record["o"] = outcome
+        # Wall clock against Discord's: small skew can't make a command take negative time
+        record["ms"] = round(max(0.0, time.time() - started) * 1000, 1)
+        self._write(record)
+
+    # ---------- Internals ----------
+    def _check_response(self, interaction_id: int, final: bool = False):
+        pending = self._pending.get(interaction_id)
+        if pending is None:
+            return
+        record, interaction, _ = pending
+
+        responded = interaction.response.is_done()
+        if responded and record["k"] == KIND_COMMAND and not final:
+            # Deferred command still working — give it time to complete
+            asyncio.get_running_loop().call_later(
+                COMPLETION_WINDOW_SECONDS - RESPONSE_WINDOW_SECONDS,
+                self._check_response, interaction_id, True,
+            )
+            return
+
+        del self._pending[interaction_id]
+        record["o"] = OUTCOME_RESPONDED if responded else OUTCOME_UNANSWERED
+        record["ms"] = None
+        self._write(record)
+
+    def _write(self, record: dict):
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            header = {"v": RECORD_FORMAT_VERSION, "started": clock.now().isoformat()}
+            self._file.write(json.dumps(header, separators=(",", ":")) + "\n")
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.written += 1
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(FLUSH_SECONDS)
+            try:
+                self._file.flush()
+            except Exception as e:
+                print(f"[RECORDER] Flush failed: {e}")
+
+    def close(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# =================================================
+# ===============  READING  =======================
+# =================================================
+
+def read_records(path: str) -> list[dict]:
+    """Interaction records from a recording (headers skipped), in time order."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash can leave a torn last line
+                continue
+            if "v" in row:
+                continue
+            records.append(row)
+    records.sort(key=lambda r: r["t"])
+    return records
@@ -1,6 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
-import discord
+from typing import Dict, Iterable, Optional
 import os
 
 FACTION_ROLE_IDS = {
@@ -46,10 +45,16 @@ def get_faction(faction_id: str) -> Optional[Faction]:
     return FACTIONS.get(faction_id.lower())
 
 
-def get_member_faction_id(member: discord.Member) -> str | None:
-    role_ids = {role.id for role in member.roles}
+def get_faction_id_for_roles(role_ids: Iterable[int]) -> str | None:
+    """Return the faction a set of role IDs belongs to (first match wins)."""
+    role_ids = set(role_ids)
     for faction_id, rid in FACTION_ROLE_IDS.items():
         if rid in role_ids:
             return faction_id
     return None
 
+
+def get_member_faction_id(member) -> str | None:
+    """Discord convenience wrapper — accepts anything with `.roles`."""
+    return get_faction_id_for_roles(role.id for role in member.roles)
+
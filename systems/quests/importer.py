@@ -0,0 +1,387 @@
+import io
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+
+from .npc_models import NPC
+from .quest_models import QuestTemplate, QuestType
+from .storage import NPCS_FILE, QUESTS_FILE
+
+# Pack formats
+FORMAT_JSON = "json"    # { "<id>": {...}, ... }  (what the export commands write)
+FORMAT_JSONL = "jsonl"  # one entry object per line, id taken from quest_id / npc_id
+
+KIND_TEMPLATES = "templates"
+KIND_NPCS = "npcs"
+
+# Issues kept in full; the rest are only counted
+MAX_ISSUES = 500
+
+CHANNEL_FIELDS = ("required_channel_id", "source_channel_id", "turnin_channel_id")
+INT_FIELDS = ("points", "dc", "points_on_success", "points_on_fail")
+TYPE_REQUIRED = {
+    "SOCIAL": ("npc_id",),
+    "FETCH": ("item_name", "source_channel_id", "turnin_channel_id"),
+    "SKILL": ("dc",),
+    "TRAVEL": ("required_channel_id",),
+}
+# quest_dialogue keys that aren't quest ids
+DIALOGUE_KEYS = set(QuestType.__members__) | {"SKILL_SUCCESS", "SKILL_FAIL"}
+
+
+def pack_format(filename: str) -> str:
+    name = (filename or "").lower()
+    return FORMAT_JSONL if name.endswith((".jsonl", ".ndjson")) else FORMAT_JSON
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# =================================================
+# ================  REPORT  =======================
+# =================================================
+
+@dataclass
+class PackIssue:
+    where: str          # "line 12" / "line 40, col 5" / "pack"
+    entry: str | None
+    message: str
+
+    def __str__(self):
+        label = f" `{self.entry}`" if self.entry else ""
+        return f"{self.where}{label}: {self.message}"
+
+
+@dataclass
+class ImportReport:
+    kind: str
+    fmt: str
+    entries: dict = field(default_factory=dict)   # id → model (valid entries only)
+    raw: dict = field(default_factory=dict)       # id → dict as it will be written
+    errors: list[PackIssue] = field(default_factory=list)
+    warnings: list[PackIssue] = field(default_factory=list)
+    error_count: int = 0
+    warning_count: int = 0
+    seen: int = 0
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+
+    def error(self, where: str, entry, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_ISSUES:
+            self.errors.append(PackIssue(where, entry, message))
+
+    def warn(self, where: str, entry, message: str):
+        self.warning_count += 1
+        if len(self.warnings) < MAX_ISSUES:
+            self.warnings.append(PackIssue(where, entry, message))
+
+    def issue_lines(self, limit: int) -> list[str]:
+        lines = [f"❌ {e}" for e in self.errors[:limit]]
+        lines += [f"⚠️ {w}" for w in self.warnings[:max(0, limit - len(lines))]]
+        hidden = self.error_count + self.warning_count - len(lines)
+        if hidden > 0:
+            lines.append(f"…and {hidden} more")
+        return lines
+
+    def full_text(self) -> str:
+        lines = [str(e) for e in self.errors] + [f"warning: {w}" for w in self.warnings]
+        if self.error_count > len(self.errors):
+            lines.append(f"({self.error_count - len(self.errors)} further errors not listed)")
+        return "\n".join(lines) + "\n"
+
+
+# =================================================
+# ==============  ENTRY VALIDATION  ===============
+# =================================================
+
+def _check_template(report: ImportReport, where: str, qid: str, q, npc_ids) -> QuestTemplate | None:
+    if not isinstance(q, dict):
+        report.error(where, qid, "entry must be an object")
+        return None
+
+    before = report.error_count
+    for f in ("quest_id", "name", "type"):
+        if f not in q:
+            report.error(where, qid, f"missing required field '{f}'")
+    if "quest_id" in q and q["quest_id"] != qid:
+        report.error(where, qid, f"key does not match quest_id '{q['quest_id']}'")
+
+    t = q.get("type")
+    if "type" in q and (not isinstance(t, str) or t not in QuestType.__members__):
+        report.error(where, qid, f"invalid type {t!r}")
+        t = None
+    for f in TYPE_REQUIRED.get(t, ()):
+        if q.get(f) is None:
+            report.error(where, qid, f"{t.title()} quest missing '{f}'")
+
+    for f in CHANNEL_FIELDS:
+        if q.get(f) is not None and not _is_int(q[f]):
+            report.error(where, qid, f"'{f}' must be an integer channel id, got {q[f]!r}")
+    for f in INT_FIELDS:
+        if q.get(f) is not None and not _is_int(q[f]):
+            report.error(where, qid, f"'{f}' must be an integer, got {q[f]!r}")
+
+    roles = q.get("allowed_roles") or []
+    if not isinstance(roles, list) or not all(_is_int(r) for r in roles):
+        report.error(where, qid, "'allowed_roles' must be a list of integer role ids")
+    tags = q.get("tags") or []
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        report.error(where, qid, "'tags' must be a list of strings")
+
+    npc_id = q.get("npc_id")
+    if npc_id is not None and (not isinstance(npc_id, str) or npc_id not in npc_ids):
+        report.error(where, qid, f"unknown npc_id {npc_id!r}")
+
+    if report.error_count != before:
+        return None
+    try:
+        return QuestTemplate.from_dict(q)
+    except Exception as e:
+        report.error(where, qid, f"could not build template: {e}")
+        return None
+
+
+def _check_npc(report: ImportReport, where: str, npc_id: str, n, template_ids) -> NPC | None:
+    if not isinstance(n, dict):
+        report.error(where, npc_id, "entry must be an object")
+        return None
+
+    before = report.error_count
+    for f in ("npc_id", "name"):
+        if f not in n:
+            report.error(where, npc_id, f"missing required field '{f}'")
+    if "npc_id" in n and n["npc_id"] != npc_id:
+        report.error(where, npc_id, f"key does not match npc_id '{n['npc_id']}'")
+
+    for f in ("greetings", "idle_lines"):
+        value = n.get(f, [])
+        if not isinstance(value, list) or not all(isinstance(line, str) for line in value):
+            report.error(where, npc_id, f"'{f}' must be a list of strings")
+
+    dialogue = n.get("quest_dialogue", {})
+    if not isinstance(dialogue, dict):
+        report.error(where, npc_id, "'quest_dialogue' must be an object")
+    else:
+        for key, lines in dialogue.items():
+            if not isinstance(lines, list) or not all(isinstance(line, str) for line in lines):
+                report.error(where, npc_id, f"quest_dialogue['{key}'] must be a list of strings")
+            elif key not in DIALOGUE_KEYS and key not in template_ids:
+                # Templates may be imported after their NPCs — not fatal
+                report.warn(where, npc_id, f"quest_dialogue key '{key}' is not a known quest id or type")
+
+    if report.error_count != before:
+        return None
+    return NPC.from_dict(n)
+
+
+# =================================================
+# ===============  STREAMING PARSE  ===============
+# =================================================
+
+class _PackSyntaxError(Exception):
+    def __init__(self, pos: int, message: str):
+        super().__init__(message)
+        self.pos = pos
+
+
+class _Lines:
+    """Offset → 'line N, col M', counting newlines incrementally as offsets grow."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.offset = 0
+        self.line = 1
+        self.line_start = 0
+
+    def at(self, pos: int) -> str:
+        if pos < self.offset:
+            self.offset, self.line, self.line_start = 0, 1, 0
+        newlines = self.text.count("\n", self.offset, pos)
+        if newlines:
+            self.line += newlines
+            self.line_start = self.text.rfind("\n", 0, pos) + 1
+        self.offset = pos
+        return f"line {self.line}, col {pos - self.line_start + 1}"
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def _iter_object(text: str):
+    """
+    Yields (key, value, offset) for each member of a top-level JSON object,
+    decoding one value at a time so every entry keeps its source position.
+    Duplicate keys are yielded as-is (json.loads would silently keep the last).
+    """
+    decoder = json.JSONDecoder()
+    pos = _skip_ws(text, 0)
+    if pos >= len(text) or text[pos] != "{":
+        raise _PackSyntaxError(pos, "pack must be a JSON object of id → entry")
+    pos = _skip_ws(text, pos + 1)
+    if pos < len(text) and text[pos] == "}":
+        return
+
+    while True:
+        if pos >= len(text) or text[pos] != '"':
+            raise _PackSyntaxError(pos, "expected an entry id in double quotes")
+        start = pos
+        try:
+            key, pos = scanstring(text, pos + 1)
+        except json.JSONDecodeError as e:
+            raise _PackSyntaxError(e.pos, e.msg)
+
+        pos = _skip_ws(text, pos)
+        if pos >= len(text) or text[pos] != ":":
+            raise _PackSyntaxError(pos, "expected ':' after entry id")
+        pos = _skip_ws(text, pos + 1)
+        try:
+            value, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError as e:
+            raise _PackSyntaxError(e.pos, e.msg)
+        yield key, value, start
+
+        pos = _skip_ws(text, pos)
+        if pos < len(text) and text[pos] == ",":
+            pos = _skip_ws(text, pos + 1)
+            continue
+        if pos < len(text) and text[pos] == "}":
+            if _skip_ws(text, pos + 1) != len(text):
+                raise _PackSyntaxError(pos + 1, "unexpected data after the pack object")
+            return
+        raise _PackSyntaxError(pos, "expected ',' or '}' after entry")
+
+
+def _iter_json(fp, report: ImportReport):
+    try:
+        text = fp.read().decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        report.error(f"byte {e.start}", None, "file is not valid UTF-8")
+        return
+
+    lines = _Lines(text)
+    try:
+        for key, value, offset in _iter_object(text):
+            yield lines.at(offset), key, value
+    except _PackSyntaxError as e:
+        # No safe way to resync inside a JSON document — stop here
+        report.error(lines.at(e.pos), None, f"JSON syntax error: {e}")
+
+
+def _iter_jsonl(fp, report: ImportReport, id_field: str):
+    for lineno, raw_line in enumerate(fp, start=1):
+        where = f"line {lineno}"
+        try:
+            line = raw_line.decode("utf-8-sig" if lineno == 1 else "utf-8").strip()
+        except UnicodeDecodeError:
+            report.error(where, None, "line is not valid UTF-8")
+            continue
+        if not line:
+            continue
+
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            report.error(f"{where}, col {e.colno}", None, f"JSON syntax error: {e.msg}")
+            continue
+        if not isinstance(value, dict):
+            report.error(where, None, "entry must be an object")
+            continue
+
+        key = value.get(id_field)
+        if not isinstance(key, str) or not key:
+            report.error(where, None, f"missing '{id_field}'")
+            continue
+        yield where, key, value
+
+
+def read_pack(fp, kind: str, fmt: str = FORMAT_JSON, *, npc_ids=(), template_ids=()) -> ImportReport:
+    """
+    Parse and validate a pack in one pass, collecting every problem with its
+    position instead of stopping at the first. `fp` is a binary file object;
+    JSON Lines packs are read a line at a time.
+
+    Cross-references are checked against the ids given (snapshots of the
+    live maps): a template's npc_id must be a known NPC, and NPC dialogue
+    keyed by quest id should name a known template.
+    """
+    started = time.perf_counter()
+    report = ImportReport(kind=kind, fmt=fmt)
+    id_field = "quest_id" if kind == KIND_TEMPLATES else "npc_id"
+    npc_ids = set(npc_ids)
+    template_ids = set(template_ids)
+
+    entries = _iter_jsonl(fp, report, id_field) if fmt == FORMAT_JSONL else _iter_json(fp, report)
+    first_seen: dict[str, str] = {}
+
+    for where, key, value in entries:
+        report.seen += 1
+        if key in first_seen:
+            report.error(where, key, f"duplicate id (first defined at {first_seen[key]})")
+            continue
+        first_seen[key] = where
+
+        if kind == KIND_TEMPLATES:
+            model = _check_template(report, where, key, value, npc_ids)
+        else:
+            model = _check_npc(report, where, key, value, template_ids)
+        if model is not None:
+            report.entries[key] = model
+            report.raw[key] = value
+
+    if report.seen == 0 and report.ok:
+        report.error("pack", None, "no entries found")
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+# =================================================
+# ================  COMMIT  =======================
+# =================================================
+
+def check_npc_removals(report: ImportReport, final_npc_ids, templates: dict):
+    """An NPC overwrite must not strand templates that still point at a dropped NPC."""
+    for qid, tmpl in templates.items():
+        if tmpl.npc_id and tmpl.npc_id not in final_npc_ids:
+            report.error("pack", tmpl.npc_id, f"removing this NPC would orphan quest '{qid}'")
+
+
+def merged(report: ImportReport, mode: str, current: dict) -> tuple[dict, dict]:
+    """
+    Final (models, raw) maps for `mode`. `current` is a snapshot of the live
+    id → model map; merge keeps its entries unless the pack replaces them.
+    """
+    if mode == "overwrite":
+        return dict(report.entries), dict(report.raw)
+    models = {**current, **report.entries}
+    raw = {key: model.to_dict() for key, model in current.items()}
+    raw.update(report.raw)
+    return models, raw
+
+
+def write_atomic(path: str, raw: dict):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(raw, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def commit_pack(report: ImportReport, raw: dict):
+    """Write the merged pack in one rename; a failed import leaves the old file untouched."""
+    write_atomic(QUESTS_FILE if report.kind == KIND_TEMPLATES else NPCS_FILE, raw)
+
+
+def read_pack_bytes(data: bytes, kind: str, filename: str = "", **refs) -> ImportReport:
+    return read_pack(io.BytesIO(data), kind, pack_format(filename), **refs)
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Dict
 
+from . import season_epoch
+from .xp_curve import get_curve, migrate_xp_fields
+
 
 @dataclass
 class PlayerState:
@@ -12,14 +15,23 @@ class PlayerState:
 
     faction_id: str | None = None
     lifetime_completed: int = 0
-    season_completed: int = 0
-    monsters_season: int = 0
+    # Seasonal counters are only valid for the epoch they're stamped with
+    # (see season_epoch.py); use the season_completed / monsters_season properties
+    season_epoch: int = 0
+    _season_completed: int = field(default=0, repr=False)
+    _monsters_season: int = field(default=0, repr=False)
     monsters_lifetime: int = 0
-    xp: int = 0
-    level: int = 1
+    # Source of truth for leveling; level / xp are derived from the
+    # active season's curve (see xp_curve.py)
+    total_xp: int = 0
     badges: set[str] = field(default_factory=set)
     season_victories: set[str] = field(default_factory=set)
     title: str | None = None
+    # Ring buffer of recent daily-quest template indices (see rotation.py)
+    quest_history: list[int] = field(default_factory=list)
+    quest_history_head: int = 0
+    # ISO date the player last opened or completed a daily (drives preassign)
+    last_seen: str | None = None
 
     # -----------------------------------------------------
     # Inventory Helpers (FETCH quest support)
@@ -40,27 +52,67 @@ class PlayerState:
                 del self.inventory[item_name]
 
 
+    # -----------------------------------------------------
+    # Seasonal counters (epoch-stamped)
+    # -----------------------------------------------------
+    def _season_is_current(self) -> bool:
+        return self.season_epoch == season_epoch.current()
+
+    def _normalize_season(self):
+        """Lazily zero counters left over from an older season."""
+        if not self._season_is_current():
+            self.season_epoch = season_epoch.current()
+            self._season_completed = 0
+            self._monsters_season = 0
+
+    @property
+    def season_completed(self) -> int:
+        return self._season_completed if self._season_is_current() else 0
+
+    @season_completed.setter
+    def season_completed(self, value: int):
+        self._normalize_season()
+        self._season_completed = value
+
+    @property
+    def monsters_season(self) -> int:
+        return self._monsters_season if self._season_is_current() else 0
+
+    @monsters_season.setter
+    def monsters_season(self, value: int):
+        self._normalize_season()
+        self._monsters_season = value
+
     # -----------------------------------------------------
     # Leveling System
     # -----------------------------------------------------
+    @property
+    def level(self) -> int:
+        return get_curve().level_for(self.total_xp)
+
+    @property
+    def xp(self) -> int:
+        """XP earned inside the current level."""
+        return get_curve().split(self.total_xp)[1]
+
     @property
     def next_level_xp(self) -> int:
-        return 100 + (self.level - 1) * 50
+        return get_curve().xp_to_next(self.level)
 
     @property
     def xp_progress(self) -> float:
-        needed = self.next_level_xp
-        return min(self.xp / needed, 1.0) if needed > 0 else 0.0
+        level, xp = get_curve().split(self.total_xp)
+        needed = get_curve().xp_to_next(level)
+        return min(xp / needed, 1.0) if needed > 0 else 0.0
 
     def add_xp(self, amount: int):
-        old_level = self.level
-        self.xp += amount
-
-        while self.xp >= self.next_level_xp:
-            self.xp -= self.next_level_xp
-            self.level += 1
+        # O(log L) regardless of how many levels the grant spans
+        curve = get_curve()
+        old_level = curve.level_for(self.total_xp)
+        self.total_xp = max(0, self.total_xp + amount)
+        new_level = curve.level_for(self.total_xp)
 
-        self.last_level_up = self.level if self.level > old_level else None
+        self.last_level_up = new_level if new_level > old_level else None
 
 
     # -----------------------------------------------------
@@ -73,14 +125,20 @@ class PlayerState:
             "inventory": self.inventory,        # dict saved cleanly
             "faction_id": self.faction_id,
             "lifetime_completed": self.lifetime_completed,
+            "season_epoch": max(self.season_epoch, season_epoch.current()),
             "season_completed": self.season_completed,
             "monsters_season": self.monsters_season,
             "monsters_lifetime": self.monsters_lifetime,
+            "total_xp": self.total_xp,
+            # Derived; kept for readability of the JSON
             "xp": self.xp,
             "level": self.level,
             "badges": list(self.badges),
             "season_victories": list(self.season_victories),
             "title": self.title,
+            "quest_history": self.quest_history,
+            "quest_history_head": self.quest_history_head,
+            "last_seen": self.last_seen,
         }
 
 
@@ -89,18 +147,23 @@ class PlayerState:
     # -----------------------------------------------------
     @staticmethod
     def from_dict(data: dict):
+        data = migrate_xp_fields(data)
         return PlayerState(
             user_id=data.get("user_id", 0),
             daily_quest=data.get("daily_quest", {}),
             inventory=data.get("inventory", {}),  # dict loads cleanly
             faction_id=data.get("faction_id"),
             lifetime_completed=data.get("lifetime_completed", 0),
-            season_completed=data.get("season_completed", 0),
-            monsters_season=data.get("monsters_season", 0),
+            # Profiles from before epochs existed belong to the board's first epoch (0)
+            season_epoch=data.get("season_epoch", 0),
+            _season_completed=data.get("season_completed", 0),
+            _monsters_season=data.get("monsters_season", 0),
             monsters_lifetime=data.get("monsters_lifetime", 0),
-            xp=data.get("xp", 0),
-            level=data.get("level", 1),
+            total_xp=data.get("total_xp", 0),
             badges=set(data.get("badges", [])),
             season_victories=set(data.get("season_victories", [])),
             title=data.get("title"),
+            quest_history=data.get("quest_history", []),
+            quest_history_head=data.get("quest_history_head", 0),
+            last_seen=data.get("last_seen"),
         )
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
+from . import season_epoch
+
 
 @dataclass
 class QuestBoard:
@@ -10,6 +12,8 @@ class QuestBoard:
     and remembers where the scoreboard message lives.
     """
     season_id: str = "default_season"
+    # Bumped on every season reset; player season counters from older epochs read as 0
+    season_epoch: int = 0
     global_points: int = 0
 
     # NEW – per-faction scoring
@@ -19,6 +23,7 @@ class QuestBoard:
     season_goal: int = 100
     faction_goal: int = 250
     season_reward: str = ""  # e.g. "Custom role + art + one-shot seat"
+    xp_curve: str = "standard"  # named curve from xp_curve.CURVES
 
     # Where the quest board embed is posted (for refresh)
     display_channel_id: Optional[int] = None
@@ -32,9 +37,15 @@ class QuestBoard:
             return
         self.faction_points[faction_id] = self.faction_points.get(faction_id, 0) + amount
 
+    def advance_epoch(self):
+        """O(1) reset of every player's seasonal counters."""
+        self.season_epoch += 1
+        season_epoch.set_current(self.season_epoch)
+
     def reset_season(self, new_season_id: str):
         """Hard reset points for a new season."""
         self.season_id = new_season_id
         self.global_points = 0
         self.faction_points = {}
+        self.advance_epoch()
         # Leave season_goal / season_reward to be set by admin command
@@ -1,13 +1,23 @@
-import random
-import discord
+import asyncio
 
-from datetime import date
+from systems import clock
 from . import storage
 from .quest_models import QuestTemplate, QuestType
 from .player_state import PlayerState
-from datetime import datetime, timezone
+from .quest_board import QuestBoard
+from .xp_curve import set_active_curve
+from .rotation import RotationEngine, load_template_index, save_template_index
+from .reload import ReloadDiff, diff_entries
+from . import season_epoch
+from datetime import datetime, timedelta, timezone
 from systems.seasonal.state import get_season_state
 from systems.seasonal.storage import save_season
+from systems.stats import NEW_PLAYER, QUEST_COMPLETED, activity
+
+# Rollover pre-assignment only covers players who had a quest this recently
+PREASSIGN_ACTIVE_DAYS = 7
+# Bookkeeping-only player changes (a /quest view) are batched into one write this much later
+PLAYER_SAVE_DELAY = 30
 
 BETA_CUTOFF = datetime(2026, 1, 1, tzinfo=timezone.utc)
 FOUNDER_CUTOFF = datetime(2026, 3, 1, tzinfo=timezone.utc)
@@ -25,14 +35,14 @@ def evaluate_automatic_badges(player):
 
     return newly_awarded
 
-def evaluate_join_date_badges(member: discord.Member, player):
+def evaluate_join_date_badges(joined_at: datetime | None, player):
     """
     Grant join-date-based badges if eligible.
+    `joined_at` is the member's guild join time (aware UTC datetime).
     Returns list of newly awarded badge IDs.
     """
     newly_awarded = []
 
-    joined_at = member.joined_at
     if not joined_at:
         return newly_awarded
 
@@ -49,12 +59,39 @@ def evaluate_join_date_badges(member: discord.Member, player):
     return newly_awarded
 
 class QuestManager:
-    def __init__(self):
-        # Load all dynamic data via storage layer
-        self.quest_templates = storage.load_templates()
-        self.npcs = storage.load_npcs()
-        self.players = storage.load_players()
-        self.quest_board = storage.load_board()
+    def __init__(self, autoload: bool = True):
+        self.quest_templates = {}
+        self.npcs = {}
+        self.players = {}
+        self.quest_board = QuestBoard()
+        self.loaded = False
+        # (templates dict it was built from, gating role ids, {role class: eligible templates})
+        self._eligibility = (None, frozenset(), {})
+        self.rotation = RotationEngine()
+        self.reload_listeners = []
+        # Bumped whenever a map changes, so cached renders know when to rebuild
+        self.versions = {"templates": 0, "npcs": 0, "players": 0}
+        # In-memory player changes not yet written, and the pending batched write
+        self._players_dirty = False
+        self._save_task: asyncio.Task | None = None
+
+        if autoload:
+            self.load_all()
+
+    def load_all(self):
+        """Load all dynamic data via storage layer (files are read concurrently)."""
+        (
+            self.quest_templates,
+            self.npcs,
+            self.players,
+            self.quest_board,
+        ) = storage.load_all()
+        self.loaded = True
+        for kind in self.versions:
+            self.versions[kind] += 1
+        self.rotation = RotationEngine(load_template_index())
+        set_active_curve(self.quest_board.xp_curve)
+        season_epoch.set_current(self.quest_board.season_epoch)
 
         print(f"Loaded {len(self.quest_templates)} quest templates.")
         print(f"Loaded {len(self.npcs)} NPCs.")
@@ -70,14 +107,90 @@ class QuestManager:
     def get_npc(self, npc_id):
         return self.npcs.get(npc_id)
 
-    def reload_templates(self):
-        """Reload quest templates after import."""
-        self.quest_templates = storage.load_templates()
-        print(f"Reloaded {len(self.quest_templates)} quest templates.")
-
-    def reload_npcs(self):
-        self.npcs = storage.load_npcs()
-        print(f"[QuestManager] Reloaded {len(self.npcs)} NPCs.")
+    def reload_templates(self) -> ReloadDiff:
+        """Reload quest templates after import (only the differences are applied)."""
+        diff = self.apply_templates(storage.load_templates())
+        print(f"Reloaded {len(self.quest_templates)} quest templates ({diff.summary()}).")
+        return diff
+
+    def reload_npcs(self) -> ReloadDiff:
+        diff = self.apply_npcs(storage.load_npcs())
+        print(f"[QuestManager] Reloaded {len(self.npcs)} NPCs ({diff.summary()}).")
+        return diff
+
+    def add_reload_listener(self, listener):
+        """`listener(diff: ReloadDiff)` runs after every non-empty template/NPC reload."""
+        self.reload_listeners.append(listener)
+
+    def _notify_reload(self, diff: ReloadDiff):
+        for listener in self.reload_listeners:
+            try:
+                listener(diff)
+            except Exception as e:
+                print(f"[RELOAD] Listener failed: {e}")
+
+    def apply_templates(self, templates: dict) -> ReloadDiff:
+        """
+        Bring quest_templates in line with `templates` in place, updating the
+        eligibility classes and rotation tables only where something changed.
+        """
+        diff = diff_entries("templates", self.quest_templates, templates)
+        if diff.empty:
+            return diff
+
+        _, old_gating, by_class = self._eligibility_index()
+
+        for qid in diff.removed:
+            del self.quest_templates[qid]
+        for qid in diff.added + diff.changed:
+            self.quest_templates[qid] = templates[qid]
+        self.versions["templates"] += 1
+
+        new_gating = frozenset(
+            role_id for t in self.quest_templates.values() for role_id in t.allowed_roles
+        )
+        if new_gating != old_gating:
+            # Role classes mean something different now — rebuild lazily
+            self._eligibility = (None, frozenset(), {})
+        else:
+            touched = diff.touched
+            upserted = [self.quest_templates[qid] for qid in diff.added + diff.changed]
+            affected = []
+            for key, eligible in by_class.items():
+                kept = [t for t in eligible if t.quest_id not in touched]
+                kept += [t for t in upserted if self._template_allowed_for_roles(t, key)]
+                if len(kept) != len(eligible) or any(t.quest_id in touched for t in eligible):
+                    by_class[key] = kept
+                    affected.append(key)
+            if self.rotation.update(self.quest_templates, diff.touched, affected):
+                save_template_index(self.rotation.index)
+
+        # 🚩 Active dailies that point at a template that no longer exists
+        removed = set(diff.removed)
+        for player in self.players.values():
+            daily = player.daily_quest
+            if daily.get("quest_id") in removed and not daily.get("completed"):
+                daily["template_removed"] = True
+                diff.flagged_players.append(player.user_id)
+        if diff.flagged_players:
+            self.save_players()
+
+        self._notify_reload(diff)
+        return diff
+
+    def apply_npcs(self, npcs: dict) -> ReloadDiff:
+        diff = diff_entries("npcs", self.npcs, npcs)
+        if diff.empty:
+            return diff
+
+        for npc_id in diff.removed:
+            del self.npcs[npc_id]
+        for npc_id in diff.added + diff.changed:
+            self.npcs[npc_id] = npcs[npc_id]
+        self.versions["npcs"] += 1
+
+        self._notify_reload(diff)
+        return diff
 
 
 
@@ -90,18 +203,45 @@ class QuestManager:
     def get_or_create_player(self, user_id):
         if user_id not in self.players:
             self.players[user_id] = PlayerState(user_id=user_id)
-            storage.save_players(self.players)
+            activity.record(NEW_PLAYER)
+            self.save_players()
         return self.players[user_id]
 
     def save_players(self):
         """Persist all current players."""
+        self.versions["players"] += 1
+        self._players_dirty = False
         storage.save_players(self.players)
 
+    def save_players_soon(self):
+        """
+        For changes nobody reads back right away: coalesce them into one
+        save_players() PLAYER_SAVE_DELAY seconds out (or the next save,
+        whichever comes first). Saves immediately outside the event loop.
+        """
+        self._players_dirty = True
+        if self._save_task is not None and not self._save_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_players()
+            return
+        self._save_task = loop.create_task(self._save_players_later())
+
+    async def _save_players_later(self):
+        await clock.sleep(PLAYER_SAVE_DELAY)
+        if self._players_dirty:
+            try:
+                self.save_players()
+            except Exception as e:
+                print(f"[QuestManager] Batched player save failed: {e}")
+
     def clear_player(self, user_id):
         """Remove a player's data entirely."""
         if user_id in self.players:
             del self.players[user_id]
-            storage.save_players(self.players)
+            self.save_players()
             return True
         return False
 
@@ -119,7 +259,37 @@ class QuestManager:
 
         role_set = set(role_ids)
         return any(role_id in role_set for role_id in template.allowed_roles)
-    
+
+    def _eligibility_index(self):
+        # Rebuilt whenever the templates dict is replaced (load / reload / import)
+        if self._eligibility[0] is not self.quest_templates:
+            gating = frozenset(
+                role_id for t in self.quest_templates.values() for role_id in t.allowed_roles
+            )
+            self._eligibility = (self.quest_templates, gating, {})
+            if self.rotation.sync(self.quest_templates):
+                save_template_index(self.rotation.index)
+        return self._eligibility
+
+    def role_class(self, role_ids) -> frozenset:
+        """
+        The subset of `role_ids` that any template is gated on. Members with
+        the same class are eligible for exactly the same templates.
+        """
+        _, gating, _ = self._eligibility_index()
+        return frozenset(role_id for role_id in role_ids if role_id in gating)
+
+    def eligible_templates(self, role_ids) -> list[QuestTemplate]:
+        """Templates assignable to these roles, computed once per role class."""
+        _, _, by_class = self._eligibility_index()
+        key = self.role_class(role_ids)
+        eligible = by_class.get(key)
+        if eligible is None:
+            eligible = by_class[key] = [
+                t for t in self.quest_templates.values() if self._template_allowed_for_roles(t, key)
+            ]
+        return eligible
+
 
 
     # -----------------------------------------------------
@@ -135,15 +305,33 @@ class QuestManager:
             None if there are currently no eligible quests for the user's roles.
         """
         player = self.get_or_create_player(user_id)
-        today = str(date.today())
+        today = str(clock.today())
 
         # If a quest is already assigned for today, keep it.
         if (
             player.daily_quest.get("assigned_date") == today
             and not player.daily_quest.get("completed")
         ):
-            return player.daily_quest.get("quest_id")
-        
+            # Rollover picks used yesterday's roles — re-pick only if the gating roles changed.
+            # A template removed by a reload always gets a re-pick.
+            if not player.daily_quest.get("template_removed") and (
+                not player.daily_quest.get("preassigned")
+                or self.role_class(role_ids) == self.role_class(player.daily_quest.get("role_snapshot", []))
+            ):
+                quest_id = player.daily_quest.get("quest_id")
+                changed = player.last_seen != today
+                player.last_seen = today
+                if player.daily_quest.pop("preassigned", False):
+                    # First look at a rollover pick — only now does it count as seen
+                    self.rotation.remember(player, quest_id)
+                    changed = True
+                if changed:
+                    # Bookkeeping only — the pick itself was saved at rollover
+                    self.save_players_soon()
+                return quest_id
+            player.daily_quest = {}
+
+
         # 🧹 Day changed — clear old daily quest state
         if (
             player.daily_quest.get("assigned_date")
@@ -157,23 +345,22 @@ class QuestManager:
             raise RuntimeError("No quest templates loaded; cannot assign daily quest.")
 
         # Filter templates by allowed_roles vs user roles
-        eligible_templates: list[QuestTemplate] = []
-        for t in self.quest_templates.values():
-            print("DEBUG Template:", t.quest_id, "Allowed:", t.allowed_roles)
-            if self._template_allowed_for_roles(t, role_ids):
-                eligible_templates.append(t)
+        eligible_templates = self.eligible_templates(role_ids)
 
         # If no eligible quests → no quest today (Option B).
         # User may try again later in the same day AFTER getting new roles.
         if not eligible_templates:
             # Clear any old daily_quest data for safety
             player.daily_quest = {}
-            storage.save_players(self.players)
+            self.save_players()
             return None
 
-        # Pick random quest from eligible list
-        chosen = random.choice(eligible_templates)
+        # Weighted pick that avoids the player's recent quests
+        chosen = self.rotation.pick(player, self.role_class(role_ids), eligible_templates)
         quest_id = chosen.quest_id
+        self.rotation.remember(player, quest_id)
+
+        player.last_seen = today
 
         # Store the new daily quest with a role snapshot
         player.daily_quest = {
@@ -184,10 +371,66 @@ class QuestManager:
             "role_snapshot": list(role_ids),
         }
 
-        storage.save_players(self.players)
+        self.save_players()
         return quest_id
 
 
+    def preassign_daily(self, active_days: int = PREASSIGN_ACTIVE_DAYS) -> dict:
+        """
+        Rollover job: give every recently active player today's quest in one
+        pass and one save, so /quest is a read for them.
+
+        Eligibility comes from each player's last role snapshot, grouped by
+        role class. The entry is marked `preassigned`; assign_daily re-picks
+        if the player's gating roles have changed since, and only adds the
+        pick to the rotation history once the player actually opens it.
+
+        "Recently active" is `last_seen` (set when a daily is opened or
+        completed), not the assigned date, which preassign itself moves.
+        """
+        today = clock.today()
+        today_key = str(today)
+        cutoff = str(today - timedelta(days=active_days))
+        stats = {"assigned": 0, "inactive": 0, "no_eligible": 0, "classes": 0}
+
+        if not self.quest_templates:
+            return stats
+
+        for player in self.players.values():
+            daily = player.daily_quest
+            if daily.get("assigned_date") == today_key:
+                continue
+
+            # Saves from before last_seen existed: a non-preassigned entry was a real visit
+            seen = player.last_seen or (None if daily.get("preassigned") else daily.get("assigned_date"))
+            if not seen or seen < cutoff or "role_snapshot" not in daily:
+                stats["inactive"] += 1
+                continue
+
+            roles = daily["role_snapshot"]
+            eligible = self.eligible_templates(roles)
+            if not eligible:
+                stats["no_eligible"] += 1
+                continue
+
+            chosen = self.rotation.pick(player, self.role_class(roles), eligible)
+
+            player.inventory.clear()
+            player.daily_quest = {
+                "quest_id": chosen.quest_id,
+                "assigned_date": today_key,
+                "completed": False,
+                "role_snapshot": list(roles),
+                "preassigned": True,
+            }
+            stats["assigned"] += 1
+
+        stats["classes"] = len(self._eligibility[2])
+        if stats["assigned"]:
+            self.save_players()
+        return stats
+
+
     # -----------------------------------------------------
     # Completion
     # -----------------------------------------------------
@@ -198,18 +441,24 @@ class QuestManager:
             return {"completed": False}
 
         player.daily_quest["completed"] = True
+        player.last_seen = str(clock.today())
+        if player.daily_quest.pop("preassigned", False):
+            self.rotation.remember(player, player.daily_quest.get("quest_id"))
 
         # Stats
         player.lifetime_completed += 1
         player.season_completed += 1
 
+        template = self.quest_templates.get(player.daily_quest.get("quest_id"))
+        activity.record(QUEST_COMPLETED, template.type.value if template else None)
+
         # 🎖️ Badges
         new_badges = evaluate_automatic_badges(player)
 
         # XP
         player.add_xp(50)
 
-        storage.save_players(self.players)
+        self.save_players()
 
         return {
             "completed": True,
@@ -249,6 +498,80 @@ class QuestManager:
         # Persist
         self.save_board()
     
+    # -----------------------------------------------------
+    # Bulk Rewards (wandering hunts, mass grants)
+    # -----------------------------------------------------
+    def reward_players(
+        self,
+        user_ids,
+        xp: int = 0,
+        monsters: int = 0,
+        global_points: int = 0,
+        faction_points: dict[str, int] | None = None,
+    ) -> dict:
+        """
+        Apply one reward to many players in a single pass and commit once.
+
+        Unknown user ids get a fresh profile instead of aborting the batch.
+        Board points (global + per-faction) are applied once, not per player.
+
+        Returns:
+            {
+                "rewarded": [user_id, ...],
+                "created": [user_id, ...],
+                "level_ups": {user_id: new_level},
+                "new_badges": {user_id: [badge_id, ...]},
+            }
+        """
+        rewarded = list(dict.fromkeys(user_ids))
+        created, level_ups, new_badges = [], {}, {}
+
+        for uid in rewarded:
+            player = self.players.get(uid)
+            if player is None:
+                player = self.players[uid] = PlayerState(user_id=uid)
+                created.append(uid)
+                activity.record(NEW_PLAYER)
+
+            player.monsters_season += monsters
+            player.monsters_lifetime += monsters
+
+            if xp:
+                player.add_xp(xp)
+                if player.last_level_up:
+                    level_ups[uid] = player.last_level_up
+
+            badges = evaluate_automatic_badges(player)
+            if badges:
+                new_badges[uid] = badges
+
+        board = self.quest_board
+        board.global_points += global_points
+
+        state = None
+        for fid, amount in (faction_points or {}).items():
+            board.faction_points[fid] = board.faction_points.get(fid, 0) + amount
+
+            # Same power-unlock rule as award_points()
+            if board.faction_points[fid] >= board.faction_goal:
+                state = state or get_season_state()
+                power = state["faction_powers"].get(fid)
+                if power is not None and not power["unlocked"]:
+                    power["unlocked"] = True
+                    save_season(state)
+
+        if global_points or faction_points:
+            self.save_board()
+        if rewarded:
+            self.save_players()
+
+        return {
+            "rewarded": rewarded,
+            "created": created,
+            "level_ups": level_ups,
+            "new_badges": new_badges,
+        }
+
     def get_scoreboard(self):
         return {
             "global_points": self.quest_board.global_points,
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReloadDiff:
+    """What changed between the in-memory map and a freshly loaded one."""
+    kind: str                      # "templates" | "npcs"
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    # Players whose active daily quest pointed at a removed template
+    flagged_players: list[int] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    @property
+    def touched(self) -> set[str]:
+        return set(self.added) | set(self.changed) | set(self.removed)
+
+    def summary(self) -> str:
+        text = f"+{len(self.added)} added, ~{len(self.changed)} changed, -{len(self.removed)} removed"
+        if self.flagged_players:
+            text += f"; {len(self.flagged_players)} active quest(s) flagged for reassignment"
+        return text
+
+
+def diff_entries(kind: str, current: dict, incoming: dict) -> ReloadDiff:
+    """Compare two id → model maps (dataclass equality decides 'changed')."""
+    diff = ReloadDiff(kind=kind)
+    for key, value in incoming.items():
+        if key not in current:
+            diff.added.append(key)
+        elif current[key] != value:
+            diff.changed.append(key)
+    diff.removed = [key for key in current if key not in incoming]
+    return diff
@@ -0,0 +1,230 @@
+import json
+import os
+import random
+from collections import Counter
+
+from .quest_models import QuestTemplate
+from .storage import DATA_DIR
+
+TEMPLATE_INDEX_FILE = os.path.join(DATA_DIR, "template_index.json")
+
+# Recent assignments remembered per player (ring buffer of template indices)
+HISTORY_SIZE = 8
+EMPTY_SLOT = -1
+
+# Acceptance multiplier by age in the history (0 = yesterday's quest)
+RECENT_PENALTY = [0.01, 0.02, 0.03, 0.05, 0.08, 0.12, 0.2, 0.4]
+# Same QuestType as the previous assignment
+SAME_TYPE_PENALTY = 0.5
+# Template weight multipliers by tag (unlisted tags weigh 1)
+TAG_WEIGHTS = {"rare": 0.25, "featured": 2.0}
+# Rejection-sampling attempts before settling for the best candidate seen
+MAX_DRAWS = 12
+
+
+# =================================================
+# ============  STABLE TEMPLATE INDEX  ============
+# =================================================
+
+class TemplateIndex:
+    """
+    Append-only quest_id ↔ int mapping. Indices are never reused, so the
+    integer histories stored on players stay valid across imports.
+    """
+
+    def __init__(self, ids: list[str] | None = None):
+        self.ids: list[str] = list(ids or [])
+        self.positions: dict[str, int] = {qid: i for i, qid in enumerate(self.ids)}
+
+    def encode(self, quest_id: str) -> int:
+        pos = self.positions.get(quest_id)
+        if pos is None:
+            pos = self.positions[quest_id] = len(self.ids)
+            self.ids.append(quest_id)
+        return pos
+
+    def decode(self, index: int) -> str | None:
+        return self.ids[index] if 0 <= index < len(self.ids) else None
+
+    def sync(self, quest_ids) -> bool:
+        """Register any new template ids. Returns True if the index grew."""
+        before = len(self.ids)
+        for qid in quest_ids:
+            self.encode(qid)
+        return len(self.ids) != before
+
+
+def load_template_index(path: str = TEMPLATE_INDEX_FILE) -> TemplateIndex:
+    if not os.path.exists(path):
+        return TemplateIndex()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return TemplateIndex(json.load(f))
+    except Exception as e:
+        print(f"[ROTATION] Could not read template index: {e}")
+        return TemplateIndex()
+
+
+def save_template_index(index: TemplateIndex, path: str = TEMPLATE_INDEX_FILE):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index.ids, f)
+    os.replace(tmp, path)
+
+
+# =================================================
+# ================  ALIAS TABLE  ==================
+# =================================================
+
+class AliasTable:
+    """Vose's alias method: O(n) build, O(1) weighted draw."""
+
+    def __init__(self, items: list, weights: list[float]):
+        n = len(items)
+        self.items = items
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        total = sum(weights)
+        scaled = [w * n / total for w in weights] if total > 0 else [1.0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = int(rng.random() * len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
+def base_weights(templates: list[QuestTemplate]) -> list[float]:
+    """
+    Class-level weights: every QuestType present gets the same total mass
+    (so a class with 40 SOCIAL and 4 TRAVEL quests still sees TRAVEL), then
+    tags scale individual templates within their type.
+    """
+    per_type = Counter(t.type for t in templates)
+    weights = []
+    for t in templates:
+        w = 1.0 / per_type[t.type]
+        for tag in t.tags or []:
+            w *= TAG_WEIGHTS.get(tag, 1.0)
+        weights.append(w)
+    return weights
+
+
+# =================================================
+# ============  PER-PLAYER HISTORY  ===============
+# =================================================
+
+def _ensure_history(player, size: int):
+    if len(player.quest_history) != size:
+        # Resize (or initialise) keeping the newest entries
+        recent = recent_indices(player)[:size]
+        player.quest_history = [EMPTY_SLOT] * size
+        player.quest_history_head = 0
+        for index in reversed(recent):
+            remember_index(player, index)
+
+
+def remember_index(player, index: int):
+    size = len(player.quest_history)
+    player.quest_history[player.quest_history_head] = index
+    player.quest_history_head = (player.quest_history_head + 1) % size
+
+
+def recent_indices(player) -> list[int]:
+    """Template indices in the player's ring, newest first."""
+    size = len(player.quest_history)
+    out = []
+    for age in range(size):
+        index = player.quest_history[(player.quest_history_head - 1 - age) % size]
+        if index == EMPTY_SLOT:
+            break
+        out.append(index)
+    return out
+
+
+# =================================================
+# ==============  ROTATION ENGINE  ================
+# =================================================
+
+class RotationEngine:
+    """
+    Picks daily quests from an eligibility class.
+
+    Each class has a precomputed alias table over base_weights(); a draw
+    is then accepted with probability RECENT_PENALTY[age] if the template
+    is in the player's history, times SAME_TYPE_PENALTY if it repeats the
+    last quest's type. Expected draws stay O(1); after MAX_DRAWS the best
+    candidate seen is used.
+    """
+
+    def __init__(self, index: TemplateIndex | None = None, history_size: int = HISTORY_SIZE, rng=random):
+        self.index = index if index is not None else TemplateIndex()
+        self.history_size = history_size
+        self.rng = rng
+        self._tables: dict[frozenset, tuple[AliasTable, dict[int, QuestTemplate]]] = {}
+        self._types: dict[int, object] = {}
+
+    def sync(self, templates: dict[str, QuestTemplate]) -> bool:
+        """Call when the template set changes. Returns True if the index grew."""
+        self._tables.clear()
+        grew = self.index.sync(sorted(templates))
+        self._types = {self.index.encode(qid): t.type for qid, t in templates.items()}
+        return grew
+
+    def update(self, templates: dict[str, QuestTemplate], touched: set[str], role_classes) -> bool:
+        """
+        Incremental sync after a reload: register new ids, refresh types for
+        `touched` templates and drop only the tables of `role_classes`.
+        """
+        grew = self.index.sync(sorted(qid for qid in touched if qid in templates))
+        for qid in touched:
+            if qid in templates:
+                self._types[self.index.encode(qid)] = templates[qid].type
+        for role_class in role_classes:
+            self._tables.pop(role_class, None)
+        return grew
+
+    def _table(self, role_class: frozenset, eligible: list[QuestTemplate]):
+        entry = self._tables.get(role_class)
+        if entry is None:
+            by_index = {self.index.encode(t.quest_id): t for t in eligible}
+            table = AliasTable(list(by_index), base_weights(list(by_index.values())))
+            entry = self._tables[role_class] = (table, by_index)
+        return entry
+
+    def pick(self, player, role_class: frozenset, eligible: list[QuestTemplate]) -> QuestTemplate:
+        table, by_index = self._table(role_class, eligible)
+        _ensure_history(player, self.history_size)
+
+        recent = recent_indices(player)
+        ages = {}
+        for age, index in enumerate(recent):
+            ages.setdefault(index, age)
+        last_type = self._types.get(recent[0]) if recent else None
+
+        best, best_score = None, -1.0
+        for _ in range(MAX_DRAWS):
+            index = table.sample(self.rng)
+            score = RECENT_PENALTY[min(ages[index], len(RECENT_PENALTY) - 1)] if index in ages else 1.0
+            if by_index[index].type == last_type:
+                score *= SAME_TYPE_PENALTY
+            if self.rng.random() < score:
+                return by_index[index]
+            if score > best_score:
+                best, best_score = index, score
+        return by_index[best]
+
+    def remember(self, player, quest_id: str):
+        _ensure_history(player, self.history_size)
+        remember_index(player, self.index.encode(quest_id))
@@ -0,0 +1,18 @@
+"""
+Current season epoch.
+
+Player seasonal counters carry the epoch they were earned in; a counter
+stamped with any other epoch reads as zero. Rolling the season over is
+then a single increment on the board instead of a walk over every player.
+"""
+
+_current = 0
+
+
+def current() -> int:
+    return _current
+
+
+def set_current(epoch: int) -> None:
+    global _current
+    _current = int(epoch)
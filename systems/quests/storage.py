@@ -1,5 +1,6 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 from .player_state import PlayerState
@@ -11,7 +12,7 @@ from .quest_models import QuestTemplate
 # -------------------------------------------------
 # Base paths (Persistent on Railway)
 # -------------------------------------------------
-DATA_DIR = "/mnt/data"
+DATA_DIR = os.getenv("DATA_DIR", "/mnt/data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
 PLAYERS_FILE = os.path.join(DATA_DIR, "players.json")
@@ -45,6 +46,12 @@ def load_players() -> Dict[int, PlayerState]:
         ps.user_id = uid
         players[uid] = ps
 
+    # One-time rewrite of legacy (level, xp) profiles into total-XP form
+    legacy = sum(1 for pdata in raw.values() if "total_xp" not in pdata)
+    if legacy:
+        print(f"[XP] Migrated {legacy} player profiles to total-XP form")
+        save_players(players)
+
     return players
 
 
@@ -85,6 +92,7 @@ def load_board() -> QuestBoard:
         raw = json.load(f)
 
     board.season_id = raw.get("season_id", "default_season")
+    board.season_epoch = raw.get("season_epoch", 0)
     board.global_points = raw.get("global_points", 0)
 
     # Safe defaults if keys don't exist yet
@@ -94,6 +102,7 @@ def load_board() -> QuestBoard:
     board.season_goal = raw.get("season_goal", 100)
     board.faction_goal = raw.get("faction_goal", 250)
     board.season_reward = raw.get("season_reward", "")
+    board.xp_curve = raw.get("xp_curve", "standard")
 
     return board
 
@@ -102,13 +111,15 @@ def save_board(board: QuestBoard) -> None:
     """Persist global quest board."""
     data = {
         "season_id": board.season_id,
+        "season_epoch": board.season_epoch,
         "global_points": board.global_points,
         "faction_points": board.faction_points,
         "faction_goal": board.faction_goal,
         "display_channel_id": board.display_channel_id,
         "message_id": board.message_id,
         "season_goal": board.season_goal,
-        "season_reward": board.season_reward,    
+        "season_reward": board.season_reward,
+        "xp_curve": board.xp_curve,
     }
     with open(BOARD_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
@@ -209,3 +220,21 @@ def delete_template(quest_id: str) -> None:
     if quest_id in templates:
         del templates[quest_id]
     save_templates(templates)
+
+
+# =================================================
+# ================ BULK LOADING ===================
+# =================================================
+
+def load_all(max_workers: int = 4) -> tuple:
+    """
+    Load templates, NPCs, players and the board concurrently.
+    Returns (templates, npcs, players, board).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="data-load") as pool:
+        templates = pool.submit(load_templates)
+        npcs = pool.submit(load_npcs)
+        players = pool.submit(load_players)
+        board = pool.submit(load_board)
+
+        return templates.result(), npcs.result(), players.result(), board.result()
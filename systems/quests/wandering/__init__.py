@@ -1 +1,6 @@
-from .manager import WanderingEventManager
+def __getattr__(name):
+    # Lazy so the pure models/storage can be imported without discord.py
+    if name == "WanderingEventManager":
+        from .manager import WanderingEventManager
+        return WanderingEventManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
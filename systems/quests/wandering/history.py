@@ -0,0 +1,240 @@
+import json
+import os
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from systems import clock
+from .models import WanderingEvent
+from .storage import DATA_DIR
+
+# One JSON line per finished hunt, oldest first; never rewritten
+HISTORY_FILE = os.path.join(DATA_DIR, "wandering_history.jsonl")
+
+# ========= History Settings =========
+RECENT_KEEP = 50          # finished hunts kept in memory for the admin view
+MIN_HOUR_SAMPLES = 3      # hunts an hour needs before its turnout is trusted
+MIN_SLOT_GAP = 2          # hours between recommended spawn slots
+
+
+def encode_ids(ids) -> list[int]:
+    """Sorted user ids as the first id followed by gaps."""
+    out, prev = [], 0
+    for uid in sorted(ids):
+        out.append(uid - prev)
+        prev = uid
+    return out
+
+
+def decode_ids(deltas) -> list[int]:
+    out, total = [], 0
+    for delta in deltas:
+        total += delta
+        out.append(total)
+    return out
+
+
+def _hour_gap(a: int, b: int) -> int:
+    d = abs(a - b) % 24
+    return min(d, 24 - d)
+
+
+@dataclass
+class HuntRecord:
+    event_id: str
+    title: str
+    difficulty: str
+    channel_id: int
+    spawned_at: int          # unix seconds
+    resolved_at: int
+    required: int
+    success: bool
+    participants: list[int]  # sorted
+    factions: list[str]
+
+    @property
+    def slot(self) -> int:
+        """The spawn slot: hunts posted in the same UTC hour, whatever the channel."""
+        return self.spawned_at // 3600
+
+    @property
+    def hour(self) -> int:
+        """UTC hour the hunt was posted in."""
+        return datetime.fromtimestamp(self.spawned_at, timezone.utc).hour
+
+    @classmethod
+    def from_event(cls, event: WanderingEvent, success: bool, resolved_at: datetime) -> "HuntRecord":
+        spawned = event.ends_at.timestamp() - event.duration_minutes * 60
+        return cls(
+            event_id=event.event_id,
+            title=event.title,
+            difficulty=event.difficulty,
+            channel_id=event.channel_id,
+            spawned_at=int(spawned),
+            resolved_at=int(resolved_at.timestamp()),
+            required=event.required_participants,
+            success=success,
+            participants=sorted(event.participants),
+            factions=sorted(event.participating_factions),
+        )
+
+    def to_line(self) -> str:
+        return json.dumps(
+            {
+                "id": self.event_id,
+                "t": self.title,
+                "d": self.difficulty,
+                "ch": self.channel_id,
+                "s": self.spawned_at,
+                "r": self.resolved_at,
+                "req": self.required,
+                "ok": int(self.success),
+                "u": encode_ids(self.participants),
+                "f": self.factions,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HuntRecord":
+        return cls(
+            event_id=data["id"],
+            title=data.get("t", "Unknown Threat"),
+            difficulty=data.get("d", "minor"),
+            channel_id=data.get("ch", 0),
+            spawned_at=data["s"],
+            resolved_at=data.get("r", data["s"]),
+            required=data.get("req", 1),
+            success=bool(data.get("ok")),
+            participants=decode_ids(data.get("u", [])),
+            factions=list(data.get("f", [])),
+        )
+
+
+@dataclass
+class HourStats:
+    hunts: int = 0
+    successes: int = 0
+    hunters: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.hunts if self.hunts else 0.0
+
+    @property
+    def turnout(self) -> float:
+        return self.hunters / self.hunts if self.hunts else 0.0
+
+
+@dataclass
+class PlayerHunts:
+    joins: int = 0
+    streak: int = 0          # consecutive spawn slots joined, ending at `last_slot`
+    best: int = 0
+    last_slot: int = -1
+
+
+class WanderingHistory:
+    """
+    Append-only log of finished hunts plus the indexes built from it:
+    per-UTC-hour turnout / success, per-player join streaks, and the most
+    recent hunts. A streak counts spawn slots, not hunts: with one event
+    per channel, joining any one hunt of a slot keeps it going. load() scans the file once; append() writes one line
+    and updates the indexes in place.
+    """
+
+    def __init__(self, path: str = HISTORY_FILE):
+        self.path = path
+        self._reset()
+
+    def _reset(self):
+        self.count = 0
+        # Spawn slot (unix hour) → its position among the slots seen so far
+        self.slots: dict[int, int] = {}
+        self.hours: dict[int, HourStats] = {}
+        self.players: dict[int, PlayerHunts] = {}
+        self.recent: deque[HuntRecord] = deque(maxlen=RECENT_KEEP)
+        self.loaded = False
+
+    def load(self):
+        self._reset()
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = HuntRecord.from_dict(json.loads(line))
+                    except Exception as e:
+                        # A torn last line from a crash mid-write: skip it, keep the rest
+                        print(f"[WANDERING] History line {lineno} unreadable, skipped: {e}")
+                        continue
+                    self._index(record)
+        self.loaded = True
+
+    def _index(self, record: HuntRecord):
+        self.count += 1
+        slot = self.slots.setdefault(record.slot, len(self.slots))
+
+        hour = self.hours.setdefault(record.hour, HourStats())
+        hour.hunts += 1
+        hour.successes += record.success
+        hour.hunters += len(record.participants)
+
+        for uid in record.participants:
+            player = self.players.setdefault(uid, PlayerHunts())
+            player.joins += 1
+            if player.last_slot >= slot:
+                # Another channel's hunt in a slot already counted
+                continue
+            player.streak = player.streak + 1 if player.last_slot == slot - 1 else 1
+            player.best = max(player.best, player.streak)
+            player.last_slot = slot
+
+        self.recent.append(record)
+
+    def append(self, event: WanderingEvent, success: bool) -> HuntRecord:
+        record = HuntRecord.from_event(event, success, clock.now())
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(record.to_line() + "\n")
+        self._index(record)
+        return record
+
+    # ---------- Queries ----------
+    def current_streak(self, user_id: int) -> int:
+        """Spawn slots joined in a row up to and including the latest one."""
+        player = self.players.get(user_id)
+        return player.streak if player and player.last_slot == len(self.slots) - 1 else 0
+
+    def top_streaks(self, n: int = 5) -> list[tuple[int, PlayerHunts]]:
+        ranked = sorted(self.players.items(), key=lambda kv: (-kv[1].best, -kv[1].joins, kv[0]))
+        return ranked[:n]
+
+    def recommend_hours(self, current: list[int]) -> list[int]:
+        """
+        As many spawn hours as `current` has: the best-attended hours with
+        enough history first, at least MIN_SLOT_GAP apart, topped up from
+        `current` where the data runs out.
+        """
+        slots = len(current)
+        trusted = sorted(
+            (h for h, stats in self.hours.items() if stats.hunts >= MIN_HOUR_SAMPLES),
+            key=lambda h: (-self.hours[h].turnout, -self.hours[h].success_rate, h),
+        )
+
+        chosen: list[int] = []
+        for hour in trusted + sorted(current):
+            if len(chosen) >= slots:
+                break
+            if hour not in chosen and all(_hour_gap(hour, c) >= MIN_SLOT_GAP for c in chosen):
+                chosen.append(hour)
+
+        # Gaps can leave slots empty; never schedule fewer hunts than today
+        for hour in current:
+            if len(chosen) >= slots:
+                break
+            if hour not in chosen:
+                chosen.append(hour)
+
+        return sorted(chosen)
@@ -1,38 +1,24 @@
 from __future__ import annotations
 import asyncio
 import os
-import secrets
-from dataclasses import asdict
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Optional
-import random
-from .monsters import WANDERING_MONSTERS
+from systems import clock
+from systems.outbound import EffectRun, Priority, channel_route, outbound
+from systems.outbound.anchors import anchors
 import discord
 from .models import WanderingEvent
 from .views import WanderingEventView, WanderingEventResolvedView
-from .storage import save_active_event, load_active_event
-from systems.quests.quest_manager import QuestManager
-from datetime import datetime, timedelta, timezone
+from .storage import delete_event, load_events, save_event
+from .history import WanderingHistory
+from systems.engine import wandering as rules
+from systems.engine.wandering import (
+    DIFFICULTY_TABLE,
+    SPAWN_HOURS,
+    seconds_until_next_spawn,
+)
 
 
-EVENT_INTERVAL = 3 * 60 * 60  # 3 hours
-SPAWN_HOURS = [0, 4, 8, 12, 16, 20]
-
-DIFFICULTY_TABLE = {
-    "test":    {"minutes": 5,  "required": 1,  "faction": 5,  "global": 5,  "xp": 10},
-    "minor":   {"minutes": 15, "required": 3,  "faction": 10, "global": 10, "xp": 20},
-    "standard":{"minutes": 20, "required": 5,  "faction": 20, "global": 20, "xp": 30},
-    "major":   {"minutes": 30, "required": 8,  "faction": 30, "global": 25, "xp": 40},
-    "critical":{"minutes": 30, "required": 12, "faction": 40, "global": 30, "xp": 50},
-}
-
-DIFFICULTY_SPAWN_WEIGHT = {
-    "minor": 50,
-    "standard": 25,
-    "major": 10,
-    "critical": 3,
-}
-
 def get_wandering_ping(bot: discord.Client, guild_id: int) -> str:
     role_id = os.getenv("WANDERING_PING_ROLE_ID")
     if not role_id:
@@ -47,71 +33,117 @@ def get_wandering_ping(bot: discord.Client, guild_id: int) -> str:
         print(f"[WANDERING] Failed to resolve ping role: {e}")
         return ""
 
-def seconds_until_next_spawn(spawn_hours: list[int]) -> float:
-        now = datetime.now(timezone.utc)
-        today = now.date()
-
-        candidates = []
-
-        for hour in spawn_hours:
-            candidate = datetime(
-                year=today.year,
-                month=today.month,
-                day=today.day,
-                hour=hour,
-                minute=0,
-                second=0,
-                tzinfo=timezone.utc,
-            )
-            GRACE_SECONDS = 60  # allow 1 minute late
-
-            if candidate + timedelta(seconds=GRACE_SECONDS) > now:
-                candidates.append(candidate)
-
-        # If no times left today, take first spawn tomorrow
-        if not candidates:
-            first_hour = min(spawn_hours)
-            candidate = datetime(
-                year=today.year,
-                month=today.month,
-                day=today.day,
-                hour=first_hour,
-                minute=0,
-                second=0,
-                tzinfo=timezone.utc,
-            ) + timedelta(days=1)
-            candidates.append(candidate)
-
-        next_spawn = min(candidates)
-        return (next_spawn - now).total_seconds()
-
 class WanderingEventManager:
-    def __init__(self, quest_manager, luneth_channel_id: int):
+    def __init__(
+        self,
+        quest_manager,
+        luneth_channel_id: int,
+        points_log=None,
+        announcements=None,
+        channel_ids=None,
+        auto_hours: bool = False,
+        guild_id: int = 0,
+    ):
         self.quest_manager = quest_manager
+        # Where the ping role lives when the spawn channel is only a partial
+        self.guild_id = guild_id
         self.luneth_channel_id = luneth_channel_id
+        # Channels the scheduler spawns into, one live event each
+        self.channel_ids: list[int] = list(channel_ids or [luneth_channel_id])
+        # Batched POINTS_LOG_CHANNEL_ID writer (PointsLogAggregator)
+        self.points_log = points_log
+        # Badge / level-up digest poster (AnnouncementBatcher)
+        self.announcements = announcements
         self._startup_logged = False
-        self.active: Optional[WanderingEvent] = None
-        self._resolve_task: Optional[asyncio.Task] = None
+        # Live events by event_id, and message_id → event_id for the persistent join button
+        self.events: dict[str, WanderingEvent] = {}
+        self._by_message: dict[int, str] = {}
+        self._resolve_tasks: dict[str, asyncio.Task] = {}
+        # Strong refs to fire-and-forget tasks (the loop only keeps weak ones)
+        self._background_tasks: set[asyncio.Task] = set()
+        # "resolve <title>: 412ms wall (board refresh 120ms, …)" for the last resolution
+        self.last_resolution_report: str | None = None
+        # Finished hunts; with auto_hours the scheduler follows its best-attended hours
+        self.history = WanderingHistory()
+        self.auto_hours = auto_hours
 
         self.refresh_board_callback = None
 
-    async def announce_next_spawn(self, bot, next_time: datetime):
-        channel = bot.get_channel(self.luneth_channel_id)
+    async def announce_next_spawn(self, bot, next_time: datetime, channel_id: int | None = None):
+        channel_id = channel_id or self.luneth_channel_id
+        channel = bot.get_channel(channel_id)
         if channel is None:
             try:
-                channel = await bot.fetch_channel(self.luneth_channel_id)
+                channel = await bot.fetch_channel(channel_id)
             except Exception:
                 return
 
-        await channel.send(
-            (
-                "🌫️ **The Vale grows restless…**\n"
-                "A new wandering threat is expected.\n\n"
-                f"🕰️ **Next Spawn:** <t:{int(next_time.timestamp())}:F>\n"
-                f"⏳ *(In {int((next_time - datetime.now(timezone.utc)).total_seconds() // 60)} minutes)*"
-            )
+        content = (
+            "🌫️ **The Vale grows restless…**\n"
+            "A new wandering threat is expected.\n\n"
+            f"🕰️ **Next Spawn:** <t:{int(next_time.timestamp())}:F>\n"
+            f"⏳ *(In {int((next_time - clock.now()).total_seconds() // 60)} minutes)*"
+        )
+        await outbound.submit(Priority.ANNOUNCE, channel_route(channel.id), lambda: channel.send(content))
+
+
+    # ---------- Live events ----------
+    def track(self, event: WanderingEvent):
+        """Make `event` live in memory (indexes only; persisting is the caller's job)."""
+        self.events[event.event_id] = event
+        if event.message_id:
+            self._by_message[event.message_id] = event.event_id
+
+    def _untrack(self, event: WanderingEvent):
+        self.events.pop(event.event_id, None)
+        if event.message_id:
+            self._by_message.pop(event.message_id, None)
+        self._resolve_tasks.pop(event.event_id, None)
+
+    def _set_message(self, event: WanderingEvent, message_id: int | None):
+        if event.message_id:
+            self._by_message.pop(event.message_id, None)
+        event.message_id = message_id
+        if message_id and self.events.get(event.event_id) is event:
+            self._by_message[message_id] = event.event_id
+
+    def is_live(self, event: WanderingEvent) -> bool:
+        return self.events.get(event.event_id) is event and not event.resolved
+
+    def event_in(self, channel_id: int) -> Optional[WanderingEvent]:
+        """The live event in `channel_id`, if any."""
+        for event in self.events.values():
+            if event.channel_id == channel_id and not event.resolved:
+                return event
+        return None
+
+    # ---------- Anchor ----------
+    @staticmethod
+    def _anchor_name(event: WanderingEvent) -> str:
+        return f"wandering:{event.event_id}"
+
+    def _register_anchor(self, event: WanderingEvent):
+        def _set(channel_id, message_id):
+            self._set_message(event, message_id)
+            if self.is_live(event):
+                save_event(event)
+
+        def _recreate():
+            # Deleted while still running → put it back (without a second ping)
+            if not self.is_live(event):
+                return None
+            return {
+                "content": "⚠️ **A wandering threat has appeared!**",
+                "embed": self.build_event_embed(event),
+                "view": WanderingEventView(self),
+            }
+
+        anchors.register(
+            self._anchor_name(event),
+            get=lambda: (event.channel_id, event.message_id),
+            set=_set,
+            recreate=_recreate,
         )
-
 
     # ---------- Embeds ----------
     def build_event_embed(self, event: WanderingEvent) -> discord.Embed:
@@ -189,23 +221,25 @@ class WanderingEventManager:
 
     # ---------- Public API ----------
     async def startup_resume(self, bot: discord.Client):
-        self.active = load_active_event()
-
-        # 🔥 Auto-clear invalid or expired events
-        if self.active:
-            if (
-                self.active.ends_at is None
-                or datetime.now(timezone.utc) >= self.active.ends_at
-            ):
-                print("[WANDERING] Clearing stale active event on startup")
-                self.active = None
-                save_active_event(None)
+        try:
+            await asyncio.to_thread(self.history.load)
+        except Exception as e:
+            print(f"[WANDERING] Could not load hunt history: {e}")
+
+        # 🔥 Auto-clear expired events
+        now = clock.now()
+        for event in load_events().values():
+            if event.resolved or now >= event.ends_at:
+                print(f"[WANDERING] Clearing stale event {event.event_id} on startup")
+                delete_event(event.event_id)
+            else:
+                self.track(event)
 
         # 🔔 Log system state (once per process)
         if not getattr(self, "_startup_logged", False):
             self._startup_logged = True
 
-            await asyncio.sleep(5)  # allow Discord cache
+            await clock.sleep(5)  # allow Discord cache
 
             next_spawn = self.get_next_spawn_time()
             await self.log_to_points(
@@ -213,291 +247,281 @@ class WanderingEventManager:
                 (
                     "🧭 **Wandering System Online**\n"
                     "• Scheduler initialized\n"
+                    f"• Channels: {len(self.channel_ids)} • Live events: {len(self.events)}\n"
+                    f"• Spawn hours (UTC): {', '.join(map(str, self.spawn_hours()))}"
+                    f"{' (auto)' if self.auto_hours else ''}\n"
                     f"• Next wandering threat: <t:{int(next_spawn.timestamp())}:F>"
                 )
             )
 
-        # Resume unresolved but valid events
-        if self.active and not self.active.resolved:
-            self._schedule_resolution(bot)
-            await self._refresh_active_message(bot)
+        # Resume unresolved but valid events, each on its own timer
+        for event in list(self.events.values()):
+            self._register_anchor(event)
+            self._schedule_resolution(bot, event)
+        await asyncio.gather(*(self._refresh_event_message(event) for event in list(self.events.values())))
 
 
-    async def spawn(self, bot: discord.Client, title: str, description: str, difficulty: str, image=None):
+    async def spawn(self, bot: discord.Client, title: str, description: str, difficulty: str, image=None, channel_id: int | None = None):
         if difficulty not in DIFFICULTY_TABLE:
             raise ValueError(f"Invalid difficulty: {difficulty}")
 
-        # prevent stacking events
-        if self.active and not self.active.resolved:
-            raise RuntimeError("An event is already active.")
+        channel_id = channel_id or self.luneth_channel_id
 
-        cfg = DIFFICULTY_TABLE[difficulty]
-        ends_at = datetime.now(timezone.utc) + timedelta(minutes=cfg["minutes"])
+        # prevent stacking events in one channel
+        if self.event_in(channel_id):
+            raise RuntimeError("An event is already active in that channel.")
 
-        event = WanderingEvent(
-            event_id=secrets.token_hex(8),
-            channel_id=self.luneth_channel_id,
-            message_id=None,
-            duration_minutes = cfg["minutes"],
-            ends_at=ends_at,
-            title=title,
-            description=description,
-            difficulty=difficulty,
-            required_participants=cfg["required"],
-            faction_reward=cfg["faction"],
-            global_reward=cfg["global"],
-            xp_reward=cfg["xp"],
-            image=image,
-        )
+        event = rules.create_event(title, description, difficulty, channel_id, image)
 
-        self.active = event
+        self.track(event)
 
-        channel = bot.get_channel(self.luneth_channel_id) or await bot.fetch_channel(self.luneth_channel_id)
-        
-        ping = get_wandering_ping(bot, channel.guild.id)
+        # Cached channel, else a partial one: no fetch before the send
+        channel = anchors.channel(channel_id)
+        # A partial channel has no guild; fall back to the configured one
+        guild = getattr(channel, "guild", None)
+        guild_id = guild.id if guild else self.guild_id
+        ping = get_wandering_ping(bot, guild_id) if guild_id else ""
 
         content = "⚠️ **A wandering threat has appeared!**"
         if ping:
             content += f" {ping}"
 
-        msg = await channel.send(
-            content=content,
-            embed=self.build_event_embed(event),
-            view=WanderingEventView(self, event.event_id),
-        )
-
-        event.message_id = msg.id
-        save_active_event(event)
-
-        self._schedule_resolution(bot)
-
-        await self.log_to_points(
+        run = EffectRun(f"spawn {event.title}")
+        msg = await run.step("event post", outbound.submit(
+            Priority.ANNOUNCE,
+            channel_route(channel.id),
+            lambda: channel.send(
+                content=content,
+                embed=self.build_event_embed(event),
+                view=WanderingEventView(self),
+            ),
+        ))
+
+        if msg is None:
+            # Nobody can join an event that was never posted, and it never gets logged
+            print(f"[WANDERING] {run.report()}")
+            self._untrack(event)
+            raise RuntimeError("Could not post the event message.")
+
+        self._set_message(event, msg.id)
+        save_event(event)
+        self._register_anchor(event)
+
+        # Only a posted event makes the log
+        await run.step("spawn log", self.log_to_points(
             bot,
             (
                 "🐲 **Wandering Threat Spawned**\n"
-                f"• **{event.title}**\n"
+                f"• **{event.title}** in <#{channel_id}>\n"
                 f"• Difficulty: **{event.difficulty.title()}**\n"
                 f"• Duration: **{event.duration_minutes} minutes**\n"
                 f"• Required Hunters: **{event.required_participants}**"
             )
-        )
+        ))
+        print(f"[WANDERING] {run.report()}")
 
-    async def handle_participation(self, interaction: discord.Interaction, event_id: str):
-        event = self.active
-        if not event or event.event_id != event_id:
-            return await interaction.response.send_message("⚠️ This event is no longer active.", ephemeral=True)
+        self._schedule_resolution(bot, event)
 
-        if event.resolved or datetime.now(timezone.utc) >= event.ends_at:
-            return await interaction.response.send_message("⚠️ This event has already ended.", ephemeral=True)
-
-        user_id = interaction.user.id
-        if user_id in event.participants:
-            return await interaction.response.send_message("✅ You’re already in the hunt.", ephemeral=True)
+    async def handle_participation(self, interaction: discord.Interaction, event_id: str | None = None):
+        if event_id is None:
+            # Persistent button: the clicked message identifies the event
+            message = getattr(interaction, "message", None)
+            event_id = self._by_message.get(message.id) if message is not None else None
+        event = self.events.get(event_id)
 
         # Determine the player's faction from your existing system
-        player = self.quest_manager.get_player(user_id)
+        player = self.quest_manager.get_player(interaction.user.id)
+        faction_id = player.faction_id if player else None
 
-        if user_id in event.participants:
-            return await interaction.response.send_message(
-                "✅ You’re already participating.",
-                ephemeral=True,
-            )
+        outcome = rules.join_event(event, interaction.user.id, faction_id)
 
-        event.participants.add(user_id)
+        if outcome == rules.JOIN_INACTIVE:
+            return await interaction.response.send_message("⚠️ This event is no longer active.", ephemeral=True)
 
-        if player.faction_id:
-            event.participating_factions.add(player.faction_id)
+        if outcome == rules.JOIN_ENDED:
+            return await interaction.response.send_message("⚠️ This event has already ended.", ephemeral=True)
 
-        save_active_event(event)
+        if outcome == rules.JOIN_ALREADY:
+            return await interaction.response.send_message("✅ You’re already in the hunt.", ephemeral=True)
 
-        await self._refresh_active_message(interaction.client)
+        # Only this event's file is rewritten
+        save_event(event)
+
+        await self._refresh_event_message(event)
 
         await interaction.response.send_message(
             "⚔️ You’ve joined the event!",
             ephemeral=True,
         )
 
-    async def resolve_active(self, bot: discord.Client):
-        event = self.active
-        if not event or event.resolved:
+    async def resolve(self, bot: discord.Client, event: WanderingEvent):
+        if not self.is_live(event):
             return
 
-        success = len(event.participants) >= event.required_participants
-        xp = event.xp_reward
-
-        # Award points only on success
-        if success:
-            # 🌍 global ONCE
-            self.quest_manager.quest_board.global_points += event.global_reward
-
-            # ⚡ faction power per participating faction
-            for fid in event.participating_factions:
-                self.quest_manager.quest_board.faction_points[fid] = (
-                    self.quest_manager.quest_board.faction_points.get(fid, 0) + event.faction_reward
+        # Award points only on success (one pass, one save)
+        rewards = rules.apply_event_rewards(self.quest_manager, event)
+        success = rewards is not None
+
+        # 🌟 Hunt XP can level players up — announce via the digest
+        if success and self.announcements is not None:
+            for uid in rewards["rewarded"]:
+                self.announcements.add(
+                    uid,
+                    badges=rewards["new_badges"].get(uid, ()),
+                    level=rewards["level_ups"].get(uid),
                 )
 
+        # 🔒 Close the event before any Discord call can fail or stall
+        event.resolved = True
+        self._untrack(event)
+        delete_event(event.event_id)
 
-            # 🏅 player contribution per participant
-            for uid in event.participants:
-                p = self.quest_manager.get_player(uid)
-                p.monsters_season += 1
-                p.monsters_lifetime += 1
-                p.add_xp(xp)
-
-            self.quest_manager.save_board()
-            self.quest_manager.save_players()
-
-            # 🔄 Refresh the quest board embed
-        if self.refresh_board_callback:
-            await self.refresh_board_callback(bot)
+        # 📜 The only lasting record of who hunted what, and when
+        try:
+            self.history.append(event, success)
+        except Exception as e:
+            print(f"[WANDERING] Could not record hunt history: {e}")
 
         if success:
-            await self.log_to_points(
-                bot,
-                (
-                    "✅ **Wandering Threat Cleared**\n"
-                    f"• **{event.title}**\n"
-                    f"• Participants: **{len(event.participants)}**\n"
-                    f"• Global Progress: **+{event.global_reward}**\n"
-                    f"• Faction Progress: **+{event.faction_reward}** "
-                    f"({', '.join(event.participating_factions) or 'None'})\n"
-                    f"• XP per Player: **{event.xp_reward}**"
-                )
+            outcome_log = (
+                "✅ **Wandering Threat Cleared**\n"
+                f"• **{event.title}**\n"
+                f"• Participants: **{len(event.participants)}**\n"
+                f"• Global Progress: **+{event.global_reward}**\n"
+                f"• Faction Progress: **+{event.faction_reward}** "
+                f"({', '.join(event.participating_factions) or 'None'})\n"
+                f"• XP per Player: **{event.xp_reward}**"
             )
         else:
-            await self.log_to_points(
-                bot,
-                (
-                    "❌ **Wandering Threat Failed**\n"
-                    f"• **{event.title}**\n"
-                    f"• Participants: **{len(event.participants)} / {event.required_participants}**\n"
-                    "• No progress or XP awarded"
-                )
+            outcome_log = (
+                "❌ **Wandering Threat Failed**\n"
+                f"• **{event.title}**\n"
+                f"• Participants: **{len(event.participants)} / {event.required_participants}**\n"
+                "• No progress or XP awarded"
             )
 
-        await self._delete_active_message(bot)
-        await self._post_result_message(bot, success)
-
-        event.resolved = True
-        save_active_event(event)
-
-        # Auto-delete after 10 minutes
-        if not success:
-            await self._schedule_delete(bot, delay_seconds=600)
-
-        # Clear active
-        self.active = None
-        save_active_event(None)
-
         next_time = self.get_next_spawn_time()
-        await self.announce_next_spawn(bot, next_time)
+        next_delay = seconds_until_next_spawn(self.spawn_hours())
+        scheduled_time = clock.now() + timedelta(seconds=next_delay)
+        schedule_log = (
+            "⏳ **Next Wandering Spawn Scheduled**\n"
+            f"• UTC: <t:{int(scheduled_time.timestamp())}:F>\n"
+            f"• In **{int(next_delay // 60)} minutes**"
+        )
+
+        # 🚀 Side effects: independent ones run together; chains keep their order
+        run = EffectRun(f"resolve {event.title}")
+
+        async def _result_then_next_spawn():
+            # Readers should see the result before the next-spawn notice
+            msg = await run.step("result post", self._post_result_message(bot, event, success))
+            # Auto-delete the failure notice after 10 minutes
+            if not success and msg is not None:
+                self._schedule_delete(msg, delay_seconds=600)
+            await run.step("next spawn notice", self.announce_next_spawn(bot, next_time, event.channel_id))
+
+        async def _logs():
+            await run.step("outcome log", self.log_to_points(bot, outcome_log))
+            await run.step("schedule log", self.log_to_points(bot, schedule_log))
+
+        effects = [
+            run.step("event delete", self._delete_event_message(event)),
+            _result_then_next_spawn(),
+            _logs(),
+        ]
+        # 🔄 Refresh the quest board embed
+        if self.refresh_board_callback:
+            effects.append(run.step("board refresh", self.refresh_board_callback(bot)))
 
-        # 📅 Log NEXT spawn (after spawning)
-        next_delay = seconds_until_next_spawn(SPAWN_HOURS)
-        next_time = datetime.now(timezone.utc) + timedelta(seconds=next_delay)
+        await run.gather(*effects)
 
-        await self.log_to_points(
-            bot,
-            (
-                "⏳ **Next Wandering Spawn Scheduled**\n"
-                f"• UTC: <t:{int(next_time.timestamp())}:F>\n"
-                f"• In **{int(next_delay // 60)} minutes**"
-            )
-        )
+        self.last_resolution_report = run.report()
+        print(f"[WANDERING] {self.last_resolution_report}")
 
     # ---------- Internals ----------
-    # Only cancel if we're explicitly replacing the active event
-    def _schedule_resolution(self, bot: discord.Client):
-        # Cancel any existing resolution task
-        if self._resolve_task and not self._resolve_task.done():
-            self._resolve_task.cancel()
+    def _schedule_resolution(self, bot: discord.Client, event: WanderingEvent):
+        # Replace this event's timer only; other events keep theirs
+        old = self._resolve_tasks.get(event.event_id)
+        if old and not old.done():
+            old.cancel()
 
         async def _runner():
-            if not self.active:
-                return
-
-            delay = (self.active.ends_at - datetime.now(timezone.utc)).total_seconds()
+            delay = (event.ends_at - clock.now()).total_seconds()
             if delay > 0:
-                await asyncio.sleep(delay)
+                await clock.sleep(delay)
 
-            await self.resolve_active(bot)
+            await self.resolve(bot, event)
 
-        self._resolve_task = asyncio.create_task(_runner())
+        self._resolve_tasks[event.event_id] = asyncio.create_task(_runner())
 
-    async def _refresh_active_message(self, bot: discord.Client):
-        event = self.active
-        if not event or not event.message_id:
+    async def _refresh_event_message(self, event: WanderingEvent):
+        if not event.message_id:
             return
         try:
-            channel = bot.get_channel(event.channel_id) or await bot.fetch_channel(event.channel_id)
-            msg = await channel.fetch_message(event.message_id)
-            await msg.edit(embed=self.build_event_embed(event), view=WanderingEventView(self, event.event_id))
-        except Exception:
-            # silently ignore; message could be deleted
-            pass
-
-    async def _delete_active_message(self, bot: discord.Client):
-        event = self.active
-        if not event or not event.message_id:
-            return
-        try:
-            channel = bot.get_channel(event.channel_id) or await bot.fetch_channel(event.channel_id)
-            msg = await channel.fetch_message(event.message_id)
-            await msg.delete()
-        except Exception:
-            pass
-
-    async def _post_result_message(self, bot: discord.Client, success: bool):
-        event = self.active
-        if not event:
-            return
-
-        channel = bot.get_channel(event.channel_id) or await bot.fetch_channel(event.channel_id)
+            await anchors.edit(
+                self._anchor_name(event),
+                # Only the hunter count changes while an event is live
+                version=(event.event_id, len(event.participants)),
+                embed=lambda: self.build_event_embed(event),
+                view=lambda: WanderingEventView(self),
+            )
+        except Exception as e:
+            print(f"[WANDERING] Could not refresh event message: {e}")
 
-        await channel.send(
-            embed=self.build_result_embed(event, success),
-            view=WanderingEventResolvedView(),
+    async def _delete_event_message(self, event: WanderingEvent):
+        name = self._anchor_name(event)
+        try:
+            await anchors.delete(name)
+        finally:
+            anchors.unregister(name)
+
+    async def _post_result_message(self, bot: discord.Client, event: WanderingEvent, success: bool):
+        channel = anchors.channel(event.channel_id)
+
+        return await outbound.submit(
+            Priority.ANNOUNCE,
+            channel_route(channel.id),
+            lambda: channel.send(
+                embed=self.build_result_embed(event, success),
+                view=WanderingEventResolvedView(),
+            ),
         )
 
-    async def _schedule_delete(self, bot: discord.Client, delay_seconds: int = 600):
-        event = self.active
-        if not event or not event.message_id:
-            return
-
+    def _schedule_delete(self, message: discord.Message, delay_seconds: int = 600):
         async def _deleter():
-            await asyncio.sleep(delay_seconds)
+            await clock.sleep(delay_seconds)
             try:
-                channel = bot.get_channel(event.channel_id) or await bot.fetch_channel(event.channel_id)
-                msg = await channel.fetch_message(event.message_id)
-                await msg.delete()
+                await message.delete()
             except Exception:
                 pass
 
-        asyncio.create_task(_deleter())
+        self._spawn_background(_deleter())
+
+    def _spawn_background(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _clear_orphans(self):
+        """Expired events whose timer is gone (crashed or cancelled) are dropped unresolved."""
+        now = clock.now()
+        for event in list(self.events.values()):
+            task = self._resolve_tasks.get(event.event_id)
+            if now >= event.ends_at and (task is None or task.done()):
+                print(f"[WANDERING] Auto-clearing expired event {event.event_id} in loop")
+                self._untrack(event)
+                delete_event(event.event_id)
+                anchors.unregister(self._anchor_name(event))
 
     def pick_random_monster(self):
-        # 1️⃣ Pick difficulty first (excluding test)
-        difficulties = list(DIFFICULTY_SPAWN_WEIGHT.keys())
-        weights = list(DIFFICULTY_SPAWN_WEIGHT.values())
-
-        difficulty = random.choices(
-            difficulties,
-            weights=weights,
-            k=1,
-        )[0]
-
-        # 2️⃣ Pick any monster of that difficulty
-        candidates = [
-            m for m in WANDERING_MONSTERS
-            if m["difficulty"] == difficulty
-        ]
-
-        if not candidates:
-            raise RuntimeError(f"No monsters defined for difficulty '{difficulty}'")
-
-        return random.choice(candidates)
+        return rules.pick_random_monster()
 
     async def log_to_points(self, bot: discord.Client, content: str):
+        if self.points_log is not None:
+            self.points_log.add(content)
+            return
+
         channel_id = int(os.getenv("POINTS_LOG_CHANNEL_ID", 0))
         if not channel_id:
             return
@@ -509,37 +533,43 @@ class WanderingEventManager:
             except Exception:
                 return
 
-        await channel.send(content)
-
+        outbound.send_text(channel, content)
+
+    async def _spawn_random(self, bot, channel_id: int):
+        monster = self.pick_random_monster()
+        await self.spawn(
+            bot=bot,
+            title=monster["title"],
+            description=monster["description"],
+            difficulty=monster["difficulty"],
+            image=monster.get("image"),
+            channel_id=channel_id,
+        )
 
     async def scheduled_spawn_loop(self, bot):
         while True:
             # 🔥 Self-heal: clear expired events
-            if self.active and datetime.now(timezone.utc) >= self.active.ends_at:
-                print("[WANDERING] Auto-clearing expired event in loop")
-                self.active = None
-                save_active_event(None)
+            self._clear_orphans()
 
             # ⏳ Wait until next spawn window
-            delay = seconds_until_next_spawn(SPAWN_HOURS)
-            await asyncio.sleep(delay)
-
-            # 🛑 Don’t stack events
-            if self.active and not self.active.resolved:
-                continue
-
-            # 🐲 Spawn monster
-            monster = self.pick_random_monster()
-            await self.spawn(
-                bot=bot,
-                title=monster["title"],
-                description=monster["description"],
-                difficulty=monster["difficulty"],
-                image=monster.get("image"),
+            delay = seconds_until_next_spawn(self.spawn_hours())
+            await clock.sleep(delay)
+
+            # 🐲 One monster per channel that has no live event (don’t stack);
+            # a failed post in one channel must not end the loop
+            free = [cid for cid in self.channel_ids if not self.event_in(cid)]
+            results = await asyncio.gather(
+                *(self._spawn_random(bot, cid) for cid in free), return_exceptions=True
             )
+            for cid, result in zip(free, results):
+                if isinstance(result, Exception):
+                    print(f"[WANDERING] Scheduled spawn in {cid} failed: {result}")
 
-    def get_next_spawn_time(self) -> datetime:
-        delay = seconds_until_next_spawn(SPAWN_HOURS)
-        return datetime.now(timezone.utc) + timedelta(seconds=delay)
-
+    def spawn_hours(self) -> list[int]:
+        """UTC spawn hours: SPAWN_HOURS, or the history's best-attended ones with auto_hours."""
+        if self.auto_hours and self.history.loaded:
+            return self.history.recommend_hours(SPAWN_HOURS)
+        return SPAWN_HOURS
 
+    def get_next_spawn_time(self) -> datetime:
+        return clock.now() + timedelta(seconds=seconds_until_next_spawn(self.spawn_hours()))
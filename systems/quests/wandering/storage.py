@@ -1,6 +1,5 @@
 import os
 import json
-from typing import Optional
 from datetime import datetime
 
 from .models import WanderingEvent
@@ -8,25 +7,20 @@ from .models import WanderingEvent
 # -------------------------------------------------
 # Base paths (Persistent on Railway)
 # -------------------------------------------------
-DATA_DIR = "/mnt/data"
+DATA_DIR = os.getenv("DATA_DIR", "/mnt/data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
-WANDERING_FILE = os.path.join(DATA_DIR, "wandering_event.json")
+# One file per live event: <event_id>.json
+WANDERING_DIR = os.path.join(DATA_DIR, "wandering")
+os.makedirs(WANDERING_DIR, exist_ok=True)
 
-DEFAULT_WANDERING_STATE = {
-    "active": None
-}
+# Pre-multi-event single-slot file, migrated on first load
+LEGACY_WANDERING_FILE = os.path.join(DATA_DIR, "wandering_event.json")
 
 
 # -------------------------------------------------
 # Helpers
 # -------------------------------------------------
-def _ensure_file_exists():
-    if not os.path.exists(WANDERING_FILE):
-        with open(WANDERING_FILE, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_WANDERING_STATE, f, indent=4)
-
-
 def _dt_to_str(dt: datetime) -> str:
     return dt.isoformat()
 
@@ -35,72 +29,103 @@ def _str_to_dt(s: str) -> datetime:
     return datetime.fromisoformat(s)
 
 
-# -------------------------------------------------
-# Load / Save
-# -------------------------------------------------
-def load_active_event():
-    if not os.path.exists(WANDERING_FILE):
-        return None
+def _event_path(event_id: str) -> str:
+    return os.path.join(WANDERING_DIR, f"{event_id}.json")
+
+
+def event_to_dict(event: WanderingEvent) -> dict:
+    return {
+        "event_id": event.event_id,
+        "channel_id": event.channel_id,
+        "message_id": event.message_id,
+        "ends_at": _dt_to_str(event.ends_at),
+        "duration_minutes": event.duration_minutes,
+        "title": event.title,
+        "description": event.description,
+        "difficulty": event.difficulty,
+        "required_participants": event.required_participants,
+        "faction_reward": event.faction_reward,
+        "global_reward": event.global_reward,
+        "xp_reward": event.xp_reward,
+        "participants": sorted(event.participants),
+        "participating_factions": sorted(event.participating_factions),
+        "resolved": event.resolved,
+        "image": event.image,
+    }
 
-    try:
-        with open(WANDERING_FILE, "r") as f:
-            data = json.load(f)
 
-        # ⛑️ Normalize old / partial schemas
-        return WanderingEvent(
-            event_id=data.get("event_id"),
-            channel_id=data.get("channel_id"),
-            message_id=data.get("message_id"),
-            duration_minutes=data.get("duration_minutes", 0),
-            ends_at=datetime.fromisoformat(data["ends_at"]),
-            title=data.get("title", "Unknown Threat"),
-            description=data.get("description", ""),
-            difficulty=data.get("difficulty", "minor"),
-            required_participants=data.get("required_participants", 1),
-            faction_reward=data.get("faction_reward", 0),
-            global_reward=data.get("global_reward", 0),
-            xp_reward=data.get("xp_reward", 0),
-            participants=set(data.get("participants", [])),
-            participating_factions=set(data.get("participating_factions", [])),
-            resolved=data.get("resolved", False),
-            image=data.get("image"),
-        )
+def event_from_dict(data: dict) -> WanderingEvent:
+    # ⛑️ Normalize old / partial schemas
+    return WanderingEvent(
+        event_id=data.get("event_id"),
+        channel_id=data.get("channel_id"),
+        message_id=data.get("message_id"),
+        duration_minutes=data.get("duration_minutes", 0),
+        ends_at=_str_to_dt(data["ends_at"]),
+        title=data.get("title", "Unknown Threat"),
+        description=data.get("description", ""),
+        difficulty=data.get("difficulty", "minor"),
+        required_participants=data.get("required_participants", 1),
+        faction_reward=data.get("faction_reward", 0),
+        global_reward=data.get("global_reward", 0),
+        xp_reward=data.get("xp_reward", 0),
+        participants=set(data.get("participants", [])),
+        participating_factions=set(data.get("participating_factions", [])),
+        resolved=data.get("resolved", False),
+        image=data.get("image"),
+    )
 
-    except Exception as e:
-        # 🚨 Corrupt or incompatible save → self-heal
-        print(f"[WANDERING] Failed to load active event, clearing: {e}")
-        save_active_event(None)
-        return None
 
+# -------------------------------------------------
+# Load / Save (per event)
+# -------------------------------------------------
+def save_event(event: WanderingEvent) -> None:
+    """Rewrite just this event's file (tmp + rename)."""
+    path = _event_path(event.event_id)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(event_to_dict(event), f, indent=4)
+    os.replace(tmp, path)
 
 
+def delete_event(event_id: str) -> None:
+    try:
+        os.remove(_event_path(event_id))
+    except FileNotFoundError:
+        pass
 
-def save_active_event(event: Optional[WanderingEvent]) -> None:
-    _ensure_file_exists()
 
-    if event is None:
-        with open(WANDERING_FILE, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_WANDERING_STATE, f, indent=4)
+def _migrate_legacy_file():
+    if not os.path.exists(LEGACY_WANDERING_FILE):
         return
-
-    data = {
-        "active": {
-            "event_id": event.event_id,
-            "channel_id": event.channel_id,
-            "message_id": event.message_id,
-            "ends_at": _dt_to_str(event.ends_at),
-            "title": event.title,
-            "description": event.description,
-            "difficulty": event.difficulty,
-            "required_participants": event.required_participants,
-            "faction_reward": event.faction_reward,
-            "global_reward": event.global_reward,
-            "participants": list(event.participants),
-            "participating_factions": list(event.participating_factions),
-            "resolved": event.resolved,
-            "image": event.image,
-        }
-    }
-
-    with open(WANDERING_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    try:
+        with open(LEGACY_WANDERING_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Saved nested under "active"; very old files kept the fields at the top level
+        data = data.get("active", data) if isinstance(data, dict) else None
+        if data and data.get("event_id") and data.get("ends_at"):
+            save_event(event_from_dict(data))
+            print(f"[WANDERING] Migrated active event {data['event_id']} to {WANDERING_DIR}")
+    except Exception as e:
+        print(f"[WANDERING] Could not migrate {LEGACY_WANDERING_FILE}: {e}")
+    os.remove(LEGACY_WANDERING_FILE)
+
+
+def load_events() -> dict[str, WanderingEvent]:
+    """Every persisted event, keyed by event_id."""
+    _migrate_legacy_file()
+
+    events = {}
+    for name in os.listdir(WANDERING_DIR):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(WANDERING_DIR, name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                event = event_from_dict(json.load(f))
+            events[event.event_id] = event
+        except Exception as e:
+            # 🚨 Corrupt or incompatible save → self-heal
+            print(f"[WANDERING] Failed to load {name}, removing: {e}")
+            os.remove(path)
+    return events
@@ -3,12 +3,14 @@ import discord
 
 
 class WanderingEventView(discord.ui.View):
-    def __init__(self, manager, event_id: str):
+    # Registered once as a persistent view (event_id=None): the event is
+    # then looked up from the message that was clicked
+    def __init__(self, manager, event_id: str | None = None):
         super().__init__(timeout=None)
         self.manager = manager
         self.event_id = event_id
 
-    @discord.ui.button(label="⚔️ Join the Hunt", style=discord.ButtonStyle.danger)
+    @discord.ui.button(label="⚔️ Join the Hunt", style=discord.ButtonStyle.danger, custom_id="wandering:join")
     async def join(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.manager.handle_participation(interaction, self.event_id)
 
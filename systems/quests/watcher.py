@@ -0,0 +1,70 @@
+import asyncio
+import os
+
+from systems import clock
+from . import storage
+
+DEFAULT_POLL_SECONDS = 5
+
+
+def _stamp(path: str):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class DataFileWatcher:
+    """
+    Polls quests.json / npcs.json and applies hand edits without a restart.
+
+    Files are parsed off the event loop; the diff is applied on it, so the
+    in-memory maps never change under a running handler. A file caught
+    mid-write fails to parse and is retried on the next tick. Changes made
+    by the import commands show up as empty diffs.
+    """
+
+    def __init__(self, quest_manager, poll_seconds: float = DEFAULT_POLL_SECONDS):
+        self.quest_manager = quest_manager
+        self.poll_seconds = poll_seconds
+        self.sources = {
+            storage.QUESTS_FILE: (storage.load_templates, quest_manager.apply_templates),
+            storage.NPCS_FILE: (storage.load_npcs, quest_manager.apply_npcs),
+        }
+        # Baseline at start — the data was just loaded
+        self._stamps = {path: _stamp(path) for path in self.sources}
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="data-file-watcher")
+
+    async def check(self) -> list:
+        """Reload whatever changed since the last check. Returns the non-empty diffs."""
+        diffs = []
+        for path, (load, apply) in self.sources.items():
+            stamp = _stamp(path)
+            if stamp is None or stamp == self._stamps.get(path):
+                continue
+
+            try:
+                loaded = await asyncio.to_thread(load)
+            except Exception as e:
+                print(f"[WATCH] {os.path.basename(path)} not reloaded: {e}")
+                continue
+
+            self._stamps[path] = stamp
+            diff = apply(loaded)
+            if not diff.empty:
+                print(f"[WATCH] {os.path.basename(path)} reloaded: {diff.summary()}")
+                diffs.append(diff)
+        return diffs
+
+    async def _run(self):
+        while True:
+            await clock.sleep(self.poll_seconds)
+            try:
+                await self.check()
+            except Exception as e:
+                print(f"[WATCH] Check failed: {e}")
@@ -0,0 +1,107 @@
+from bisect import bisect_right
+from typing import Callable
+
+DEFAULT_CURVE = "standard"
+# Levels precomputed up front; the table grows on demand past this
+PRECOMPUTED_LEVELS = 200
+
+
+class XPCurve:
+    """
+    Leveling curve as a cumulative threshold table.
+
+    thresholds[i] is the total XP needed to *reach* level i + 1, so
+    thresholds[0] == 0 (level 1) and level_for(total) is a bisect.
+    """
+
+    def __init__(self, name: str, step: Callable[[int], int], levels: int = PRECOMPUTED_LEVELS):
+        self.name = name
+        # XP needed to go from `level` to `level + 1`
+        self.step = step
+        self.thresholds: list[int] = [0]
+        self._extend_to_level(levels)
+
+    def _extend_to_level(self, level: int):
+        while len(self.thresholds) < level:
+            current = len(self.thresholds)
+            self.thresholds.append(self.thresholds[-1] + max(1, self.step(current)))
+
+    def _extend_to_xp(self, total_xp: int):
+        while self.thresholds[-1] <= total_xp:
+            self._extend_to_level(len(self.thresholds) * 2)
+
+    def level_for(self, total_xp: int) -> int:
+        total_xp = max(0, int(total_xp))
+        self._extend_to_xp(total_xp)
+        return bisect_right(self.thresholds, total_xp)
+
+    def threshold(self, level: int) -> int:
+        """Total XP at which `level` starts."""
+        self._extend_to_level(level + 1)
+        return self.thresholds[level - 1]
+
+    def xp_to_next(self, level: int) -> int:
+        """XP span of `level` (what the profile shows as the bar's max)."""
+        self._extend_to_level(level + 1)
+        return self.thresholds[level] - self.thresholds[level - 1]
+
+    def split(self, total_xp: int) -> tuple[int, int]:
+        """total XP → (level, xp into that level)."""
+        level = self.level_for(total_xp)
+        return level, max(0, int(total_xp)) - self.thresholds[level - 1]
+
+    def total_for(self, level: int, xp: int) -> int:
+        """(level, xp into level) → total XP. Used to migrate stored pairs."""
+        return self.threshold(max(1, int(level))) + max(0, int(xp))
+
+
+# =================================================
+# ==============  NAMED CURVES  ===================
+# =================================================
+
+CURVES: dict[str, XPCurve] = {
+    # The original add_xp loop: 100 XP for level 1→2, +50 per level after
+    "standard": XPCurve("standard", lambda level: 100 + (level - 1) * 50),
+    # Short seasons — levels come faster
+    "gentle": XPCurve("gentle", lambda level: 100 + (level - 1) * 25),
+    # Long seasons — steeper late game
+    "steep": XPCurve("steep", lambda level: 100 + (level - 1) * 75),
+    # Every level costs the same
+    "flat": XPCurve("flat", lambda level: 150),
+}
+
+_active = CURVES[DEFAULT_CURVE]
+
+
+def get_curve(name: str | None = None) -> XPCurve:
+    """Named curve, or the active one. Unknown names fall back to the default."""
+    if name is None:
+        return _active
+    return CURVES.get(name, CURVES[DEFAULT_CURVE])
+
+
+def set_active_curve(name: str | None) -> XPCurve:
+    """Select the season's curve (from QuestBoard.xp_curve)."""
+    global _active
+    if name and name not in CURVES:
+        print(f"[XP] Unknown curve '{name}', using '{DEFAULT_CURVE}'")
+    _active = get_curve(name or DEFAULT_CURVE)
+    return _active
+
+
+# =================================================
+# ===============  MIGRATION  =====================
+# =================================================
+
+def migrate_xp_fields(data: dict) -> dict:
+    """
+    Convert a stored (level, xp-into-level) pair into total-XP form.
+    Old profiles were written by the original add_xp loop, i.e. the
+    "standard" curve, regardless of which curve is active now.
+    """
+    if "total_xp" in data:
+        return data
+
+    migrated = dict(data)
+    migrated["total_xp"] = CURVES[DEFAULT_CURVE].total_for(data.get("level", 1), data.get("xp", 0))
+    return migrated
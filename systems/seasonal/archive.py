@@ -0,0 +1,217 @@
+import copy
+import gzip
+import json
+import os
+import re
+
+from systems import clock
+from .storage import DATA_DIR
+
+ARCHIVE_DIR = os.path.join(DATA_DIR, "season_archive")
+ARCHIVE_INDEX_FILE = os.path.join(ARCHIVE_DIR, "index.json")
+ARCHIVE_VERSION = 1
+
+# Per-player columns stored in each snapshot
+PLAYER_COLUMNS = ["user_id", "faction_id", "season_completed", "monsters_season", "level"]
+# Metrics the index keeps a leaderboard for (so top-N queries skip the archive)
+RANKED_METRICS = ["season_completed", "monsters_season"]
+INDEX_TOP_N = 10
+
+# Boss / seasonal-event fields worth keeping after the event is wiped
+BOSS_FIELDS = [
+    "active", "day", "max_days", "started_on", "ended_reason", "difficulty",
+    "boss_type", "boss", "faction_health", "alive_factions", "faction_powers",
+    "last_net_damage", "last_retaliation", "last_retaliation_target",
+]
+
+
+def _safe_name(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text)[:80] or "season"
+
+
+def _atomic_write(path: str, write):
+    tmp = path + ".tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+# =================================================
+# ================  INDEX  ========================
+# =================================================
+
+def load_index() -> dict:
+    """{archive_key: summary} in archive order."""
+    if not os.path.exists(ARCHIVE_INDEX_FILE):
+        return {}
+    try:
+        with open(ARCHIVE_INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[ARCHIVE] Could not read index: {e}")
+        return {}
+
+
+def _save_index(index: dict):
+    def _write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=4)
+    _atomic_write(ARCHIVE_INDEX_FILE, _write)
+
+
+def keys_for_season(season_id: str, index: dict | None = None) -> list[str]:
+    index = load_index() if index is None else index
+    return [k for k, entry in index.items() if entry["season_id"] == season_id]
+
+
+# =================================================
+# ==============  SNAPSHOT / LOAD  ================
+# =================================================
+
+def build_snapshot(quest_manager, season_state: dict, reason: str) -> dict:
+    """
+    Plain copies of everything archived. Run it on the event loop — the
+    live dicts it reads are mutated there — and hand the result to
+    write_archive() in a thread.
+    """
+    board = quest_manager.quest_board
+
+    # Columnar: one array per field, only players with seasonal activity
+    columns = {name: [] for name in PLAYER_COLUMNS}
+    for uid, player in quest_manager.players.items():
+        if not player.season_completed and not player.monsters_season:
+            continue
+        columns["user_id"].append(uid)
+        columns["faction_id"].append(player.faction_id)
+        columns["season_completed"].append(player.season_completed)
+        columns["monsters_season"].append(player.monsters_season)
+        columns["level"].append(player.level)
+
+    return {
+        "version": ARCHIVE_VERSION,
+        "season_id": board.season_id,
+        "epoch": board.season_epoch,
+        "archived_at": clock.now().isoformat(),
+        "reason": reason,
+        "board": {
+            "global_points": board.global_points,
+            "faction_points": dict(board.faction_points),
+            "season_goal": board.season_goal,
+            "faction_goal": board.faction_goal,
+            "season_reward": board.season_reward,
+            "xp_curve": board.xp_curve,
+        },
+        "players": columns,
+        "boss": {
+            k: sorted(season_state[k]) if isinstance(season_state[k], set) else copy.deepcopy(season_state[k])
+            for k in BOSS_FIELDS if k in season_state
+        },
+    }
+
+
+def _summarize(snapshot: dict, filename: str) -> dict:
+    cols = snapshot["players"]
+    rows = len(cols["user_id"])
+
+    top = {}
+    for metric in RANKED_METRICS:
+        order = sorted(range(rows), key=lambda i: cols[metric][i], reverse=True)[:INDEX_TOP_N]
+        top[metric] = [[cols["user_id"][i], cols[metric][i]] for i in order if cols[metric][i] > 0]
+
+    boss = snapshot["boss"]
+    return {
+        "season_id": snapshot["season_id"],
+        "epoch": snapshot["epoch"],
+        "archived_at": snapshot["archived_at"],
+        "reason": snapshot["reason"],
+        "file": filename,
+        "players": rows,
+        "global_points": snapshot["board"]["global_points"],
+        "faction_points": snapshot["board"]["faction_points"],
+        "season_completed": sum(cols["season_completed"]),
+        "monsters_season": sum(cols["monsters_season"]),
+        "boss": (boss.get("boss") or {}).get("name"),
+        "boss_outcome": boss.get("ended_reason") or ("in progress" if boss.get("active") else None),
+        "top": top,
+    }
+
+
+def archive_season(quest_manager, season_state: dict, reason: str) -> dict:
+    """
+    Snapshot the current season (board, faction totals, per-player seasonal
+    counters, boss outcome) before it is reset. Returns the index entry.
+    """
+    return write_archive(build_snapshot(quest_manager, season_state, reason))
+
+
+def write_archive(snapshot: dict) -> dict:
+    """Compress + store a build_snapshot() result and index it. Safe to run in a thread."""
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+
+    index = load_index()
+    base = f"{_safe_name(snapshot['season_id'])}@{snapshot['epoch']}"
+    key, n = base, 1
+    while key in index:
+        n += 1
+        key = f"{base}.{n}"
+    filename = f"{key}.json.gz"
+
+    def _write(tmp):
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=9) as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+    _atomic_write(os.path.join(ARCHIVE_DIR, filename), _write)
+
+    index[key] = _summarize(snapshot, filename)
+    _save_index(index)
+
+    print(f"[ARCHIVE] Archived season '{snapshot['season_id']}' as {key} ({index[key]['players']} players)")
+    return index[key]
+
+
+def load_archive(key: str) -> dict | None:
+    entry = load_index().get(key)
+    if not entry:
+        return None
+    with gzip.open(os.path.join(ARCHIVE_DIR, entry["file"]), "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# =================================================
+# ================  QUERIES  ======================
+# =================================================
+
+def top_players(season_id: str, metric: str = "season_completed", limit: int = 10) -> list[tuple[int, int]]:
+    """
+    [(user_id, value)] for the latest archive of `season_id`.
+    Served from the index when it holds enough rows; otherwise reads one archive.
+    """
+    if metric not in RANKED_METRICS:
+        raise ValueError(f"Unknown metric: {metric}")
+
+    index = load_index()
+    keys = keys_for_season(season_id, index)
+    if not keys:
+        return []
+    key = keys[-1]
+    entry = index[key]
+
+    if limit <= INDEX_TOP_N or entry["players"] <= INDEX_TOP_N:
+        return [tuple(row) for row in entry["top"][metric][:limit]]
+
+    snapshot = load_archive(key)
+    cols = snapshot["players"]
+    rows = sorted(zip(cols["user_id"], cols[metric]), key=lambda r: r[1], reverse=True)
+    return [r for r in rows[:limit] if r[1] > 0]
+
+
+def faction_totals() -> list[dict]:
+    """Per-archive faction totals across all seasons (index only)."""
+    return [
+        {
+            "key": key,
+            "season_id": entry["season_id"],
+            "archived_at": entry["archived_at"],
+            "global_points": entry["global_points"],
+            "faction_points": entry["faction_points"],
+        }
+        for key, entry in load_index().items()
+    ]
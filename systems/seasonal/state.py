@@ -1,4 +1,4 @@
-from datetime import date
+from systems import clock
 from .storage import load_season, save_season
 
 # ========= Seasonal Combat Constants =========
@@ -66,7 +66,7 @@ def reset_votes_for_new_day(state: dict, force: bool = False):
     - Normal mode: once per UTC day
     - force=True: always reset (admin/manual resolve)
     """
-    today = str(date.today())
+    today = str(clock.today())
 
     if not force and state.get("date") == today:
         return
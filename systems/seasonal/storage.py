@@ -1,11 +1,15 @@
 import os
 import json
 
-DATA_DIR = "/mnt/data"
+DATA_DIR = os.getenv("DATA_DIR", "/mnt/data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
 SEASON_FILE = os.path.join(DATA_DIR, "seasonal_event.json")
 
+# Raw file text keyed by (mtime_ns, size) — the season file is read from
+# many places per interaction, this skips the disk read when unchanged.
+_season_cache = {"key": None, "text": None}
+
 DEFAULT_SEASON_STATE = {
     "active": False,
     "day": 1,
@@ -59,14 +63,28 @@ DEFAULT_SEASON_STATE = {
 
 
 
+def _file_key():
+    st = os.stat(SEASON_FILE)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_season_text() -> str:
+    key = _file_key()
+    if _season_cache["key"] != key:
+        with open(SEASON_FILE, "r", encoding="utf-8") as f:
+            _season_cache["text"] = f.read()
+        _season_cache["key"] = key
+    return _season_cache["text"]
+
+
 def load_season():
     if not os.path.exists(SEASON_FILE):
         # 🔹 First run: create the file
         with open(SEASON_FILE, "w", encoding="utf-8") as f:
             json.dump(DEFAULT_SEASON_STATE, f, indent=4)
 
-    with open(SEASON_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # Parse fresh every time so callers can mutate their copy freely
+    data = json.loads(_read_season_text())
             # -----------------------------
     # 🔧 Auto-migrate missing keys
     # -----------------------------
@@ -110,5 +128,9 @@ def save_season(state: dict):
         for faction, actions in state["votes"].items()
     }
 
+    text = json.dumps(serializable, indent=4)
     with open(SEASON_FILE, "w", encoding="utf-8") as f:
-        json.dump(serializable, f, indent=4)
+        f.write(text)
+
+    _season_cache["text"] = text
+    _season_cache["key"] = _file_key()
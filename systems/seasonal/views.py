@@ -1,8 +1,17 @@
 import discord
 from systems.seasonal.state import get_season_state
 from systems.quests.factions import FACTIONS
-from systems.seasonal.state import register_vote
-from systems.quests.factions import get_member_faction_id
+from systems.engine import season as season_rules
+from systems.outbound.anchors import anchors
+
+VOTE_ERROR_MESSAGES = {
+    season_rules.VOTE_INACTIVE: "⚠️ This seasonal event has ended.",
+    season_rules.VOTE_NO_FACTION: "❌ You must belong to a faction to participate.",
+    season_rules.VOTE_FACTION_DEFEATED: "💀 Your faction was defeated in a previous battle and cannot act.",
+    season_rules.VOTE_POWER_LOCKED: "❌ Your faction has not unlocked its power yet.",
+    season_rules.VOTE_POWER_USED: "❌ Your faction’s power has already been used this season.",
+    season_rules.VOTE_INVALID: "❌ Could not register your vote.",
+}
 
 
 def build_seasonal_embed():
@@ -180,84 +189,38 @@ class SeasonalVoteView(discord.ui.View):
         super().__init__(timeout=None)
 
 
-    async def _handle_vote(self, interaction: discord.Interaction, action: str):    
-        state = get_season_state()
-
-        if not state.get("active"):
-            return await interaction.response.send_message(
-                "⚠️ This seasonal event has ended.",
-                ephemeral=True,
-            )
-        
-        faction = get_member_faction_id(interaction.user)
-
-        alive = state.get("alive_factions", set())
-
-        if faction not in alive:
-            return await interaction.response.send_message(
-                "💀 Your faction was defeated in a previous battle and cannot act.",
-                ephemeral=True,
-            )
-
-        if not faction:
-            return await interaction.response.send_message(
-                "❌ You must belong to a faction to participate.",
-                ephemeral=True,
-            )
-
-        state = get_season_state()
-
-        # ❌ Block power vote if not allowed
-        if action == "power":
-            fp = state["faction_powers"].get(faction)
-
-            if not fp or not fp.get("unlocked"):
-                return await interaction.response.send_message(
-                    "❌ Your faction has not unlocked its power yet.",
-                    ephemeral=True,
-                )
-
-            if fp.get("used"):
-                return await interaction.response.send_message(
-                    "❌ Your faction’s power has already been used this season.",
-                    ephemeral=True,
-                )
-
-        success = register_vote(
-            state,
-            interaction.user.id,
-            faction,
-            action,
-        )
-
+    async def _handle_vote(self, interaction: discord.Interaction, action: str):
+        role_ids = [role.id for role in getattr(interaction.user, "roles", [])]
+        outcome = season_rules.cast_vote(interaction.user.id, role_ids, action)
 
-        if not success:
+        if outcome != season_rules.VOTE_OK:
             return await interaction.response.send_message(
-                "❌ Could not register your vote.",
+                VOTE_ERROR_MESSAGES[outcome],
                 ephemeral=True,
             )
 
-        # Update the embed in-place
-        await interaction.message.edit(embed=build_seasonal_embed(), view=self)
+        # Update the embed in-place; a vote burst collapses into one edit
+        # Coalesced, and skipped when the rendered embed comes out identical
+        anchors.edit_soon("seasonal", embed=build_seasonal_embed, view=self)
 
         await interaction.response.send_message(
             f"🗳️ Vote recorded: **{action.title()}**",
             ephemeral=True,
         )
 
-    @discord.ui.button(label="⚔️ Attack", style=discord.ButtonStyle.danger)
+    @discord.ui.button(label="⚔️ Attack", custom_id="seasonal:attack", style=discord.ButtonStyle.danger)
     async def attack(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_vote(interaction, "attack")
 
-    @discord.ui.button(label="🛡️ Defend", style=discord.ButtonStyle.primary)
+    @discord.ui.button(label="🛡️ Defend", custom_id="seasonal:defend", style=discord.ButtonStyle.primary)
     async def defend(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_vote(interaction, "defend")
 
-    @discord.ui.button(label="💚 Heal", style=discord.ButtonStyle.success)
+    @discord.ui.button(label="💚 Heal", custom_id="seasonal:heal", style=discord.ButtonStyle.success)
     async def heal(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_vote(interaction, "heal")
 
-    @discord.ui.button(label="⚡ Power", style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label="⚡ Power", custom_id="seasonal:power", style=discord.ButtonStyle.secondary)
     async def power(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_vote(interaction, "power")
 
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from systems.quests.storage import DATA_DIR
+
+COMMAND_SYNC_FILE = os.path.join(DATA_DIR, "command_sync.json")
+
+
+# =================================================
+# ============  PER-PHASE STARTUP TIMING  =========
+# =================================================
+
+class StartupTimer:
+    """Collects wall-clock time per startup phase."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.phases.append((name, self._last - t0))
+
+    def lap(self, name: str):
+        """Record time spent since the previous phase ended (e.g. waiting on the gateway)."""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def report(self) -> str:
+        total = time.perf_counter() - self.started
+        lines = ["[STARTUP] Timing breakdown:"]
+        for name, seconds in self.phases:
+            lines.append(f"[STARTUP]   {name:<28} {seconds * 1000:8.1f} ms")
+        lines.append(f"[STARTUP]   {'total':<28} {total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# =================================================
+# ============  COMMAND TREE SYNC HASH  ===========
+# =================================================
+
+def command_tree_hash(tree, guild) -> str:
+    """Stable hash of the app command payloads registered for `guild`."""
+    payload = []
+    for cmd in tree.get_commands(guild=guild):
+        try:
+            payload.append(cmd.to_dict(tree))
+        except TypeError:
+            # Older discord.py: to_dict() takes no tree
+            payload.append(cmd.to_dict())
+
+    payload.sort(key=lambda c: (c.get("type", 1), c.get("name", "")))
+    raw = json.dumps({"guild": guild.id, "commands": payload}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _load_sync_hashes() -> dict:
+    if not os.path.exists(COMMAND_SYNC_FILE):
+        return {}
+    try:
+        with open(COMMAND_SYNC_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def command_sync_needed(guild_id: int, digest: str) -> bool:
+    if os.getenv("FORCE_COMMAND_SYNC"):
+        return True
+    return _load_sync_hashes().get(str(guild_id)) != digest
+
+
+def remember_command_sync(guild_id: int, digest: str) -> None:
+    hashes = _load_sync_hashes()
+    hashes[str(guild_id)] = digest
+    with open(COMMAND_SYNC_FILE, "w", encoding="utf-8") as f:
+        json.dump(hashes, f, indent=4)
@@ -0,0 +1,12 @@
+from .timeseries import (
+    NEW_PLAYER,
+    QUEST_COMPLETED,
+    VOTE,
+    WANDERING_CLEAR,
+    WANDERING_FAIL,
+    WANDERING_JOIN,
+    ActivityStats,
+    activity,
+    series_key,
+    split_series,
+)
@@ -0,0 +1,88 @@
+from collections import Counter
+from datetime import date
+
+from systems.quests.factions import FACTIONS
+
+from .timeseries import (
+    NEW_PLAYER,
+    QUEST_COMPLETED,
+    VOTE,
+    WANDERING_CLEAR,
+    WANDERING_FAIL,
+    WANDERING_JOIN,
+    split_series,
+)
+
+
+def _by_key(counts: Counter, metric: str) -> Counter:
+    """{key: count} for one metric (unkeyed series count under None)."""
+    out = Counter()
+    for series, n in counts.items():
+        m, key = split_series(series)
+        if m == metric:
+            out[key] += n
+    return out
+
+
+def _faction_name(faction_id: str) -> str:
+    faction = FACTIONS.get(faction_id)
+    return f"{faction.emoji} {faction.name}" if faction else faction_id
+
+
+def summary_lines(counts: Counter) -> list[str]:
+    """Bullet lines shared by /stats and the daily report."""
+    quests = _by_key(counts, QUEST_COMPLETED)
+    quest_total = sum(quests.values())
+    quest_line = f"• Quests Completed: **{quest_total}**"
+    if quest_total:
+        quest_line += " (" + ", ".join(
+            f"{(qtype or 'unknown').title()} {n}" for qtype, n in quests.most_common()
+        ) + ")"
+
+    votes = _by_key(counts, VOTE)
+    vote_total = sum(votes.values())
+    lines = [quest_line, f"• Boss Votes: **{vote_total}**"]
+
+    per_faction: dict[str, Counter] = {}
+    for key, n in votes.items():
+        faction_id, _, action = (key or "").partition(".")
+        per_faction.setdefault(faction_id, Counter())[action] += n
+    for faction_id, actions in sorted(per_faction.items()):
+        detail = ", ".join(f"{action} {n}" for action, n in actions.most_common())
+        lines.append(f"  ◦ {_faction_name(faction_id)}: {sum(actions.values())} ({detail})")
+
+    lines.append(
+        f"• Wandering Threats: **{counts.get(WANDERING_JOIN, 0)}** joins, "
+        f"**{counts.get(WANDERING_CLEAR, 0)}** cleared, "
+        f"**{counts.get(WANDERING_FAIL, 0)}** failed"
+    )
+    lines.append(f"• New Players: **{counts.get(NEW_PLAYER, 0)}**")
+    return lines
+
+
+def format_daily_report(day: date, counts: Counter) -> str:
+    return (
+        f"📊 **Daily Activity Report**\n"
+        f"• Date (UTC): {day}\n"
+        + "\n".join(summary_lines(counts))
+    )
+
+
+def history_line(day: date, counts: Counter) -> str:
+    """One compact line per day for /stats."""
+    quests = sum(_by_key(counts, QUEST_COMPLETED).values())
+    votes = sum(_by_key(counts, VOTE).values())
+    return (
+        f"`{day}` — {quests} quests, {votes} votes, "
+        f"{counts.get(WANDERING_CLEAR, 0)} threats cleared, {counts.get(NEW_PLAYER, 0)} new players"
+    )
+
+
+def quest_sparkline(hours: list[tuple[object, Counter]]) -> str:
+    """Per-hour quest completions as a block sparkline, oldest → newest."""
+    blocks = "▁▂▃▄▅▆▇█"
+    values = [sum(_by_key(counts, QUEST_COMPLETED).values()) for _, counts in hours]
+    peak = max(values, default=0)
+    if not peak:
+        return blocks[0] * len(values)
+    return "".join(blocks[round(v / peak * (len(blocks) - 1))] for v in values)
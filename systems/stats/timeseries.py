@@ -0,0 +1,276 @@
+import asyncio
+import json
+import os
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+from systems import clock
+
+DATA_DIR = os.getenv("DATA_DIR", "/mnt/data")
+os.makedirs(DATA_DIR, exist_ok=True)
+
+STATS_FILE = os.path.join(DATA_DIR, "activity_stats.json")
+
+# Live per-minute buckets; older minutes only exist in the rollups
+RING_MINUTES = 60
+HOURLY_RETENTION_HOURS = 14 * 24
+DAILY_RETENTION_DAYS = 400
+DEFAULT_SAVE_SECONDS = 60
+
+# Metric names (series are "<metric>" or "<metric>:<key>")
+QUEST_COMPLETED = "quest"            # key: quest type
+VOTE = "vote"                        # key: "<faction>.<action>"
+WANDERING_JOIN = "wandering_join"
+WANDERING_CLEAR = "wandering_clear"
+WANDERING_FAIL = "wandering_fail"
+NEW_PLAYER = "new_player"
+
+
+def series_key(metric: str, key: str | None = None) -> str:
+    return f"{metric}:{key}" if key else metric
+
+
+def split_series(series: str) -> tuple[str, str | None]:
+    metric, _, key = series.partition(":")
+    return metric, key or None
+
+
+def _minute_id(ts: datetime) -> int:
+    return int(ts.timestamp() // 60)
+
+
+def _day_of_hour(hour_id: int) -> str:
+    return datetime.fromtimestamp(hour_id * 3600, tz=timezone.utc).date().isoformat()
+
+
+def _day_of_minute(minute_id: int) -> str:
+    return _day_of_hour(minute_id // 60)
+
+
+class ActivityStats:
+    """
+    Counters for guild activity, kept at three resolutions:
+
+    - a fixed ring of RING_MINUTES per-minute buckets (what /stats shows as
+      "last hour"),
+    - hourly rollups, folded from the ring as minutes close,
+    - daily rollups, folded from the hourly table as hours close.
+
+    record() is O(1) and never touches disk; the background saver writes
+    the ring and both rollups every `save_seconds` when something changed.
+    All times are UTC (via systems.clock).
+    """
+
+    def __init__(
+        self,
+        path: str = STATS_FILE,
+        ring_minutes: int = RING_MINUTES,
+        save_seconds: float = DEFAULT_SAVE_SECONDS,
+    ):
+        self.path = path
+        self.ring_minutes = ring_minutes
+        self.save_seconds = save_seconds
+
+        # ring[minute_id % ring_minutes] = [minute_id, Counter]
+        self.ring: list[list] = [[None, Counter()] for _ in range(ring_minutes)]
+        self.hourly: dict[int, Counter] = {}
+        self.daily: dict[str, Counter] = {}
+        # Everything up to and including these has been folded upward
+        self.folded_minute: int | None = None
+        self.folded_hour: int | None = None
+        self.last_reported: str | None = None
+
+        self.dirty = False
+        self._task: asyncio.Task | None = None
+        self.load()
+
+    # ---------- Recording ----------
+    def record(self, metric: str, key: str | None = None, n: int = 1):
+        minute = _minute_id(clock.now())
+        slot = self.ring[minute % self.ring_minutes]
+
+        if slot[0] != minute:
+            # Slot still holds an unfolded minute from a full ring ago
+            if slot[0] is not None and (self.folded_minute is None or slot[0] > self.folded_minute):
+                self._fold_minute(slot[0], slot[1])
+            slot[0], slot[1] = minute, Counter()
+
+        slot[1][series_key(metric, key)] += n
+        self.dirty = True
+
+    # ---------- Rollups ----------
+    def roll(self, now: datetime | None = None):
+        """Fold closed minutes into hours and closed hours into days."""
+        now = now or clock.now()
+        minute = _minute_id(now)
+        hour = minute // 60
+
+        for minute_id, counts in self.ring:
+            if minute_id is None or minute_id >= minute:
+                continue
+            if self.folded_minute is not None and minute_id <= self.folded_minute:
+                continue
+            self._fold_minute(minute_id, counts)
+        if self.folded_minute is None or self.folded_minute < minute - 1:
+            self.folded_minute = minute - 1
+
+        for hour_id in sorted(self.hourly):
+            if hour_id >= hour:
+                break
+            if self.folded_hour is not None and hour_id <= self.folded_hour:
+                continue
+            self.daily.setdefault(_day_of_hour(hour_id), Counter()).update(self.hourly[hour_id])
+            self.dirty = True
+        if self.folded_hour is None or self.folded_hour < hour - 1:
+            self.folded_hour = hour - 1
+
+        self._prune(hour, now.date())
+
+    def _fold_minute(self, minute_id: int, counts: Counter):
+        if counts:
+            self.hourly.setdefault(minute_id // 60, Counter()).update(counts)
+            self.dirty = True
+
+    def _prune(self, hour: int, today: date):
+        for hour_id in [h for h in self.hourly if h < hour - HOURLY_RETENTION_HOURS]:
+            del self.hourly[hour_id]
+            self.dirty = True
+
+        cutoff = (today - timedelta(days=DAILY_RETENTION_DAYS)).isoformat()
+        for day in [d for d in self.daily if d < cutoff]:
+            del self.daily[day]
+            self.dirty = True
+
+    # ---------- Queries ----------
+    def recent(self, minutes: int = RING_MINUTES) -> Counter:
+        """Totals over the last `minutes` (at most the ring size), from the ring."""
+        current = _minute_id(clock.now())
+        start = current - min(minutes, self.ring_minutes) + 1
+
+        totals = Counter()
+        for minute_id, counts in self.ring:
+            if minute_id is not None and start <= minute_id <= current:
+                totals.update(counts)
+        return totals
+
+    def day_totals(self, day: date) -> Counter:
+        """Totals for one UTC day: closed hours from the daily rollup, the rest live."""
+        day_key = day.isoformat()
+        totals = Counter(self.daily.get(day_key, {}))
+
+        for hour_id, counts in self.hourly.items():
+            if self.folded_hour is not None and hour_id <= self.folded_hour:
+                continue
+            if _day_of_hour(hour_id) == day_key:
+                totals.update(counts)
+
+        for minute_id, counts in self.ring:
+            if minute_id is None:
+                continue
+            if self.folded_minute is not None and minute_id <= self.folded_minute:
+                continue
+            if _day_of_minute(minute_id) == day_key:
+                totals.update(counts)
+        return totals
+
+    def hour_totals(self, hours: int = 24) -> list[tuple[datetime, Counter]]:
+        """[(hour start, totals)] for the last `hours` hours, oldest first."""
+        self.roll()
+        minute = _minute_id(clock.now())
+        current = minute // 60
+        # After roll() only the current minute is still unfolded
+        slot_minute, slot_counts = self.ring[minute % self.ring_minutes]
+        live = slot_counts if slot_minute == minute else {}
+
+        out = []
+        for hour_id in range(current - hours + 1, current + 1):
+            counts = Counter(self.hourly.get(hour_id, {}))
+            if hour_id == current:
+                counts.update(live)
+            out.append((datetime.fromtimestamp(hour_id * 3600, tz=timezone.utc), counts))
+        return out
+
+    # ---------- Daily reports ----------
+    def unreported_days(self, today: date, limit: int = 7) -> list[date]:
+        """
+        Closed days since the last report, oldest first (newest `limit` only,
+        so a long outage doesn't flood the log). Quiet days are included.
+        """
+        self.roll()
+        yesterday = today - timedelta(days=1)
+        if self.last_reported:
+            first = date.fromisoformat(self.last_reported) + timedelta(days=1)
+        elif self.daily:
+            first = date.fromisoformat(min(self.daily))
+        else:
+            first = yesterday
+
+        first = max(first, yesterday - timedelta(days=limit - 1))
+        return [first + timedelta(days=i) for i in range((yesterday - first).days + 1)]
+
+    def mark_reported(self, day: date):
+        if self.last_reported is None or day.isoformat() > self.last_reported:
+            self.last_reported = day.isoformat()
+            self.dirty = True
+
+    # ---------- Persistence ----------
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[STATS] Could not read {self.path}: {e}")
+            return
+
+        self.hourly = {int(h): Counter(c) for h, c in data.get("hourly", {}).items()}
+        self.daily = {d: Counter(c) for d, c in data.get("daily", {}).items()}
+        self.folded_minute = data.get("folded_minute")
+        self.folded_hour = data.get("folded_hour")
+        self.last_reported = data.get("last_reported")
+
+        for minute_id, counts in data.get("ring", []):
+            self.ring[minute_id % self.ring_minutes] = [minute_id, Counter(counts)]
+
+    def snapshot(self) -> dict:
+        """JSON-ready copy of the store (safe to write from another thread)."""
+        return {
+            "folded_minute": self.folded_minute,
+            "folded_hour": self.folded_hour,
+            "last_reported": self.last_reported,
+            "ring": [[m, dict(c)] for m, c in self.ring if m is not None and c],
+            "hourly": {str(h): dict(c) for h, c in sorted(self.hourly.items())},
+            "daily": {d: dict(c) for d, c in sorted(self.daily.items())},
+        }
+
+    def save(self):
+        self._write(self.snapshot())
+        self.dirty = False
+
+    def _write(self, data: dict):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def start(self):
+        """Start the periodic roll + save loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._save_loop(), name="activity-stats-saver")
+
+    async def _save_loop(self):
+        while True:
+            await clock.sleep(self.save_seconds)
+            try:
+                self.roll()
+                if self.dirty:
+                    data = self.snapshot()
+                    self.dirty = False
+                    await asyncio.to_thread(self._write, data)
+            except Exception as e:
+                print(f"[STATS] Save failed: {e}")
+
+
+# Process-wide store; recorders import this directly
+activity = ActivityStats()